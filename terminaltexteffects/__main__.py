@@ -5,50 +5,307 @@ from __future__ import annotations
 import argparse
 import importlib
 import importlib.util
+import json
 import os
-import pkgutil
 import random
 import sys
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, NoReturn
 
-import terminaltexteffects.effects
+from terminaltexteffects.engine.playlist import EffectPlaylist
+from terminaltexteffects.engine.stream import EffectStream
 from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
 from terminaltexteffects.utils.exceptions import UnsupportedAnsiSequenceError
 from terminaltexteffects.utils.shell_completion import SUPPORTED_SHELLS, get_completion_script
 
 if TYPE_CHECKING:
-    from types import ModuleType
+    from collections.abc import Iterable
 
     from terminaltexteffects.engine.base_config import BaseConfig
     from terminaltexteffects.engine.base_effect import BaseEffect
 
 
-def build_parser() -> tuple[argparse.ArgumentParser, dict[str, tuple[type[BaseEffect], type[BaseConfig]]]]:
-    """Build the CLI parser and discover available effects.
+BUILTIN_EFFECT_MODULES: dict[str, str] = {
+    "beams": "terminaltexteffects.effects.effect_beams",
+    "binarypath": "terminaltexteffects.effects.effect_binarypath",
+    "blackhole": "terminaltexteffects.effects.effect_blackhole",
+    "bouncyballs": "terminaltexteffects.effects.effect_bouncyballs",
+    "bubbles": "terminaltexteffects.effects.effect_bubbles",
+    "burn": "terminaltexteffects.effects.effect_burn",
+    "colorshift": "terminaltexteffects.effects.effect_colorshift",
+    "crumble": "terminaltexteffects.effects.effect_crumble",
+    "decrypt": "terminaltexteffects.effects.effect_decrypt",
+    "errorcorrect": "terminaltexteffects.effects.effect_errorcorrect",
+    "expand": "terminaltexteffects.effects.effect_expand",
+    "fireworks": "terminaltexteffects.effects.effect_fireworks",
+    "highlight": "terminaltexteffects.effects.effect_highlight",
+    "laseretch": "terminaltexteffects.effects.effect_laseretch",
+    "matrix": "terminaltexteffects.effects.effect_matrix",
+    "middleout": "terminaltexteffects.effects.effect_middleout",
+    "orbittingvolley": "terminaltexteffects.effects.effect_orbittingvolley",
+    "overflow": "terminaltexteffects.effects.effect_overflow",
+    "pour": "terminaltexteffects.effects.effect_pour",
+    "print": "terminaltexteffects.effects.effect_print",
+    "rain": "terminaltexteffects.effects.effect_rain",
+    "randomsequence": "terminaltexteffects.effects.effect_random_sequence",
+    "rings": "terminaltexteffects.effects.effect_rings",
+    "scattered": "terminaltexteffects.effects.effect_scattered",
+    "slice": "terminaltexteffects.effects.effect_slice",
+    "slide": "terminaltexteffects.effects.effect_slide",
+    "smoke": "terminaltexteffects.effects.effect_smoke",
+    "spotlights": "terminaltexteffects.effects.effect_spotlights",
+    "spray": "terminaltexteffects.effects.effect_spray",
+    "swarm": "terminaltexteffects.effects.effect_swarm",
+    "sweep": "terminaltexteffects.effects.effect_sweep",
+    "synthgrid": "terminaltexteffects.effects.effect_synthgrid",
+    "thunderstorm": "terminaltexteffects.effects.effect_thunderstorm",
+    "unstable": "terminaltexteffects.effects.effect_unstable",
+    "vhstape": "terminaltexteffects.effects.effect_vhstape",
+    "waves": "terminaltexteffects.effects.effect_waves",
+    "wipe": "terminaltexteffects.effects.effect_wipe",
+}
+"""Effect command names mapped to the built-in modules that provide them."""
+
+_PLUGIN_INDEX_VERSION = 1
+
+
+class LazyEffectResourceMap(Mapping):
+    """Mapping of effect command names to their effect and config classes, importing effect modules on first access.
+
+    Built-in effect names are known from `BUILTIN_EFFECT_MODULES` without importing the effect modules. User-provided
+    effect modules in the XDG config effects directory are recorded in a plugin index in the XDG cache directory with
+    their effect command, modification time, and size. A plugin is only executed when its effect is selected, or to
+    discover its effect command when it is new or has changed since it was indexed.
+
+    Args:
+        plugins_dir (Path | None, optional): Directory to load user-provided effect modules from. Defaults to the
+            XDG config effects directory.
+        index_path (Path | None, optional): Plugin index file. Defaults to `plugin_index.json` in the XDG cache
+            directory.
+
+    Raises:
+        ValueError: If two effect modules register the same effect command.
+
+    """
+
+    def __init__(self, plugins_dir: Path | None = None, index_path: Path | None = None) -> None:
+        """Initialize the map and discover user-provided effect modules.
+
+        Args:
+            plugins_dir (Path | None, optional): Directory to load user-provided effect modules from. Defaults to the
+                XDG config effects directory.
+            index_path (Path | None, optional): Plugin index file. Defaults to `plugin_index.json` in the XDG cache
+                directory.
+
+        Raises:
+            ValueError: If two effect modules register the same effect command.
+
+        """
+        self._modules: dict[str, str] = dict(BUILTIN_EFFECT_MODULES)
+        self._plugin_files: dict[str, Path] = {}
+        self._resources: dict[str, tuple[type[BaseEffect], type[BaseConfig]]] = {}
+        index_path = index_path or _get_plugin_index_path()
+        plugin_index = _read_plugin_index(index_path)
+        updated_plugin_index: dict[str, dict[str, Any]] = {}
+        for plugin_file in _iter_plugin_files(plugins_dir or _get_plugins_dir()):
+            stat_result = plugin_file.stat()
+            entry = plugin_index.get(str(plugin_file))
+            if (
+                isinstance(entry, dict)
+                and "effect" in entry
+                and entry.get("mtime_ns") == stat_result.st_mtime_ns
+                and entry.get("size") == stat_result.st_size
+            ):
+                effect_cmd = entry["effect"]
+            else:
+                effect_resources = _exec_plugin_file(plugin_file)
+                effect_cmd = None
+                if effect_resources is not None:
+                    effect_cmd, effect_class, config_class = effect_resources
+                    self._resources[effect_cmd] = (effect_class, config_class)
+                entry = {"effect": effect_cmd, "mtime_ns": stat_result.st_mtime_ns, "size": stat_result.st_size}
+            updated_plugin_index[str(plugin_file)] = entry
+            if effect_cmd is None:
+                continue
+            if effect_cmd in self._modules or effect_cmd in self._plugin_files:
+                msg = f"Duplicate effect command detected: {effect_cmd}"
+                raise ValueError(msg)
+            self._plugin_files[effect_cmd] = plugin_file
+        if updated_plugin_index != plugin_index:
+            _write_plugin_index(index_path, updated_plugin_index)
+
+    def __getitem__(self, effect_cmd: str) -> tuple[type[BaseEffect], type[BaseConfig]]:
+        """Return the effect and config classes for an effect command, importing its module if needed.
+
+        Args:
+            effect_cmd (str): The effect command name.
+
+        Returns:
+            tuple[type[BaseEffect], type[BaseConfig]]: The effect class and config class.
+
+        Raises:
+            KeyError: If no effect module provides the effect command.
+            ValueError: If the effect module registers a different effect command.
+
+        """
+        if effect_cmd not in self._resources:
+            if effect_cmd in self._plugin_files:
+                module_name = str(self._plugin_files[effect_cmd])
+                effect_resources = _exec_plugin_file(self._plugin_files[effect_cmd])
+            else:
+                module_name = self._modules[effect_cmd]
+                effect_resources = importlib.import_module(module_name).get_effect_resources()
+            registered_cmd = effect_resources[0] if effect_resources else None
+            if effect_resources is None or registered_cmd != effect_cmd:
+                msg = f"Effect module {module_name} registers {registered_cmd}, expected {effect_cmd}"
+                raise ValueError(msg)
+            _, effect_class, config_class = effect_resources
+            self._resources[effect_cmd] = (effect_class, config_class)
+        return self._resources[effect_cmd]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the effect command names without importing the effect modules."""
+        yield from self._modules
+        yield from self._plugin_files
 
-    This includes registering built-in effect modules and user-provided effect
-    modules from the XDG config effects directory, then returning the parsed CLI
-    parser together with a mapping of effect command names to their effect and
-    config classes.
+    def __len__(self) -> int:
+        """Return the number of effect commands."""
+        return len(self._modules) + len(self._plugin_files)
+
+    def __contains__(self, effect_cmd: object) -> bool:
+        """Return whether an effect command is available without importing its module."""
+        return effect_cmd in self._modules or effect_cmd in self._plugin_files
+
+
+class _EffectSelectionError(Exception):
+    """Raised by `_EffectSelectionParser` instead of printing an error and exiting."""
+
+
+class _EffectSelectionParser(argparse.ArgumentParser):
+    """Argument parser used to find the effect command before the effect subparsers are populated."""
+
+    def error(self, message: str) -> NoReturn:
+        """Raise `_EffectSelectionError` so the full parser can report the error."""
+        raise _EffectSelectionError(message)
+
+
+def _get_plugins_dir() -> Path:
+    """Return the XDG config directory searched for user-provided effect modules."""
+    return Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "terminaltexteffects" / "effects"
+
+
+def _iter_plugin_files(plugins_dir: Path) -> Iterator[Path]:
+    """Yield the user-provided effect module files in `plugins_dir`."""
+    if plugins_dir.exists():
+        for plugin_file in plugins_dir.glob("*.py"):
+            if plugin_file.name != "__init__.py":
+                yield plugin_file
+
+
+def _exec_plugin_file(plugin_file: Path) -> tuple[str, type[BaseEffect], type[BaseConfig]] | None:
+    """Execute a user-provided effect module and return its effect resources.
+
+    Args:
+        plugin_file (Path): The effect module file.
 
     Returns:
-        tuple[argparse.ArgumentParser, dict[str, tuple[type[BaseEffect], type[BaseConfig]]]]: The CLI parser and a
-            mapping of effect names to their classes and configurations.
+        tuple[str, type[BaseEffect], type[BaseConfig]] | None: The effect command name, effect class, and config
+            class, or None if the module does not define `get_effect_resources()`.
 
-    Raises:
-        ValueError: If two discovered effect modules register the same effect command.
+    """
+    module_name = plugin_file.stem
+    spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+    if not spec or not spec.loader:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    if not hasattr(module, "get_effect_resources"):
+        return None
+    return module.get_effect_resources()
+
+
+def _get_plugin_index_path() -> Path:
+    """Return the XDG cache file recording the effect commands of user-provided effect modules."""
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_dir / "terminaltexteffects" / "plugin_index.json"
+
+
+def _read_plugin_index(index_path: Path) -> dict[str, dict[str, Any]]:
+    """Read the plugin index, keyed by plugin file path.
+
+    Args:
+        index_path (Path): The plugin index file.
+
+    Returns:
+        dict[str, dict[str, Any]]: Index entries with the `effect` command, `mtime_ns`, and `size` of each plugin
+            file. Empty if the index is missing, unreadable, or from a different index version.
+
+    """
+    try:
+        plugin_index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(plugin_index, dict) or plugin_index.get("version") != _PLUGIN_INDEX_VERSION:
+        return {}
+    plugins = plugin_index.get("plugins")
+    return plugins if isinstance(plugins, dict) else {}
+
+
+def _write_plugin_index(index_path: Path, plugins: dict[str, dict[str, Any]]) -> None:
+    """Write the plugin index. Failures are ignored and the plugins are rediscovered on the next run.
+
+    Args:
+        index_path (Path): The plugin index file.
+        plugins (dict[str, dict[str, Any]]): Index entries keyed by plugin file path.
 
     """
-    parser = argparse.ArgumentParser(
+    temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps({"version": _PLUGIN_INDEX_VERSION, "plugins": plugins}), encoding="utf-8")
+        temp_path.replace(index_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+
+
+def _build_base_parser(
+    parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser,
+    *,
+    add_help: bool = True,
+) -> tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
+    """Build the CLI parser with the global options and an empty effect subparser collection.
+
+    Args:
+        parser_class (type[argparse.ArgumentParser], optional): Parser class to build. Defaults to
+            argparse.ArgumentParser.
+        add_help (bool, optional): Whether to add the -h/--help option. Defaults to True.
+
+    Returns:
+        tuple[argparse.ArgumentParser, argparse._SubParsersAction]: The CLI parser and its effect subparser
+            collection.
+
+    """
+    parser = parser_class(
         prog="tte",
+        add_help=add_help,
         description="A terminal visual effects engine, application, and library",
         epilog="Ex: ls -a | tte decrypt --typing-speed 2 --ciphertext-colors 008000 00cb00 00ff00 "
         "--final-gradient-stops eda000 --final-gradient-steps 12 --final-gradient-direction vertical",
     )
 
-    parser.add_argument("--input-file", "-i", type=str, help="File to read input from")
+    input_group = parser.add_mutually_exclusive_group()
+    input_group.add_argument("--input-file", "-i", type=str, help="File to read input from")
+    input_group.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Read piped input incrementally and animate each line as it arrives on a canvas that scrolls like a log, "
+            "instead of waiting for the input to close. The canvas fills the terminal height unless --canvas-height "
+            "is set."
+        ),
+    )
     parser.add_argument(
         "--version",
         "-v",
@@ -60,7 +317,23 @@ def build_parser() -> tuple[argparse.ArgumentParser, dict[str, tuple[type[BaseEf
         choices=SUPPORTED_SHELLS,
         help="Print a shell completion script for the requested shell and exit.",
     )
-    parser.add_argument("--random-effect", "-R", action="store_true", help="Randomly select an effect to apply")
+    effect_selection_group = parser.add_mutually_exclusive_group()
+    effect_selection_group.add_argument(
+        "--random-effect",
+        "-R",
+        action="store_true",
+        help="Randomly select an effect to apply",
+    )
+    effect_selection_group.add_argument(
+        "--playlist",
+        type=str,
+        nargs="+",
+        metavar="EFFECT",
+        help=(
+            "Space-separated list of Effects to play back to back on the same canvas. Effects use their default "
+            "options, except an effect also given as the effect command, which uses the options given with it."
+        ),
+    )
     parser.add_argument(
         "--seed",
         type=int,
@@ -92,61 +365,78 @@ def build_parser() -> tuple[argparse.ArgumentParser, dict[str, tuple[type[BaseEf
         required=False,
         dest="effect",
     )
+    return parser, subparsers
 
-    effect_resource_map: dict[str, tuple[type[BaseEffect], type[BaseConfig]]] = {}
 
-    def _register_effect_from_module(module: ModuleType) -> None:
-        """Register an effect module's resources and populate its CLI options.
+def build_parser(
+    effect_names: Iterable[str] | None = None,
+    *,
+    effect_resource_map: LazyEffectResourceMap | None = None,
+) -> tuple[argparse.ArgumentParser, LazyEffectResourceMap]:
+    """Build the CLI parser and discover available effects.
 
-        If the module defines `get_effect_resources()`, that callable is expected to
-        return the effect command name, effect class, and config class. The config class
-        is then used to populate the subparser for that effect command.
+    Built-in effect names are known without importing their modules. The names of user-provided effect modules from the
+    XDG config effects directory are read from the plugin index in the XDG cache directory, and a module is only
+    imported to discover its name when it is new or its modification time or size differs from its index entry. Only
+    the effects in `effect_names` are imported and have their subparsers populated.
 
-        Args:
-            module: The module to inspect for effect resources.
+    Args:
+        effect_names (Iterable[str] | None, optional): Effect commands to populate subparsers for. If not provided,
+            subparsers are populated for every available effect. Defaults to None.
+        effect_resource_map (LazyEffectResourceMap | None, optional): Previously discovered effects. If not
+            provided, the available effects are discovered. Defaults to None.
 
-        Raises:
-            ValueError: If the module registers an effect command that has already been
-                registered.
+    Returns:
+        tuple[argparse.ArgumentParser, LazyEffectResourceMap]: The CLI parser and a mapping of effect names to their
+            classes and configurations.
 
-        """
-        if hasattr(module, "get_effect_resources"):
-            effect_cmd: str
-            effect_class: type[BaseEffect]
-            config_class: type[BaseConfig]
-            effect_cmd, effect_class, config_class = module.get_effect_resources()
-            if effect_cmd in effect_resource_map:
-                msg = f"Duplicate effect command detected: {effect_cmd}"
-                raise ValueError(msg)
-            effect_resource_map[effect_cmd] = (effect_class, config_class)
-            config_class._populate_parser(subparsers)
+    Raises:
+        ValueError: If two discovered effect modules register the same effect command.
+
+    """
+    parser, subparsers = _build_base_parser()
+    if effect_resource_map is None:
+        effect_resource_map = LazyEffectResourceMap()
+    for effect_cmd in effect_resource_map if effect_names is None else effect_names:
+        _, config_class = effect_resource_map[effect_cmd]
+        config_class._populate_parser(subparsers)
+    return parser, effect_resource_map
 
-    for module_info in pkgutil.iter_modules(
-        terminaltexteffects.effects.__path__,
-        terminaltexteffects.effects.__name__ + ".",
-    ):
-        module = importlib.import_module(module_info.name)
-        _register_effect_from_module(module)
 
-    plugins_dir = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "terminaltexteffects" / "effects"
-    if plugins_dir.exists():
-        for plugin_file in plugins_dir.glob("*.py"):
-            if plugin_file.name == "__init__.py":
-                continue
-            module_name = plugin_file.stem
-            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-                _register_effect_from_module(module)
+def _select_effect_names(argv: list[str], effect_names: Iterable[str]) -> list[str] | None:
+    """Find the effect command in the arguments without populating the effect subparsers.
+
+    Args:
+        argv (list[str]): Command line arguments, excluding the program name.
+        effect_names (Iterable[str]): Available effect commands.
+
+    Returns:
+        list[str] | None: The effect command to populate a subparser for, an empty list if no effect command was
+            given, or None if every effect is needed for help, shell completion, or an error message.
+
+    """
+    parser, subparsers = _build_base_parser(_EffectSelectionParser, add_help=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    for effect_cmd in effect_names:
+        subparsers.add_parser(effect_cmd, add_help=False)
+    try:
+        args, _ = parser.parse_known_args(argv)
+    except _EffectSelectionError:
+        return None
+    if args.help or args.print_completion:
+        return None
+    return [args.effect] if args.effect else []
 
-    return parser, effect_resource_map
 
+def build_parsers_and_parse_args() -> tuple[argparse.Namespace, LazyEffectResourceMap]:
+    """Build the CLI parser, discover available effects, and parse arguments.
 
-def build_parsers_and_parse_args() -> tuple[argparse.Namespace, dict[str, tuple[type[BaseEffect], type[BaseConfig]]]]:
-    """Build the CLI parser, discover available effects, and parse arguments."""
-    parser, effect_resource_map = build_parser()
+    Only the selected effect's module is imported and its subparser populated, unless every effect is needed for
+    help, shell completion, or an error message.
+    """
+    effect_resource_map = LazyEffectResourceMap()
+    effect_names = _select_effect_names(sys.argv[1:], effect_resource_map)
+    parser, effect_resource_map = build_parser(effect_names, effect_resource_map=effect_resource_map)
     return parser.parse_args(), effect_resource_map
 
 
@@ -166,8 +456,10 @@ def main() -> None:
     """Run the terminaltexteffects command line interface.
 
     Parse CLI arguments, load input text, choose and configure the requested effect,
-    and stream rendered frames to the terminal. The process exits with status `1`
-    for missing input, invalid effect selection, input file read failures, or
+    and stream rendered frames to the terminal. With `--playlist`, the listed effects
+    are played back to back on the same canvas. With `--stream`, piped input lines are
+    animated on a scrolling canvas as they arrive. The process exits with status
+    `1` for missing input, invalid effect selection, input file read failures, or
     keyboard interruption.
     """
     args, effect_resource_map = build_parsers_and_parse_args()
@@ -177,18 +469,19 @@ def main() -> None:
         return
     if args.seed is not None:
         random.seed(args.seed)
+    terminal_config = TerminalConfig._build_config(args)
     if args.input_file:
         try:
-            input_data = Path(args.input_file).read_text(encoding="UTF-8")
+            input_data = Terminal.read_input_file(args.input_file, terminal_config)
         except FileNotFoundError:
             print(f"File not found: {args.input_file}")
             sys.exit(1)
         except Exception as e:  # noqa: BLE001
             print(f"Error reading file: {args.input_file} - {e}")
             sys.exit(1)
-    else:
+    elif not args.stream:
         input_data = Terminal.get_piped_input()
-    if not input_data.strip():
+    if not args.stream and not input_data.strip():
         print("NO INPUT.")
         sys.exit(1)
 
@@ -204,17 +497,35 @@ def main() -> None:
             sys.exit(1)
 
         args.effect = random.choice(available_effects)
+    elif args.playlist:
+        unknown_effects = [effect for effect in args.playlist if effect not in effect_resource_map]
+        if unknown_effects:
+            print(f"Error: Unknown effects in playlist: {' '.join(unknown_effects)}\n")
+            sys.exit(1)
     elif not args.effect:
-        print("Error: No effect specified. Must specify an effect or use --random-effect.\n")
+        print("Error: No effect specified. Must specify an effect, --random-effect, or --playlist.\n")
         sys.exit(1)
 
-    effect_class, effect_config_class = effect_resource_map[args.effect]
-    terminal_config = TerminalConfig._build_config(args)
-    effect_config = effect_config_class._build_config(None if args.random_effect else args)
-    effect = effect_class(input_data, effect_config, terminal_config)
+    effects: list[tuple[type[BaseEffect], BaseConfig]] = []
+    for effect_name in args.playlist or [args.effect]:
+        effect_class, effect_config_class = effect_resource_map[effect_name]
+        effect_config = effect_config_class._build_config(
+            args if effect_name == args.effect and not args.random_effect else None,
+        )
+        effects.append((effect_class, effect_config))
+    effect_output: EffectPlaylist | EffectStream
+    if args.stream:
+        effect_output = EffectStream(sys.stdin, terminal_config)
+    else:
+        effect_output = EffectPlaylist(input_data, terminal_config)
+    for effect_class, effect_config in effects:
+        effect_output.add_effect(effect_class, effect_config)
     try:
-        with effect.terminal_output() as terminal:
-            for frame in effect:
+        if isinstance(effect_output, EffectStream) and not effect_output.wait_for_input():
+            print("NO INPUT.")
+            sys.exit(1)
+        with effect_output.terminal_output() as terminal:
+            for frame in effect_output:
                 terminal.print(frame)
     except UnsupportedAnsiSequenceError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1,39 +1,118 @@
-"""TerminalTextEffects effects module."""
-
-from terminaltexteffects.effects.effect_beams import Beams
-from terminaltexteffects.effects.effect_binarypath import BinaryPath
-from terminaltexteffects.effects.effect_blackhole import Blackhole
-from terminaltexteffects.effects.effect_bouncyballs import BouncyBalls
-from terminaltexteffects.effects.effect_bubbles import Bubbles
-from terminaltexteffects.effects.effect_burn import Burn
-from terminaltexteffects.effects.effect_colorshift import ColorShift
-from terminaltexteffects.effects.effect_crumble import Crumble
-from terminaltexteffects.effects.effect_decrypt import Decrypt
-from terminaltexteffects.effects.effect_errorcorrect import ErrorCorrect
-from terminaltexteffects.effects.effect_expand import Expand
-from terminaltexteffects.effects.effect_fireworks import Fireworks
-from terminaltexteffects.effects.effect_highlight import Highlight
-from terminaltexteffects.effects.effect_laseretch import LaserEtch
-from terminaltexteffects.effects.effect_matrix import Matrix
-from terminaltexteffects.effects.effect_middleout import MiddleOut
-from terminaltexteffects.effects.effect_orbittingvolley import OrbittingVolley
-from terminaltexteffects.effects.effect_overflow import Overflow
-from terminaltexteffects.effects.effect_pour import Pour
-from terminaltexteffects.effects.effect_print import Print
-from terminaltexteffects.effects.effect_rain import Rain
-from terminaltexteffects.effects.effect_random_sequence import RandomSequence
-from terminaltexteffects.effects.effect_rings import Rings
-from terminaltexteffects.effects.effect_scattered import Scattered
-from terminaltexteffects.effects.effect_slice import Slice
-from terminaltexteffects.effects.effect_slide import Slide
-from terminaltexteffects.effects.effect_smoke import Smoke
-from terminaltexteffects.effects.effect_spotlights import Spotlights
-from terminaltexteffects.effects.effect_spray import Spray
-from terminaltexteffects.effects.effect_swarm import Swarm
-from terminaltexteffects.effects.effect_sweep import Sweep
-from terminaltexteffects.effects.effect_synthgrid import SynthGrid
-from terminaltexteffects.effects.effect_thunderstorm import Thunderstorm
-from terminaltexteffects.effects.effect_unstable import Unstable
-from terminaltexteffects.effects.effect_vhstape import VHSTape
-from terminaltexteffects.effects.effect_waves import Waves
-from terminaltexteffects.effects.effect_wipe import Wipe
+"""TerminalTextEffects effects module.
+
+Effect classes are imported from their modules on first access, so importing a single effect module does not import
+every effect.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from terminaltexteffects.effects.effect_beams import Beams
+    from terminaltexteffects.effects.effect_binarypath import BinaryPath
+    from terminaltexteffects.effects.effect_blackhole import Blackhole
+    from terminaltexteffects.effects.effect_bouncyballs import BouncyBalls
+    from terminaltexteffects.effects.effect_bubbles import Bubbles
+    from terminaltexteffects.effects.effect_burn import Burn
+    from terminaltexteffects.effects.effect_colorshift import ColorShift
+    from terminaltexteffects.effects.effect_crumble import Crumble
+    from terminaltexteffects.effects.effect_decrypt import Decrypt
+    from terminaltexteffects.effects.effect_errorcorrect import ErrorCorrect
+    from terminaltexteffects.effects.effect_expand import Expand
+    from terminaltexteffects.effects.effect_fireworks import Fireworks
+    from terminaltexteffects.effects.effect_highlight import Highlight
+    from terminaltexteffects.effects.effect_laseretch import LaserEtch
+    from terminaltexteffects.effects.effect_matrix import Matrix
+    from terminaltexteffects.effects.effect_middleout import MiddleOut
+    from terminaltexteffects.effects.effect_orbittingvolley import OrbittingVolley
+    from terminaltexteffects.effects.effect_overflow import Overflow
+    from terminaltexteffects.effects.effect_pour import Pour
+    from terminaltexteffects.effects.effect_print import Print
+    from terminaltexteffects.effects.effect_rain import Rain
+    from terminaltexteffects.effects.effect_random_sequence import RandomSequence
+    from terminaltexteffects.effects.effect_rings import Rings
+    from terminaltexteffects.effects.effect_scattered import Scattered
+    from terminaltexteffects.effects.effect_slice import Slice
+    from terminaltexteffects.effects.effect_slide import Slide
+    from terminaltexteffects.effects.effect_smoke import Smoke
+    from terminaltexteffects.effects.effect_spotlights import Spotlights
+    from terminaltexteffects.effects.effect_spray import Spray
+    from terminaltexteffects.effects.effect_swarm import Swarm
+    from terminaltexteffects.effects.effect_sweep import Sweep
+    from terminaltexteffects.effects.effect_synthgrid import SynthGrid
+    from terminaltexteffects.effects.effect_thunderstorm import Thunderstorm
+    from terminaltexteffects.effects.effect_unstable import Unstable
+    from terminaltexteffects.effects.effect_vhstape import VHSTape
+    from terminaltexteffects.effects.effect_waves import Waves
+    from terminaltexteffects.effects.effect_wipe import Wipe
+
+_EFFECT_CLASS_MODULES: dict[str, str] = {
+    "Beams": "effect_beams",
+    "BinaryPath": "effect_binarypath",
+    "Blackhole": "effect_blackhole",
+    "BouncyBalls": "effect_bouncyballs",
+    "Bubbles": "effect_bubbles",
+    "Burn": "effect_burn",
+    "ColorShift": "effect_colorshift",
+    "Crumble": "effect_crumble",
+    "Decrypt": "effect_decrypt",
+    "ErrorCorrect": "effect_errorcorrect",
+    "Expand": "effect_expand",
+    "Fireworks": "effect_fireworks",
+    "Highlight": "effect_highlight",
+    "LaserEtch": "effect_laseretch",
+    "Matrix": "effect_matrix",
+    "MiddleOut": "effect_middleout",
+    "OrbittingVolley": "effect_orbittingvolley",
+    "Overflow": "effect_overflow",
+    "Pour": "effect_pour",
+    "Print": "effect_print",
+    "Rain": "effect_rain",
+    "RandomSequence": "effect_random_sequence",
+    "Rings": "effect_rings",
+    "Scattered": "effect_scattered",
+    "Slice": "effect_slice",
+    "Slide": "effect_slide",
+    "Smoke": "effect_smoke",
+    "Spotlights": "effect_spotlights",
+    "Spray": "effect_spray",
+    "Swarm": "effect_swarm",
+    "Sweep": "effect_sweep",
+    "SynthGrid": "effect_synthgrid",
+    "Thunderstorm": "effect_thunderstorm",
+    "Unstable": "effect_unstable",
+    "VHSTape": "effect_vhstape",
+    "Waves": "effect_waves",
+    "Wipe": "effect_wipe",
+}
+
+__all__ = list(_EFFECT_CLASS_MODULES)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import an effect class from its module on first access.
+
+    Args:
+        name (str): Name of the attribute being accessed.
+
+    Returns:
+        Any: The effect class.
+
+    Raises:
+        AttributeError: If `name` is not an effect class provided by this package.
+
+    """
+    if name not in _EFFECT_CLASS_MODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(f"{__name__}.{_EFFECT_CLASS_MODULES[name]}")
+    effect_class = getattr(module, name)
+    globals()[name] = effect_class
+    return effect_class
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including effect classes that have not been imported yet."""
+    return sorted({*globals(), *__all__})
@@ -274,8 +274,10 @@ class BlackholeIterator(BaseEffectIterator[BlackholeConfig]):
             Color("#702a8c"),
             Color("#049dbf"),
         ]
-        for character in self.terminal.get_characters():
-            nearby_coord = geometry.find_coords_on_circle(character.input_coord, 3, 5)[random.randrange(0, 5)]
+        characters = self.terminal.get_characters()
+        nearby_circles = geometry.find_coords_on_circles([(character.input_coord, 3) for character in characters], 5)
+        for character, nearby_coords in zip(characters, nearby_circles):
+            nearby_coord = nearby_coords[random.randrange(0, 5)]
             nearby_path = character.motion.new_path(speed=random.randint(3, 4) / 10, ease=easing.out_expo)
             nearby_path.new_waypoint(nearby_coord)
             input_path = character.motion.new_path(speed=random.randint(4, 6) / 100, ease=easing.in_cubic)
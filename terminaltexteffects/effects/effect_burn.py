@@ -13,7 +13,7 @@ import random
 from collections import deque
 from dataclasses import dataclass
 
-from terminaltexteffects import Color, EffectCharacter, EventHandler, Gradient
+from terminaltexteffects import Color, EffectCharacter, EventHandler, Gradient, Scene
 from terminaltexteffects.engine.base_config import (
     BaseConfig,
     FinalGradientDirectionArg,
@@ -224,14 +224,19 @@ class BurnIterator(BaseEffectIterator[BurnConfig]):
         while not self.algo.complete:
             self.algo.step()
 
+        burn_template = Scene(
+            "burn",
+            no_color=self.terminal.config.no_color,
+            use_xterm_colors=self.terminal.config.xterm_colors,
+        )
+        burn_template.apply_gradient_to_symbols(burn_char_order, 4, fg_gradient=fire_gradient)
         for char in self.terminal.get_characters():
             self.terminal.set_character_visibility(char, is_visible=True)
             char.animation.set_appearance(
                 char.input_symbol,
                 colors=ColorPair(fg=self.config.starting_color),
             )
-            burn_scn = char.animation.new_scene(scene_id="burn")
-            burn_scn.apply_gradient_to_symbols(burn_char_order, 4, fg_gradient=fire_gradient)
+            burn_scn = char.animation.new_scene_from_template(burn_template)
             final_color_scn = char.animation.new_scene()
             if self.terminal.config.existing_color_handling == "dynamic":
                 fg_gradient = (
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from terminaltexteffects import Color, EffectCharacter, EventHandler, Gradient, geometry
+from terminaltexteffects import Color, EffectCharacter, EventHandler, Gradient, Scene, geometry
 from terminaltexteffects.engine.base_config import (
     BaseConfig,
     FinalGradientDirectionArg,
@@ -237,12 +237,26 @@ class ColorShiftIterator(BaseEffectIterator[ColorShiftConfig]):
         for character in self.terminal.get_characters():
             self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
         gradient = Gradient(*self.config.gradient_stops, steps=self.config.gradient_steps, loop=not self.config.no_loop)
+        # every character plays the same gradient frames for its symbol, starting from a different color
+        gradient_templates: dict[str, Scene] = {}
         for character in self.terminal.get_characters():
             self.terminal.set_character_visibility(character, is_visible=True)
-            gradient_scn = character.animation.new_scene(scene_id="gradient")
-            if self.config.no_travel:
-                colors = gradient.spectrum
-            else:
+            gradient_template = gradient_templates.get(character.input_symbol)
+            if gradient_template is None:
+                gradient_template = Scene(
+                    "gradient",
+                    no_color=self.terminal.config.no_color,
+                    use_xterm_colors=self.terminal.config.xterm_colors,
+                )
+                for color in gradient.spectrum:
+                    gradient_template.add_frame(
+                        character.input_symbol,
+                        self.config.gradient_frames,
+                        colors=ColorPair(fg=color),
+                    )
+                gradient_templates[character.input_symbol] = gradient_template
+            shift_distance = 0
+            if not self.config.no_travel:
                 if self.config.travel_direction == Gradient.Direction.HORIZONTAL:
                     direction_index = character.input_coord.column / self.terminal.canvas.right
                 elif self.config.travel_direction == Gradient.Direction.VERTICAL:
@@ -262,13 +276,11 @@ class ColorShiftIterator(BaseEffectIterator[ColorShiftConfig]):
                 shift_distance = int(len(gradient.spectrum) * direction_index)
                 if self.config.reverse_travel_direction:
                     shift_distance = shift_distance * -1
-                colors = gradient.spectrum[shift_distance:] + gradient.spectrum[:shift_distance]
-            for color in colors:
-                gradient_scn.add_frame(
-                    character.input_symbol,
-                    self.config.gradient_frames,
-                    colors=ColorPair(fg=color),
-                )
+            gradient_scn = character.animation.new_scene_from_template(
+                gradient_template,
+                phase_offset=shift_distance,
+            )
+            colors = gradient.spectrum[shift_distance:] + gradient.spectrum[:shift_distance]
             final_color_scn = character.animation.new_scene(scene_id="final_gradient")
             if self.terminal.config.existing_color_handling == "dynamic":
                 fg_gradient = (
@@ -283,7 +283,7 @@ class MatrixIterator(BaseEffectIterator[MatrixConfig]):
             for character in self.characters:
                 self.terminal.set_character_visibility(character, is_visible=False)
                 self.pending_characters.append(character)
-                character.motion.current_coord = character.input_coord
+                character.motion.set_coordinate(character.input_coord)
             self.visible_characters: list[EffectCharacter] = []
             if self.phase == "fill":
                 self.base_rain_fall_delay = random.randint(
@@ -317,9 +317,8 @@ class MatrixIterator(BaseEffectIterator[MatrixConfig]):
             """Drop the rain column."""
             out_of_canvas = []
             for character in self.visible_characters:
-                character.motion.current_coord = Coord(
-                    character.motion.current_coord.column,
-                    character.motion.current_coord.row - 1,
+                character.motion.set_coordinate(
+                    Coord(character.motion.current_coord.column, character.motion.current_coord.row - 1),
                 )
                 if character.motion.current_coord.row < self.terminal.canvas.bottom:
                     self.terminal.set_character_visibility(character, is_visible=False)
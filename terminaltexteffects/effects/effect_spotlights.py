@@ -261,14 +261,11 @@ class SpotlightsIterator(BaseEffectIterator[SpotlightsConfig]):
             range_ (int): The range of the spotlights.
 
         """
-        coords_in_range: list[Coord] = []
-        for spotlight in self.spotlights:
-            coords_in_range.extend(geometry.find_coords_in_circle(spotlight.motion.current_coord, range_))
         chars_in_range: set[EffectCharacter] = set()
-        for coord in coords_in_range:
-            character = self.terminal.get_character_by_input_coord(coord)
-            if character and self._is_spotlightable(character):
-                chars_in_range.add(character)
+        for spotlight in self.spotlights:
+            for character in self.terminal.get_characters_in_circle(spotlight.motion.current_coord, range_):
+                if self._is_spotlightable(character):
+                    chars_in_range.add(character)
         chars_no_longer_in_range = self.illuminated_chars - chars_in_range
         for character in chars_no_longer_in_range:
             expand_override = self._get_expand_color_override(character)
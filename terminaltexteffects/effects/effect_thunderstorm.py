@@ -429,7 +429,7 @@ class ThunderstormIterator(BaseEffectIterator[ThunderstormConfig]):
             self.build_strike_characters(20)
         strike_char = self.available_strike_chars.pop()
         strike_char.animation.scenes.clear()
-        strike_char.event_handler.registered_events.clear()
+        strike_char.event_handler.clear_events()
         return strike_char
 
     def get_next_spark_char(self) -> tte.EffectCharacter:
@@ -445,7 +445,7 @@ class ThunderstormIterator(BaseEffectIterator[ThunderstormConfig]):
             self.build_spark_characters(20)
         spark_char = self.available_sparks.pop()
         spark_char.motion.paths.clear()
-        spark_char.event_handler.registered_events.clear()
+        spark_char.event_handler.clear_events()
         return spark_char
 
     def setup_sparks_for_impact(self) -> None:
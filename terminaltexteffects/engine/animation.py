@@ -11,10 +11,11 @@ Classes:
 from __future__ import annotations
 
 import typing
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum, auto
 
-from terminaltexteffects.utils import ansitools, colorterm, easing, graphics, hexterm
+from terminaltexteffects.utils import ansitools, caches, colorterm, easing, graphics, hexterm
 from terminaltexteffects.utils.exceptions import (
     ActivateEmptySceneError,
     AnimationSceneError,
@@ -26,10 +27,14 @@ if typing.TYPE_CHECKING:
     from terminaltexteffects.engine import base_character  # pragma: no cover
 
 
-@dataclass
+@dataclass(frozen=True)
 class CharacterVisual:
     """A class for storing symbol, color, and terminal graphical modes for the character.
 
+    CharacterVisuals are immutable. Visuals created by `Scene.add_frame` and `Animation.set_appearance`
+    are interned, so characters and frames with the same symbol, modes, and colors share a single
+    instance and its `formatted_symbol` is only computed once.
+
     Args:
         symbol (str): The unformatted symbol.
         bold (bool): Bold mode.
@@ -69,41 +74,224 @@ class CharacterVisual:
 
     def __post_init__(self) -> None:
         """Create the formatted symbol by applying ANSI sequences for any active modes and color."""
-        self.formatted_symbol = self.format_symbol()
+        object.__setattr__(self, "formatted_symbol", self.format_symbol())
 
     def format_symbol(self) -> str:
         """Format the symbol for printing by applying ANSI sequences for supported active modes and color.
 
         The `dim` attribute is stored on the visual but is not currently emitted as an ANSI sequence.
         """
-        formatting_string = ""
-        if self.bold:
-            formatting_string += ansitools.apply_bold()
-        # Future: review the dim ANSI sequence and decide whether CharacterVisual should emit it.
-        if self.italic:
-            formatting_string += ansitools.apply_italic()
-        if self.underline:
-            formatting_string += ansitools.apply_underline()
-        if self.blink:
-            formatting_string += ansitools.apply_blink()
-        if self.reverse:
-            formatting_string += ansitools.apply_reverse()
-        if self.hidden:
-            formatting_string += ansitools.apply_hidden()
-        if self.strike:
-            formatting_string += ansitools.apply_strikethrough()
-        if self._fg_color_code is not None:
-            formatting_string += colorterm.fg(self._fg_color_code)
-        if self._bg_color_code is not None:
-            formatting_string += colorterm.bg(self._bg_color_code)
-
+        modes = (self.bold, self.dim, self.italic, self.underline, self.blink, self.reverse, self.hidden, self.strike)
+        formatting_string = _get_format_prefix(modes, self._fg_color_code, self._bg_color_code)
         return f"{formatting_string}{self.symbol}{ansitools.reset_all() if formatting_string else ''}"
 
 
-@dataclass
+def _get_format_prefix(
+    modes: tuple[bool, bool, bool, bool, bool, bool, bool, bool],
+    fg_color_code: str | int | None,
+    bg_color_code: str | int | None,
+) -> str:
+    """Return the ANSI sequences that are applied before a symbol with the given modes and colors.
+
+    Visuals with different symbols often share modes and colors, so the combined sequence is cached.
+
+    Args:
+        modes (tuple[bool, ...]): The bold, dim, italic, underline, blink, reverse, hidden, and strike modes.
+        fg_color_code (str | int | None): The foreground color code.
+        bg_color_code (str | int | None): The background color code.
+
+    Returns:
+        str: The ANSI sequences for the modes and colors, or an empty string if there are none.
+
+    """
+    bold, _, italic, underline, blink, reverse, hidden, strike = modes
+    formatting_string = ""
+    if bold:
+        formatting_string += ansitools.apply_bold()
+    # Future: review the dim ANSI sequence and decide whether CharacterVisual should emit it.
+    if italic:
+        formatting_string += ansitools.apply_italic()
+    if underline:
+        formatting_string += ansitools.apply_underline()
+    if blink:
+        formatting_string += ansitools.apply_blink()
+    if reverse:
+        formatting_string += ansitools.apply_reverse()
+    if hidden:
+        formatting_string += ansitools.apply_hidden()
+    if strike:
+        formatting_string += ansitools.apply_strikethrough()
+    if fg_color_code is not None:
+        formatting_string += colorterm.fg(fg_color_code)
+    if bg_color_code is not None:
+        formatting_string += colorterm.bg(bg_color_code)
+    return formatting_string
+
+
+_get_format_prefix = caches.register(_get_format_prefix, maxsize=4096)
+
+
+def _get_character_visual(
+    symbol: str,
+    modes: tuple[bool, bool, bool, bool, bool, bool, bool, bool],
+    colors: tuple[graphics.Color | None, graphics.Color | None] | None,
+    fg_color_code: str | int | None,
+    bg_color_code: str | int | None,
+) -> CharacterVisual:
+    """Return the interned CharacterVisual for the given symbol, modes, and colors.
+
+    Args:
+        symbol (str): The unformatted symbol.
+        modes (tuple[bool, ...]): The bold, dim, italic, underline, blink, reverse, hidden, and strike modes.
+        colors (tuple[graphics.Color | None, graphics.Color | None] | None): The fg and bg colors of the
+            symbol's ColorPair, or None if the visual has no ColorPair.
+        fg_color_code (str | int | None): The symbol's foreground color code.
+        bg_color_code (str | int | None): The symbol's background color code.
+
+    Returns:
+        CharacterVisual: The shared CharacterVisual.
+
+    """
+    bold, dim, italic, underline, blink, reverse, hidden, strike = modes
+    return CharacterVisual(
+        symbol,
+        bold=bold,
+        dim=dim,
+        italic=italic,
+        underline=underline,
+        blink=blink,
+        reverse=reverse,
+        hidden=hidden,
+        strike=strike,
+        colors=None if colors is None else graphics.ColorPair(fg=colors[0], bg=colors[1]),
+        _fg_color_code=fg_color_code,
+        _bg_color_code=bg_color_code,
+    )
+
+
+_get_character_visual = caches.register(_get_character_visual, maxsize=16384)
+
+
+def _get_eased_frame_steps(ease: easing.EasingFunction, total_steps: int) -> tuple[int, ...]:
+    """Return the frame step shown on each easing step of an eased Scene.
+
+    Args:
+        ease (easing.EasingFunction): The easing function of the Scene.
+        total_steps (int): The total number of easing steps in the Scene. Must be greater than 0.
+
+    Returns:
+        tuple[int, ...]: For each easing step, the index into the Scene's `frame_index_map`.
+
+    """
+    last_step = max(total_steps - 1, 0)
+    eased_values = easing.sample_easing(ease, total_steps)
+    return tuple(max(min(round(eased_values[step] * last_step), last_step), 0) for step in range(total_steps))
+
+
+_get_eased_frame_steps = caches.register(_get_eased_frame_steps, maxsize=1024)
+
+
+def _hue_to_rgb(lightness_scaled: float, color_intensity: float, hue_value: float) -> float:
+    """Convert a hue value to an RGB value component.
+
+    This function is a helper function used in the conversion from HSL (Hue, Saturation, Lightness)
+    color space to RGB (Red, Green, Blue) color space. It takes in three parameters: lightness_scaled,
+    color_intensity, and hue_value. These parameters are derived from the HSL color space and are used
+    to calculate the corresponding RGB value.
+
+    Args:
+        lightness_scaled (float): The lightness value from the HSL color space, scaled and shifted to be used in
+            the RGB conversion.
+        color_intensity (float): The intensity of the color, used to adjust the RGB values.
+        hue_value (float): The hue value from the HSL color space, used to calculate the RGB values.
+
+    Returns:
+        float: The calculated RGB component.
+
+    """
+    if hue_value < 0:
+        hue_value += 1
+    if hue_value > 1:
+        hue_value -= 1
+    if hue_value < 1 / 6:
+        return lightness_scaled + (color_intensity - lightness_scaled) * 6 * hue_value
+    if hue_value < 1 / 2:
+        return color_intensity
+    if hue_value < 2 / 3:
+        return lightness_scaled + (color_intensity - lightness_scaled) * (2 / 3 - hue_value) * 6
+    return lightness_scaled
+
+
+def _adjust_color_brightness(color: graphics.Color, brightness: float) -> graphics.Color:
+    """Return the color with its HSL lightness multiplied by the brightness factor.
+
+    Args:
+        color (Color): The color to adjust.
+        brightness (float): The brightness adjustment factor.
+
+    Returns:
+        Color: The adjusted color.
+
+    """
+    normalized_red, normalized_green, normalized_blue = (value / 255 for value in color.rgb_ints)
+
+    # Convert RGB to HSL
+    max_val = max(normalized_red, normalized_green, normalized_blue)
+    min_val = min(normalized_red, normalized_green, normalized_blue)
+    lightness = (max_val + min_val) / 2
+
+    if max_val == min_val:
+        hue_value = saturation = 0.0  # achromatic
+    else:
+        diff = max_val - min_val
+        lightness_threshold = 0.5
+        saturation = (
+            diff / (2 - max_val - min_val) if lightness > lightness_threshold else diff / (max_val + min_val)
+        )
+        if max_val == normalized_red:
+            hue_value = (normalized_green - normalized_blue) / diff + (
+                6 if normalized_green < normalized_blue else 0
+            )
+        elif max_val == normalized_green:
+            hue_value = (normalized_blue - normalized_red) / diff + 2
+        else:
+            hue_value = (normalized_red - normalized_green) / diff + 4
+        hue_value /= 6
+
+    # Adjust lightness
+    lightness = max(min(lightness * brightness, 1), 0)
+
+    # Convert back to RGB
+    if saturation == 0:
+        red = green = blue = lightness  # achromatic
+    else:
+        color_intensity = (
+            lightness * (1 + saturation)
+            if lightness < lightness_threshold  # type: ignore[unbound]
+            else lightness + saturation - lightness * saturation
+        )
+        lightness_scaled = 2 * lightness - color_intensity
+        red = _hue_to_rgb(lightness_scaled, color_intensity, hue_value + 1 / 3)
+        green = _hue_to_rgb(lightness_scaled, color_intensity, hue_value)
+        blue = _hue_to_rgb(lightness_scaled, color_intensity, hue_value - 1 / 3)
+
+    # Convert to hex
+    adjusted_color = f"{int(red * 255):02x}{int(green * 255):02x}{int(blue * 255):02x}"
+    return graphics.Color(adjusted_color)
+
+
+_adjust_color_brightness = caches.register(_adjust_color_brightness, maxsize=16384)
+# brightness factors are rounded to this many decimal places before the cache lookup, so continuously varying
+# factors share entries. a step of 0.01 moves a channel by at most ~1 of 255.
+_BRIGHTNESS_PRECISION = 2
+
+
+@dataclass(frozen=True)
 class Frame:
     """A Frame is a CharacterVisual with a duration.
 
+    Frames are immutable. Playback progress through a Frame is tracked by the Scene playing it.
+
     Args:
         character_visual (CharacterVisual): a CharacterVisual object
         duration (int): the number of ticks to display the Frame
@@ -111,16 +299,91 @@ class Frame:
     Attributes:
         character_visual (CharacterVisual): the CharacterVisual object for the Frame
         duration (int): the number of ticks to display the Frame
-        ticks_elapsed (int): the number of ticks that have elapsed displaying this frame
 
     """
 
     character_visual: CharacterVisual
     duration: int
 
-    def __post_init__(self) -> None:
-        """Initialize the ticks_elapsed attribute to 0."""
-        self.ticks_elapsed = 0
+
+class _FrameView(Sequence):
+    """Read-only sequence of a range of a Scene's playback positions.
+
+    The view holds the Scene's frame sequence and phase offset as they were when it was created, so it is created
+    in O(1) and indexing is O(1), and the Frames it contains do not change as the Scene advances or has Frames added.
+
+    Args:
+        frames (list[Frame]): The Scene's frame sequence.
+        phase_offset (int): The frame of the sequence playback starts at.
+        start (int): The first playback position in the view.
+        stop (int): The playback position after the last position in the view.
+
+    """
+
+    def __init__(self, frames: list[Frame], phase_offset: int, start: int, stop: int) -> None:
+        """Initialize the view.
+
+        Args:
+            frames (list[Frame]): The Scene's frame sequence.
+            phase_offset (int): The frame of the sequence playback starts at.
+            start (int): The first playback position in the view.
+            stop (int): The playback position after the last position in the view.
+
+        """
+        self._frames = frames
+        self._phase_offset = phase_offset
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        """Return the number of Frames in the view."""
+        return self._stop - self._start
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Frame: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> tuple[Frame, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> Frame | tuple[Frame, ...]:
+        """Return the Frame at the index, or a tuple of the Frames in the slice.
+
+        Args:
+            index (int | slice): Index into the view. Negative indexes count from the end.
+
+        Returns:
+            Frame | tuple[Frame, ...]: The Frame at the index, or the Frames in the slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        """
+        if isinstance(index, slice):
+            return tuple(self[position] for position in range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "Scene frame index out of range"
+            raise IndexError(msg)
+        position = self._start + index
+        if self._phase_offset:
+            return self._frames[(position + self._phase_offset) % len(self._frames)]
+        return self._frames[position]
+
+    def __iter__(self) -> typing.Iterator[Frame]:
+        """Iterate over the Frames in the view in playback order."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the other object is a tuple or view of the same Frames in the same order."""
+        if isinstance(other, (_FrameView, tuple)):
+            return len(self) == len(other) and all(frame == other_frame for frame, other_frame in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the Frames in the view as a tuple representation."""
+        return repr(tuple(self))
 
 
 class Scene:
@@ -140,14 +403,19 @@ class Scene:
         ease (easing.EasingFunction | None): The easing function to use for the Scene
         no_color (bool): Whether to ignore colors
         use_xterm_colors (bool): Whether to convert all colors to XTerm-256 colors
-        frames (list[Frame]): The list of Frames in the Scene
-        played_frames (list[Frame]): The list of Frames that have been played
+        frames (Sequence[Frame]): The Frames remaining to be played, starting with the current Frame
+        played_frames (Sequence[Frame]): The Frames that have been played
+        current_frame_ticks_elapsed (int): The number of ticks the current Frame has been played
         frame_index_map (dict[int, Frame]): A mapping of frame index to Frame
         easing_total_steps (int): The total number of steps in the easing function
         easing_current_step (int): The current step in the easing function
         preexisting_colors (graphics.ColorPair | None): The preexisting colors parsed from the input.
         preexisting_bold (bool): Whether parsed input bold styling should override frame bold styling.
 
+    Scenes created with `Animation.new_scene_from_template` share their frame sequence with the template
+    scene. Frames are copied the first time `add_frame` is called on either scene, so adding frames never
+    affects other scenes.
+
     """
 
     xterm_color_map: typing.ClassVar[dict[str, int]] = {}
@@ -191,13 +459,91 @@ class Scene:
         self.ease: easing.EasingFunction | None = ease
         self.no_color = no_color
         self.use_xterm_colors = use_xterm_colors
-        self.frames: list[Frame] = []
-        self.played_frames: list[Frame] = []
+        # playback is a cursor over the frame sequence, frames are never moved between lists
+        self._frames: list[Frame] = []
+        self._frame_cursor: int = 0
+        self.current_frame_ticks_elapsed: int = 0
         self.frame_index_map: dict[int, Frame] = {}
         self.easing_total_steps: int = 0
         self.easing_current_step: int = 0
         self.preexisting_colors: graphics.ColorPair | None = None
         self.preexisting_bold: bool = False
+        # frames shared with a template scene are copied before they are modified
+        self._frames_shared: bool = False
+        # playback starts at this frame of the frame sequence and wraps around to the frame before it
+        self._phase_offset: int = 0
+        self._phase_step_offset: int = 0
+
+    @property
+    def frames(self) -> Sequence[Frame]:
+        """The Frames remaining to be played, starting with the current Frame.
+
+        Returns a read-only sequence created in O(1). Frames are added with `add_frame`.
+        """
+        return _FrameView(self._frames, self._phase_offset, self._frame_cursor, len(self._frames))
+
+    @property
+    def played_frames(self) -> Sequence[Frame]:
+        """The Frames that have been played in the current playback of the Scene.
+
+        Returns a read-only sequence created in O(1).
+        """
+        return _FrameView(self._frames, self._phase_offset, 0, self._frame_cursor)
+
+    def _playback_order(self) -> list[Frame]:
+        """Return the Frames in the order they are played, accounting for the phase offset."""
+        if self._phase_offset:
+            return self._frames[self._phase_offset :] + self._frames[: self._phase_offset]
+        return self._frames
+
+    def _frame_at(self, position: int) -> Frame:
+        """Return the Frame at the given playback position, accounting for the phase offset.
+
+        Args:
+            position (int): The playback position. Negative positions count from the last Frame played.
+
+        Returns:
+            Frame: The Frame at the playback position.
+
+        """
+        if self._phase_offset:
+            return self._frames[(position + self._phase_offset) % len(self._frames)]
+        return self._frames[position]
+
+    def _frame_at_step(self, step: int) -> Frame:
+        """Return the Frame shown on the given easing step, accounting for the phase offset.
+
+        Args:
+            step (int): The easing step.
+
+        Returns:
+            Frame: The Frame shown on the easing step.
+
+        """
+        if self._phase_step_offset:
+            return self.frame_index_map[(step + self._phase_step_offset) % self.easing_total_steps]
+        return self.frame_index_map[step]
+
+    def _unshare_frames(self) -> None:
+        """Copy frames shared with a template scene, in playback order, so they can be modified."""
+        self._frames = list(self._playback_order())
+        if self._phase_offset:
+            self.frame_index_map = {}
+            step = 0
+            for frame in self._frames:
+                for _ in range(frame.duration):
+                    self.frame_index_map[step] = frame
+                    step += 1
+        else:
+            self.frame_index_map = dict(self.frame_index_map)
+        self._phase_offset = 0
+        self._phase_step_offset = 0
+        self._frames_shared = False
+
+    def _complete_playback(self) -> None:
+        """Move the cursor past the final Frame, completing the Scene."""
+        self._frame_cursor = len(self._frames)
+        self.current_frame_ticks_elapsed = 0
 
     def _get_color_code(self, color: graphics.Color | None) -> str | int | None:
         """Get the color code for the given color.
@@ -279,22 +625,17 @@ class Scene:
 
         if duration < 1:
             raise FrameDurationError(duration)
-        char_vis = CharacterVisual(
+        char_vis = _get_character_visual(
             symbol,
-            bold=bold,
-            dim=dim,
-            italic=italic,
-            underline=underline,
-            blink=blink,
-            reverse=reverse,
-            hidden=hidden,
-            strike=strike,
-            colors=colors,
-            _fg_color_code=char_vis_fg_color,
-            _bg_color_code=char_vis_bg_color,
+            (bold, dim, italic, underline, blink, reverse, hidden, strike),
+            (colors.fg_color, colors.bg_color) if colors is not None else None,
+            char_vis_fg_color,
+            char_vis_bg_color,
         )
         frame = Frame(char_vis, duration)
-        self.frames.append(frame)
+        if self._frames_shared:
+            self._unshare_frames()
+        self._frames.append(frame)
         for _ in range(frame.duration):
             self.frame_index_map[self.easing_total_steps] = frame
             self.easing_total_steps += 1
@@ -311,33 +652,30 @@ class Scene:
             CharacterVisual: the first frame's visual.
 
         """
-        if self.frames:
-            return self.frames[0].character_visual
+        if self._frame_cursor < len(self._frames):
+            return self._frame_at(self._frame_cursor).character_visual
         raise ActivateEmptySceneError(self)
 
     def get_next_visual(self) -> CharacterVisual:
         """Get the next CharacterVisual in the Scene.
 
-        Retrieve the current frame from `frames`, then increment the frame's `ticks_elapsed`.
-        If `ticks_elapsed` reaches the frame duration, reset that frame's `ticks_elapsed` to `0`
-        and move it from `frames` to `played_frames`. If the Scene is looping and all frames
-        have been played, restore `frames` from `played_frames` so the next loop begins from
-        the start of each frame again. Return the current frame's `CharacterVisual`.
+        Retrieve the current frame, then increment `current_frame_ticks_elapsed`. If it reaches
+        the frame duration, reset it to `0` and advance the cursor so the frame moves from
+        `frames` to `played_frames`. If the Scene is looping and all frames have been played,
+        the cursor returns to the first frame. Return the current frame's `CharacterVisual`.
 
         Returns:
             CharacterVisual: The visual of the current frame in the Scene.
 
         """
-        current_frame = self.frames[0]
-        next_visual = current_frame.character_visual
-        current_frame.ticks_elapsed += 1
-        if current_frame.ticks_elapsed == current_frame.duration:
-            current_frame.ticks_elapsed = 0
-            self.played_frames.append(self.frames.pop(0))
-            if self.is_looping and not self.frames:
-                self.frames.extend(self.played_frames)
-                self.played_frames.clear()
-        return next_visual
+        current_frame = self._frame_at(self._frame_cursor)
+        self.current_frame_ticks_elapsed += 1
+        if self.current_frame_ticks_elapsed == current_frame.duration:
+            self.current_frame_ticks_elapsed = 0
+            self._frame_cursor += 1
+            if self.is_looping and self._frame_cursor == len(self._frames):
+                self._frame_cursor = 0
+        return current_frame.character_visual
 
     def apply_gradient_to_symbols(
         self,
@@ -446,16 +784,12 @@ class Scene:
     def reset_scene(self) -> None:
         """Reset the Scene to its initial playback state.
 
-        All remaining frames are moved back into the full frame sequence, each frame's
-        `ticks_elapsed` is reset to `0`, `played_frames` is cleared, and
-        `easing_current_step` is reset to `0`.
+        The cursor returns to the first frame so all frames are remaining and `played_frames`
+        is empty, and `current_frame_ticks_elapsed` and `easing_current_step` are reset to `0`.
+        The phase offset of a Scene created from a template is kept.
         """
-        for sequence in self.frames:
-            sequence.ticks_elapsed = 0
-            self.played_frames.append(sequence)
-        self.frames.clear()
-        self.frames.extend(self.played_frames)
-        self.played_frames.clear()
+        self._frame_cursor = 0
+        self.current_frame_ticks_elapsed = 0
         self.easing_current_step = 0
 
     def __eq__(self, other: object) -> bool:
@@ -493,6 +827,7 @@ class Animation:
 
     Methods:
         new_scene: Creates a new Scene and adds it to the Animation.
+        new_scene_from_template: Creates a new Scene that plays the frames of a template Scene.
         query_scene: Returns a Scene from the Animation.
         active_scene_is_complete: Returns whether the active scene is complete.
         set_appearance: Applies a symbol and color to the character.
@@ -524,6 +859,33 @@ class Animation:
         self.active_scene_current_step: int = 0
         self.current_character_visual: CharacterVisual = CharacterVisual(character.input_symbol)
 
+    def _clone(self, character: base_character.EffectCharacter) -> Animation:
+        """Return a new Animation for the character with this Animation's input colors and appearance.
+
+        Scenes are not copied.
+
+        Args:
+            character (base_character.EffectCharacter): the EffectCharacter object to animate
+
+        Returns:
+            Animation: The new Animation.
+
+        """
+        clone = Animation.__new__(Animation)
+        clone.scenes = {}
+        clone.character = character
+        clone.active_scene = None
+        clone.use_xterm_colors = self.use_xterm_colors
+        clone.no_color = self.no_color
+        clone.existing_color_handling = self.existing_color_handling
+        clone.input_fg_color = self.input_fg_color
+        clone.input_bg_color = self.input_bg_color
+        clone.input_bold = self.input_bold
+        clone.xterm_color_map = {}
+        clone.active_scene_current_step = 0
+        clone.current_character_visual = self.current_character_visual
+        return clone
+
     def _get_color_code(self, color: graphics.Color | None) -> str | int | None:
         """Get the color code for the given color.
 
@@ -605,6 +967,69 @@ class Animation:
         self.scenes[scene_id] = new_scene
         return new_scene
 
+    def new_scene_from_template(self, template: Scene, *, scene_id: str = "", phase_offset: int = 0) -> Scene:
+        """Create a new Scene that plays the frames of a template Scene and add it to the Animation.
+
+        Templates are Scenes built once by an effect and used by many characters. When the template and
+        the new Scene use the same color settings, the new Scene shares the template's frames and only
+        holds its own playback state. Otherwise, for example when the character's input colors override
+        the frame colors, the template's frames are added to the new Scene with `Scene.add_frame`.
+
+        The looping, sync, and easing settings are copied from the template.
+
+        Args:
+            template (Scene): The Scene providing the frames.
+            scene_id (str, optional): Name for the scene. Defaults to the template's scene_id.
+            phase_offset (int, optional): The index of the template frame to start playback from. Playback
+                wraps around to the template frames before it. Defaults to 0.
+
+        Returns:
+            Scene: The new Scene.
+
+        """
+        new_scene = self.new_scene(
+            is_looping=template.is_looping,
+            sync=template.sync,
+            ease=template.ease,
+            scene_id=scene_id or template.scene_id,
+        )
+        if not template._frames:
+            return new_scene
+        if (
+            new_scene.no_color == template.no_color
+            and new_scene.use_xterm_colors == template.use_xterm_colors
+            and not (new_scene.preexisting_colors or new_scene.preexisting_bold)
+            and not (template.preexisting_colors or template.preexisting_bold)
+        ):
+            template._frames_shared = True
+            new_scene._frames = template._frames
+            new_scene.frame_index_map = template.frame_index_map
+            new_scene.easing_total_steps = template.easing_total_steps
+            new_scene._frames_shared = True
+            new_scene._phase_offset = (template._phase_offset + phase_offset) % len(template._frames)
+            new_scene._phase_step_offset = sum(
+                frame.duration for frame in template._frames[: new_scene._phase_offset]
+            )
+        else:
+            frames = template._playback_order()
+            phase_offset %= len(frames)
+            for frame in frames[phase_offset:] + frames[:phase_offset]:
+                visual = frame.character_visual
+                new_scene.add_frame(
+                    visual.symbol,
+                    frame.duration,
+                    colors=visual.colors,
+                    bold=visual.bold,
+                    dim=visual.dim,
+                    italic=visual.italic,
+                    underline=visual.underline,
+                    blink=visual.blink,
+                    reverse=visual.reverse,
+                    hidden=visual.hidden,
+                    strike=visual.strike,
+                )
+        return new_scene
+
     @typing.overload
     def query_scene(self, scene_id: str) -> Scene: ...
     @typing.overload
@@ -643,7 +1068,45 @@ class Animation:
             bool: True if the active scene is complete, False otherwise.
 
         """
-        return bool(not self.active_scene or not self.active_scene.frames or self.active_scene.is_looping)
+        scene = self.active_scene
+        return bool(not scene or scene._frame_cursor >= len(scene._frames) or scene.is_looping)
+
+    def _get_idle_ticks(self) -> int | None:
+        """Return the number of upcoming steps that will not change the animation.
+
+        Only scenes that advance by frame duration can be idle, and only once the current frame's
+        visual is applied. The final tick of the current frame is never idle because it advances
+        the scene and may complete it. Looping scenes trigger
+        `SCENE_COMPLETE` on every step, so they are only idle when no actions are registered for it.
+
+        Returns:
+            int | None: The number of idle steps, or None if there is no active scene to step.
+
+        """
+        scene = self.active_scene
+        if scene is None or scene._frame_cursor >= len(scene._frames):
+            return None
+        if scene.sync or scene.ease:
+            return 0
+        if scene.is_looping and (
+            self.character.event_handler.Event.SCENE_COMPLETE,
+            scene,
+        ) in self.character.event_handler.registered_events:
+            return 0
+        current_frame = scene._frame_at(scene._frame_cursor)
+        if current_frame.character_visual is not self.current_character_visual:
+            return 0
+        return current_frame.duration - scene.current_frame_ticks_elapsed - 1
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Apply idle steps to the active scene without stepping the animation.
+
+        Args:
+            ticks (int): The number of idle steps to apply. Must not exceed `_get_idle_ticks()`.
+
+        """
+        if self.active_scene is not None:
+            self.active_scene.current_frame_ticks_elapsed += ticks
 
     def set_appearance(self, symbol: str | None = None, colors: graphics.ColorPair | None = None) -> None:
         """Update the current character visual with the symbol and colors provided.
@@ -661,6 +1124,7 @@ class Animation:
             colors (graphics.ColorPair | None): The colors to apply.
 
         """
+        self.character._wake()
         if symbol is None:
             symbol = self.character.input_symbol
         if colors is None:
@@ -675,18 +1139,22 @@ class Animation:
         char_vis_fg_color: str | int | None = self._get_color_code(colors.fg_color)
         char_vis_bg_color: str | int | None = self._get_color_code(colors.bg_color)
 
-        self.current_character_visual = CharacterVisual(
+        self.current_character_visual = _get_character_visual(
             symbol,
-            bold=bold,
-            colors=colors,
-            _fg_color_code=char_vis_fg_color,
-            _bg_color_code=char_vis_bg_color,
+            (bold, False, False, False, False, False, False, False),
+            (colors.fg_color, colors.bg_color),
+            char_vis_fg_color,
+            char_vis_bg_color,
         )
 
     @staticmethod
     def adjust_color_brightness(color: graphics.Color, brightness: float) -> graphics.Color:
         """Adjust the brightness of a given color.
 
+        The color is converted to HSL, its lightness is multiplied by the brightness factor, and it is converted
+        back to RGB. The brightness factor is rounded to two decimal places, and results are cached by color and
+        rounded brightness factor.
+
         Args:
             color (Color): The color code to adjust.
             brightness (float): The brightness adjustment factor.
@@ -695,84 +1163,7 @@ class Animation:
             Color: The adjusted color code.
 
         """
-
-        def hue_to_rgb(lightness_scaled: float, color_intensity: float, hue_value: float) -> float:
-            """Convert a hue value to an RGB value component.
-
-            This function is a helper function used in the conversion from HSL (Hue, Saturation, Lightness)
-            color space to RGB (Red, Green, Blue) color space. It takes in three parameters: lightness_scaled,
-            color_intensity, and hue_value. These parameters are derived from the HSL color space and are used
-            to calculate the corresponding RGB value.
-
-            Args:
-                lightness_scaled (float): The lightness value from the HSL color space, scaled and shifted to be used in
-                    the RGB conversion.
-                color_intensity (float): The intensity of the color, used to adjust the RGB values.
-                hue_value (float): The hue value from the HSL color space, used to calculate the RGB values.
-
-            Returns:
-                float: The calculated RGB component.
-
-            """
-            if hue_value < 0:
-                hue_value += 1
-            if hue_value > 1:
-                hue_value -= 1
-            if hue_value < 1 / 6:
-                return lightness_scaled + (color_intensity - lightness_scaled) * 6 * hue_value
-            if hue_value < 1 / 2:
-                return color_intensity
-            if hue_value < 2 / 3:
-                return lightness_scaled + (color_intensity - lightness_scaled) * (2 / 3 - hue_value) * 6
-            return lightness_scaled
-
-        normalized_red = int(color.rgb_color[0:2], 16) / 255
-        normalized_green = int(color.rgb_color[2:4], 16) / 255
-        normalized_blue = int(color.rgb_color[4:6], 16) / 255
-
-        # Convert RGB to HSL
-        max_val = max(normalized_red, normalized_green, normalized_blue)
-        min_val = min(normalized_red, normalized_green, normalized_blue)
-        lightness = (max_val + min_val) / 2
-
-        if max_val == min_val:
-            hue_value = saturation = 0.0  # achromatic
-        else:
-            diff = max_val - min_val
-            lightness_threshold = 0.5
-            saturation = (
-                diff / (2 - max_val - min_val) if lightness > lightness_threshold else diff / (max_val + min_val)
-            )
-            if max_val == normalized_red:
-                hue_value = (normalized_green - normalized_blue) / diff + (
-                    6 if normalized_green < normalized_blue else 0
-                )
-            elif max_val == normalized_green:
-                hue_value = (normalized_blue - normalized_red) / diff + 2
-            else:
-                hue_value = (normalized_red - normalized_green) / diff + 4
-            hue_value /= 6
-
-        # Adjust lightness
-        lightness = max(min(lightness * brightness, 1), 0)
-
-        # Convert back to RGB
-        if saturation == 0:
-            red = green = blue = lightness  # achromatic
-        else:
-            color_intensity = (
-                lightness * (1 + saturation)
-                if lightness < lightness_threshold  # type: ignore[unbound]
-                else lightness + saturation - lightness * saturation
-            )
-            lightness_scaled = 2 * lightness - color_intensity
-            red = hue_to_rgb(lightness_scaled, color_intensity, hue_value + 1 / 3)
-            green = hue_to_rgb(lightness_scaled, color_intensity, hue_value)
-            blue = hue_to_rgb(lightness_scaled, color_intensity, hue_value - 1 / 3)
-
-        # Convert to hex
-        adjusted_color = f"{int(red * 255):02x}{int(green * 255):02x}{int(blue * 255):02x}"
-        return graphics.Color(adjusted_color)
+        return _adjust_color_brightness(color, round(brightness, _BRIGHTNESS_PRECISION))
 
     def _ease_animation(self, easing_func: easing.EasingFunction) -> float:
         """Return the percentage of total distance that should be moved based on the easing function.
@@ -786,8 +1177,9 @@ class Animation:
         """
         if self.active_scene is None:
             return 0
-        elapsed_step_ratio = self.active_scene.easing_current_step / self.active_scene.easing_total_steps
-        return easing_func(elapsed_step_ratio)
+        return easing.sample_easing(easing_func, self.active_scene.easing_total_steps)[
+            self.active_scene.easing_current_step
+        ]
 
     def step_animation(self) -> None:
         """Progress the Scene and apply the next visual to the character.
@@ -801,22 +1193,24 @@ class Animation:
             * When a non-looping scene completes, it is reset, deactivated, and a `SCENE_COMPLETE`
               event is triggered.
         """
-        if self.active_scene and self.active_scene.frames:
+        scene = self.active_scene
+        if scene and scene._frame_cursor < len(scene._frames):
             # if the active scene is synced to movement, calculate the sequence index based on the
             # current waypoint progress
-            if self.active_scene.sync:
+            if scene.sync:
+                remaining_frame_count = len(scene._frames) - scene._frame_cursor
                 if self.character.motion.active_path:
-                    if self.active_scene.sync == Scene.SyncMetric.STEP:
+                    if scene.sync == Scene.SyncMetric.STEP:
                         sequence_index = round(
-                            (len(self.active_scene.frames) - 1)
+                            (remaining_frame_count - 1)
                             * (
                                 max(self.character.motion.active_path.current_step, 1)
                                 / max(self.character.motion.active_path.max_steps, 1)
                             ),
                         )
-                    elif self.active_scene.sync == Scene.SyncMetric.DISTANCE:
+                    elif scene.sync == Scene.SyncMetric.DISTANCE:
                         sequence_index = round(
-                            (len(self.active_scene.frames) - 1)
+                            (remaining_frame_count - 1)
                             * (
                                 max(
                                     max(self.character.motion.active_path.total_distance, 1)
@@ -830,33 +1224,32 @@ class Animation:
                                 / max(self.character.motion.active_path.total_distance, 1)
                             ),
                         )
-                    try:
-                        self.current_character_visual = self.active_scene.frames[sequence_index].character_visual  # type: ignore[unbound]
-                    except IndexError:
-                        self.current_character_visual = self.active_scene.frames[-1].character_visual
+                    if sequence_index < remaining_frame_count:  # type: ignore[unbound]
+                        self.current_character_visual = scene._frame_at(
+                            scene._frame_cursor + sequence_index,
+                        ).character_visual
+                    else:
+                        self.current_character_visual = scene._frame_at(-1).character_visual
                 # when the active waypoint has been deactivated, use the final symbol in the scene and finish the scene
                 else:
-                    self.current_character_visual = self.active_scene.frames[-1].character_visual
-                    self.active_scene.played_frames.extend(self.active_scene.frames)
-                    self.active_scene.frames.clear()
-
-            elif self.active_scene and self.active_scene.ease:
-                easing_factor = self._ease_animation(self.active_scene.ease)
-                frame_index = round(easing_factor * max(self.active_scene.easing_total_steps - 1, 0))
-                frame_index = max(min(frame_index, self.active_scene.easing_total_steps - 1), 0)
-                frame = self.active_scene.frame_index_map[frame_index]
+                    self.current_character_visual = scene._frame_at(-1).character_visual
+                    scene._complete_playback()
+
+            elif scene.ease:
+                frame_index = _get_eased_frame_steps(scene.ease, scene.easing_total_steps)[scene.easing_current_step]
+                frame = scene._frame_at_step(frame_index)
                 self.current_character_visual = frame.character_visual
-                self.active_scene.easing_current_step += 1
-                if self.active_scene.easing_current_step == self.active_scene.easing_total_steps:
-                    if self.active_scene.is_looping:
-                        self.active_scene.easing_current_step = 0
+                scene.easing_current_step += 1
+                if scene.easing_current_step == scene.easing_total_steps:
+                    if scene.is_looping:
+                        scene.easing_current_step = 0
                     else:
-                        self.active_scene.played_frames.extend(self.active_scene.frames)
-                        self.active_scene.frames.clear()
+                        scene._complete_playback()
 
             else:
-                self.current_character_visual = self.active_scene.get_next_visual()
+                self.current_character_visual = scene.get_next_visual()
             if self.active_scene_is_complete():
+                self.character._deactivation_reported = True
                 completed_scene = self.active_scene
                 if not self.active_scene.is_looping:
                     self.active_scene.reset_scene()
@@ -887,6 +1280,7 @@ class Animation:
                 a known scene.
 
         """
+        self.character._wake()
         if isinstance(scene, str):
             found_scene = self.query_scene(scene)
             if found_scene is None:
@@ -918,8 +1312,10 @@ class Animation:
             SceneNotFoundError: If `scene` is a string and no scene with that ID exists.
 
         """
+        self.character._wake()
         if scene is None:
             self.active_scene = None
+            self.character._deactivation_reported = True
             return
         if isinstance(scene, str):
             found_scene = self.query_scene(scene)
@@ -929,3 +1325,4 @@ class Animation:
             found_scene = scene
         if self.active_scene and self.active_scene is found_scene:
             self.active_scene = None
+            self.character._deactivation_reported = True
@@ -7,7 +7,9 @@ Classes:
 
 from __future__ import annotations
 
+import functools
 import typing
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -21,6 +23,19 @@ from terminaltexteffects.utils.exceptions import (
 )
 from terminaltexteffects.utils.geometry import Coord
 
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator  # pragma: no cover
+
+    from terminaltexteffects.engine.scheduler import TimerWheel  # pragma: no cover
+    from terminaltexteffects.engine.spatial_index import SpatialIndex  # pragma: no cover
+
+    # an action registered for an event and caller: the action, its resolved target, and its compiled handler
+    _RegisteredAction = tuple[
+        "EventHandler.Action",
+        "animation.Scene | motion.Path | int | Coord | EventHandler.Callback | None",
+        typing.Callable[[], object],
+    ]
+
 
 class EventHandler:
     """Register and handle events related to a character.
@@ -31,7 +46,8 @@ class EventHandler:
 
     Attributes:
         character (EffectCharacter): The character whose events are handled by this EventHandler.
-        registered_events: Registered event/action mappings keyed by the triggering event and caller object.
+        registered_events: Read-only view of the registered event/action mappings keyed by the triggering event
+            and caller object. Use `register_event` and `clear_events` to change the registrations.
 
     Note:
         SEGMENT_ENTERED/EXITED events will trigger the first time the character enters or exits a segment.
@@ -48,16 +64,41 @@ class EventHandler:
 
         """
         self.character = character
-        self.registered_events: dict[
-            tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path],
-            list[
-                tuple[
-                    EventHandler.Action,
-                    animation.Scene | motion.Waypoint | motion.Path | int | Coord | EventHandler.Callback | str | None,
-                ]
-            ],
+        self._handlers: dict[
+            EventHandler.Event,
+            dict[animation.Scene | motion.Waypoint | motion.Path, list[_RegisteredAction]],
         ] = {}
 
+    @property
+    def registered_events(
+        self,
+    ) -> Mapping[
+        tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path],
+        list[tuple[EventHandler.Action, animation.Scene | motion.Path | int | Coord | EventHandler.Callback | None]],
+    ]:
+        """Return a read-only view of the registered actions keyed by the triggering event and caller object.
+
+        Each value is a new list of the `(action, target)` pairs registered for the event and caller, in
+        registration order. The view is derived from the compiled actions used to handle events, so it always
+        matches them. Use `register_event` and `clear_events` to change the registrations.
+        """
+        return _RegisteredEventsView(self._handlers)
+
+    def _clone(self, character: EffectCharacter) -> EventHandler:
+        """Return a new EventHandler for the character with no events registered.
+
+        Args:
+            character (EffectCharacter): The character for which the new EventHandler is handling events.
+
+        Returns:
+            EventHandler: The new EventHandler.
+
+        """
+        clone = EventHandler.__new__(EventHandler)
+        clone.character = character
+        clone._handlers = {}
+        return clone
+
     class Event(Enum):
         """An Event that can be registered with the EventHandler.
 
@@ -310,24 +351,60 @@ class EventHandler:
             raise EventRegistrationTargetError(action, target, action_target_map[action])
 
         assert isinstance(caller, (motion.Path, animation.Scene, motion.Waypoint))
-        new_event = (event, caller)
         new_action = (action, target)
 
-        if new_event not in self.registered_events:
-            self.registered_events[new_event] = []
+        registered_actions = self._handlers.setdefault(event, {}).setdefault(caller, [])
 
         # Check for duplicate event-action-target combination
-        if new_action in self.registered_events[new_event]:
+        if any(registered_action[:2] == new_action for registered_action in registered_actions):
             raise DuplicateEventRegistrationError(event, caller, action, target)
 
-        self.registered_events[new_event].append(new_action)
+        registered_actions.append((action, target, self._compile_action(action, target)))
+
+    def clear_events(self) -> None:
+        """Remove all registered events and their compiled actions."""
+        self._handlers.clear()
+
+    def _compile_action(
+        self,
+        action: Action,
+        target: animation.Scene | motion.Path | int | Coord | Callback | None,
+    ) -> typing.Callable[[], object]:
+        """Return a ready-to-call handler that takes the action on the target.
+
+        Args:
+            action (Action): The action to take.
+            target (animation.Scene | motion.Path | int | Coord | Callback | None): The resolved action target.
+
+        Returns:
+            typing.Callable[[], object]: Handler taking the action when called.
+
+        """
+        character = self.character
+        if action is EventHandler.Action.ACTIVATE_PATH:
+            return functools.partial(character.motion.activate_path, target)
+        if action is EventHandler.Action.ACTIVATE_SCENE:
+            return functools.partial(character.animation.activate_scene, target)
+        if action is EventHandler.Action.DEACTIVATE_PATH:
+            return functools.partial(character.motion.deactivate_path, target)
+        if action is EventHandler.Action.DEACTIVATE_SCENE:
+            return functools.partial(character.animation.deactivate_scene, target)
+        if action is EventHandler.Action.RESET_APPEARANCE:
+            return functools.partial(character.animation.set_appearance, character.input_symbol)
+        if action is EventHandler.Action.SET_LAYER:
+            return functools.partial(setattr, character, "layer", target)
+        if action is EventHandler.Action.SET_COORDINATE:
+            return functools.partial(character.motion.set_coordinate, target)
+        assert isinstance(target, EventHandler.Callback)
+        return lambda: target.callback(character, *target.args)
 
     def _handle_event(self, event: Event, caller: animation.Scene | motion.Waypoint | motion.Path) -> None:
         """Handle a registered event by executing all associated actions.
 
         This method processes an event triggered by a caller object (Scene, Waypoint, or Path) and
-        executes all actions that were registered for this specific event-caller combination. If no
-        actions are registered for the given event and caller, the method returns without doing anything.
+        executes all actions that were registered for this specific event-caller combination. Actions are
+        compiled into ready-to-call handlers by `register_event`. If no actions are registered for the given
+        event and caller, the method returns without doing anything.
 
         The method supports the following action types:
         - ACTIVATE_PATH: Activates a motion path for the character
@@ -358,24 +435,67 @@ class EventHandler:
             actions registered for that event/caller pair are executed in order.
 
         """
-        action_map = {
-            EventHandler.Action.ACTIVATE_PATH: self.character.motion.activate_path,
-            EventHandler.Action.ACTIVATE_SCENE: self.character.animation.activate_scene,
-            EventHandler.Action.DEACTIVATE_PATH: self.character.motion.deactivate_path,
-            EventHandler.Action.DEACTIVATE_SCENE: self.character.animation.deactivate_scene,
-            EventHandler.Action.RESET_APPEARANCE: lambda _: self.character.animation.set_appearance(
-                self.character.input_symbol,
-            ),
-            EventHandler.Action.SET_LAYER: lambda layer: setattr(self.character, "layer", layer),
-            EventHandler.Action.SET_COORDINATE: lambda coord: setattr(self.character.motion, "current_coord", coord),
-            EventHandler.Action.CALLBACK: lambda callback: callback.callback(self.character, *callback.args),
-        }
-
-        if (event, caller) not in self.registered_events:
+        if not self._handlers:
+            return
+        handlers_by_caller = self._handlers.get(event)
+        if handlers_by_caller is None:
+            return
+        registered_actions = handlers_by_caller.get(caller)
+        if registered_actions is None:
             return
-        for event_action in self.registered_events[(event, caller)]:
-            action, target = event_action
-            action_map[action](target)  # type: ignore[operator]
+        for _, _, handler in registered_actions:
+            handler()
+
+
+class _RegisteredEventsView(Mapping):
+    """Read-only view of an EventHandler's registered actions keyed by `(event, caller)`.
+
+    Args:
+        handlers (dict): The EventHandler's registered actions keyed by event and then by caller.
+
+    """
+
+    def __init__(
+        self,
+        handlers: dict[
+            EventHandler.Event,
+            dict[animation.Scene | motion.Waypoint | motion.Path, list[_RegisteredAction]],
+        ],
+    ) -> None:
+        """Initialize the view over the registered actions.
+
+        Args:
+            handlers (dict): The EventHandler's registered actions keyed by event and then by caller.
+
+        """
+        self._handlers = handlers
+
+    def __getitem__(
+        self,
+        key: tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path],
+    ) -> list[tuple[EventHandler.Action, animation.Scene | motion.Path | int | Coord | EventHandler.Callback | None]]:
+        """Return the `(action, target)` pairs registered for the event and caller."""
+        if key not in self:
+            raise KeyError(key)
+        event, caller = key
+        return [(action, target) for action, target, _ in self._handlers[event][caller]]
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether any action is registered for the `(event, caller)` key."""
+        if not isinstance(key, tuple) or len(key) != 2:  # noqa: PLR2004
+            return False
+        event, caller = key
+        return caller in self._handlers.get(event, ())
+
+    def __iter__(self) -> Iterator[tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path]]:
+        """Iterate over the `(event, caller)` keys with registered actions."""
+        for event, registered_actions_by_caller in self._handlers.items():
+            for caller in registered_actions_by_caller:
+                yield event, caller
+
+    def __len__(self) -> int:
+        """Return the number of `(event, caller)` keys with registered actions."""
+        return sum(len(registered_actions_by_caller) for registered_actions_by_caller in self._handlers.values())
 
 
 class EffectCharacter:
@@ -431,6 +551,38 @@ class EffectCharacter:
         self.uses_input_preexisting_colors = False
         self.links: set[EffectCharacter] = set()
         self.neighbors: dict[str, EffectCharacter | None] = {}
+        self._timer_wheel: TimerWheel | None = None
+        self._spatial_index: SpatialIndex | None = None
+        self._deactivation_reported = False
+
+    def _clone(self) -> EffectCharacter:
+        """Return a new character with this character's ID, input state, and current coordinate.
+
+        Used by `Terminal._clone()` to copy characters that have not been animated without running
+        `__init__`. Scenes, paths, events, links, and neighbors are not copied.
+
+        Returns:
+            EffectCharacter: The new character.
+
+        """
+        clone = EffectCharacter.__new__(EffectCharacter)
+        clone._character_id = self._character_id
+        clone._input_symbol = self._input_symbol
+        clone._input_coord = self._input_coord
+        clone._input_ansi_sequences = dict(self._input_ansi_sequences)
+        clone._is_visible = False
+        clone.animation = self.animation._clone(clone)
+        clone.motion = self.motion._clone(clone)
+        clone.event_handler = self.event_handler._clone(clone)
+        clone.layer = 0
+        clone.is_fill_character = self.is_fill_character
+        clone.uses_input_preexisting_colors = self.uses_input_preexisting_colors
+        clone.links = set()
+        clone.neighbors = {}
+        clone._timer_wheel = None
+        clone._spatial_index = None
+        clone._deactivation_reported = False
+        return clone
 
     @property
     def input_symbol(self) -> str:
@@ -470,9 +622,47 @@ class EffectCharacter:
 
         Motion is advanced first, then animation is stepped so animation logic can react
         to the character's updated motion state for the same tick.
+
+        Characters report a possible deactivation, for the effect iterator to verify, when a scene
+        completes, a scene or path is deactivated, or they are ticked with neither.
         """
+        self._wake()
         self.motion.move()
         self.animation.step_animation()
+        if self.motion.active_path is None and self.animation.active_scene is None:
+            self._deactivation_reported = True
+
+    def _get_idle_ticks(self) -> int:
+        """Return the number of upcoming ticks that will not change the character.
+
+        Returns:
+            int: The number of idle ticks. Zero if the next tick may change the character.
+
+        """
+        motion_idle_ticks = self.motion._get_idle_ticks()
+        animation_idle_ticks = self.animation._get_idle_ticks()
+        if motion_idle_ticks is None:
+            return animation_idle_ticks or 0
+        if animation_idle_ticks is None:
+            return motion_idle_ticks
+        return min(motion_idle_ticks, animation_idle_ticks)
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Apply idle ticks to the character in a single step.
+
+        Args:
+            ticks (int): The number of idle ticks to apply. Must not exceed `_get_idle_ticks()`.
+
+        """
+        if ticks <= 0:
+            return
+        self.motion._skip_idle_ticks(ticks)
+        self.animation._skip_idle_ticks(ticks)
+
+    def _wake(self) -> None:
+        """Wake the character if it is parked in a timer wheel, applying any elapsed idle ticks."""
+        if self._timer_wheel is not None:
+            self._timer_wheel.wake(self)
 
     def _link(self, char: EffectCharacter, *, bidirectional: bool = True) -> None:
         """Link this character with another character.
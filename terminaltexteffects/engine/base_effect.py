@@ -17,10 +17,12 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from copy import deepcopy
+from itertools import filterfalse
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from terminaltexteffects.engine.base_config import BaseConfig
-from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+from terminaltexteffects.engine.scheduler import TimerWheel
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig, TerminalPrototype
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -40,6 +42,7 @@ class BaseEffectIterator(ABC, Generic[T]):
         config (T): Configuration for the effect.
         terminal (Terminal): Terminal to use for output.
         active_characters (set[EffectCharacter]): Set of active characters in the effect.
+        timer_wheel (TimerWheel): Scheduler holding active characters that are idle for the upcoming ticks.
         preexisting_colors_present (bool): Whether any terminal input characters were
             initialized with parsed foreground or background input colors.
     Properties:
@@ -60,8 +63,9 @@ class BaseEffectIterator(ABC, Generic[T]):
 
         """
         self.config: T = deepcopy(effect.effect_config)
-        self.terminal = Terminal(effect.input_data, deepcopy(effect.terminal_config))
+        self.terminal = effect._get_terminal_prototype()._clone()
         self.active_characters: set[EffectCharacter] = set()
+        self.timer_wheel = TimerWheel()
         self.preexisting_colors_present: bool = any(
             any((character.animation.input_fg_color, character.animation.input_bg_color))
             for character in self.terminal.get_characters()
@@ -86,12 +90,40 @@ class BaseEffectIterator(ABC, Generic[T]):
     def update(self) -> None:
         """Run one tick for each active character and prune inactive characters.
 
-        Each character in `active_characters` is ticked once. After all ticks complete,
-        characters whose `is_active` flag is false are removed from the set.
+        Each character in `active_characters` is ticked once. Characters whose next observable
+        change is at least `TimerWheel.MIN_IDLE_TICKS` ticks away are parked in the timer wheel
+        and skip their idle ticks, being woken on the tick they are due. Parked characters are
+        filtered out of `active_characters` without running any Python code for them, and the
+        remaining characters tick in the iteration order of `active_characters`, the same order as
+        when nothing is parked, so effects drawing random numbers while ticking render identical
+        frames. Characters removed from `active_characters` while parked are woken with only the
+        ticks they received applied.
+        Characters report a possible deactivation when a scene completes or a scene or path is
+        deactivated. After all ticks complete, only the reporting characters are checked and those
+        whose `is_active` flag is false are removed from the set.
         """
-        for character in self.active_characters:
+        timer_wheel = self.timer_wheel
+        if timer_wheel:
+            for character in timer_wheel.parked - self.active_characters:
+                timer_wheel.wake(character)
+        timer_wheel.advance()
+        reporting_characters = []
+        # the parked characters are filtered out of the active set itself so characters tick in the same
+        # order as when nothing is parked. the filter is checked as each character is reached, so a character
+        # woken by an earlier character's event is still ticked.
+        for character in filterfalse(timer_wheel.parked.__contains__, self.active_characters):
             character.tick()
-        self.active_characters -= {character for character in self.active_characters if not character.is_active}
+            if character._deactivation_reported:
+                character._deactivation_reported = False
+                reporting_characters.append(character)
+                continue
+            idle_ticks = character._get_idle_ticks()
+            if idle_ticks >= TimerWheel.MIN_IDLE_TICKS:
+                timer_wheel.park(character, idle_ticks)
+        if reporting_characters:
+            self.active_characters.difference_update(
+                [character for character in reporting_characters if not character.is_active],
+            )
 
     def __iter__(self) -> BaseEffectIterator:
         """Return this iterator instance.
@@ -123,6 +155,10 @@ class BaseEffect(ABC, Generic[T]):
 
     Base class for all effects. Provides the `__iter__` method and a context manager for terminal output.
 
+    The input data is parsed into a prototype `Terminal` once, and each iterator receives a clone of the
+    prototype. The prototype is rebuilt if `input_data` or `terminal_config` are changed. Effects on the same
+    input can share a `TerminalPrototype` by passing it as `terminal_prototype`.
+
     Attributes:
         input_data (str): Text to which the effect will be applied.
         effect_config (T): Configuration for the effect.
@@ -145,6 +181,8 @@ class BaseEffect(ABC, Generic[T]):
         input_data: str,
         effect_config: T | None = None,
         terminal_config: TerminalConfig | None = None,
+        *,
+        terminal_prototype: TerminalPrototype | None = None,
     ) -> None:
         """Initialize the effect with the input data.
 
@@ -156,11 +194,33 @@ class BaseEffect(ABC, Generic[T]):
             terminal_config (TerminalConfig | None, optional): Terminal configuration. If not
                 provided, a new configuration will be built with default values.
                 Defaults to None.
+            terminal_prototype (TerminalPrototype | None, optional): Prototype Terminal shared with other
+                effects on the same input. It is used while it matches `input_data` and `terminal_config`,
+                otherwise the effect builds its own. Defaults to None.
 
         """
         self.input_data = input_data
         self.effect_config: T = effect_config or self._config_cls._build_config()
         self.terminal_config: TerminalConfig = terminal_config or TerminalConfig._build_config()
+        self._terminal_prototype = terminal_prototype
+
+    def _get_terminal_prototype(self) -> Terminal:
+        """Return the prototype Terminal for the current input data and terminal configuration.
+
+        The prototype is built on first use and whenever `input_data` or `terminal_config` no longer
+        match the values it was built with. Its characters must not be animated, use `Terminal._clone()`
+        to get a Terminal for an effect iterator.
+
+        Returns:
+            Terminal: The prototype Terminal.
+
+        """
+        self._terminal_prototype = TerminalPrototype.reuse_or_build(
+            self._terminal_prototype,
+            self.input_data,
+            self.terminal_config,
+        )
+        return self._terminal_prototype.terminal
 
     def __iter__(self) -> BaseEffectIterator:
         """Create and return a new iterator for the effect.
@@ -178,6 +238,8 @@ class BaseEffect(ABC, Generic[T]):
         Args:
             end_symbol (str, optional): Symbol to print after the effect has completed. Defaults to newline.
 
+        The yielded Terminal is a clone of the effect's prototype Terminal, so the input is not parsed again.
+
         Yields:
             Terminal: Terminal object for handling output.
 
@@ -186,7 +248,7 @@ class BaseEffect(ABC, Generic[T]):
                 after the terminal state is restored.
 
         """
-        terminal = Terminal(self.input_data, self.terminal_config)
+        terminal = self._get_terminal_prototype()._clone()
         try:
             terminal.prep_canvas()
             yield terminal
@@ -12,7 +12,7 @@ from __future__ import annotations
 import typing
 from dataclasses import dataclass
 
-from terminaltexteffects.utils import easing, geometry
+from terminaltexteffects.utils import caches, easing, geometry
 from terminaltexteffects.utils.exceptions import (
     ActivateEmptyPathError,
     DuplicatePathIDError,
@@ -83,6 +83,72 @@ class Segment:
         return hash((self.start, self.end))
 
 
+def _compile_step_plan(
+    segment_distances: tuple[float, ...],
+    total_distance: float,
+    max_steps: int,
+    ease: easing.EasingFunction | None,
+) -> tuple[tuple[int, float, float, tuple[tuple[int, bool], ...]], ...]:
+    """Compile the per-step segment positions and segment events for a path.
+
+    The plan only depends on the segment distances, so it is shared by every path with the same
+    distances, speed, and easing, such as paths that are identical up to translation. Coordinates
+    are resolved from the plan by each path because rounding to the terminal grid depends on the
+    absolute coordinates.
+
+    Args:
+        segment_distances (tuple[float, ...]): The distance of each segment, including the origin segment.
+        total_distance (float): The total distance of the path.
+        max_steps (int): The number of steps in the path.
+        ease (easing.EasingFunction | None): The easing function applied across the path.
+
+    Returns:
+        tuple[tuple[int, float, float, tuple[tuple[int, bool], ...]], ...]: For each step, the index of the
+            active segment, the distance factor along the active segment, the distance reached along the path,
+            and the (segment index, is exit) pairs of the segment events triggered by the step, in order.
+
+    """
+    plan = []
+    entered = [False] * len(segment_distances)
+    exited = [False] * len(segment_distances)
+    for step in range(1, max_steps + 1):
+        distance_factor = ease(step / max_steps) if ease else step / max_steps
+        distance_to_travel = distance_factor * total_distance
+        distance_reached = distance_to_travel
+        events: list[tuple[int, bool]] = []
+        for segment_index, segment_distance in enumerate(segment_distances):
+            if distance_to_travel <= segment_distance:
+                active_index = segment_index
+                if not entered[segment_index]:
+                    entered[segment_index] = True
+                    events.append((segment_index, False))
+                break
+            distance_to_travel -= segment_distance
+            if not entered[segment_index]:
+                entered[segment_index] = True
+                events.append((segment_index, False))
+            if not exited[segment_index]:
+                exited[segment_index] = True
+                events.append((segment_index, True))
+        # if the distance_to_travel is further than the last waypoint,
+        # preserve the distance from the start of the final segment
+        else:
+            active_index = len(segment_distances) - 1
+            distance_to_travel += segment_distances[active_index]
+        active_distance = segment_distances[active_index]
+        if active_distance == 0:
+            segment_distance_to_travel_factor = 0.0
+        elif ease:
+            segment_distance_to_travel_factor = distance_to_travel / active_distance
+        else:
+            segment_distance_to_travel_factor = min((distance_to_travel / active_distance, 1))
+        plan.append((active_index, segment_distance_to_travel_factor, distance_reached, tuple(events)))
+    return tuple(plan)
+
+
+_compile_step_plan = caches.register(_compile_step_plan, maxsize=1024)
+
+
 @dataclass
 class Path:
     """Represents a path consisting of multiple waypoints for motion.
@@ -133,6 +199,9 @@ class Path:
         self.hold_time_remaining = self.hold_time
         self.last_distance_reached: float = 0  # used for animation syncing to distance
         self.origin_segment: Segment | None = None
+        # step plan and coordinates are compiled on the first step after the segments change
+        self._step_plan: tuple[tuple[int, float, float, tuple[tuple[int, bool], ...]], ...] | None = None
+        self._step_coords: list[Coord | None] = []
         if self.speed <= 0:
             raise PathInvalidSpeedError(self.speed)
 
@@ -205,6 +274,12 @@ class Path:
         self.total_distance += distance_from_previous
         self.segments.append(Segment(self.waypoints[-2], waypoint, distance_from_previous))
         self.max_steps = round(self.total_distance / self.speed)
+        self._invalidate_steps()
+
+    def _invalidate_steps(self) -> None:
+        """Discard the compiled step plan and coordinates after the segments change."""
+        self._step_plan = None
+        self._step_coords = []
 
     def query_waypoint(self, waypoint_id: str) -> Waypoint:
         """Return the waypoint with the given waypoint_id.
@@ -228,6 +303,10 @@ class Path:
         total distance, bezier control points, and the easing function if provided. It also handles the triggering
         of segment enter and exit events.
 
+        On the first step after the segments change, the path compiles a step plan holding the active segment,
+        distance, and segment events for every step. Plans are shared between paths with the same segment
+        distances, speed, and easing. Coordinates are computed once per step and reused until the segments change.
+
         Args:
             event_handler (base_character.EventHandler): The EventHandler for the character.
 
@@ -238,53 +317,47 @@ class Path:
         if not self.max_steps or self.current_step >= self.max_steps or not self.total_distance:
             # if the path has zero distance or there are no more steps, return the final waypoint coordinate
             return self.segments[-1].end.coord
+        if self._step_plan is None:
+            self._step_plan = _compile_step_plan(
+                tuple(segment.distance for segment in self.segments),
+                self.total_distance,
+                self.max_steps,
+                self.ease,
+            )
+            self._step_coords = [None] * self.max_steps
+        step_index = self.current_step
         self.current_step += 1
-        if self.ease:
-            distance_factor = self.ease(self.current_step / self.max_steps)
-        else:
-            distance_factor = self.current_step / self.max_steps
-
-        distance_to_travel = distance_factor * self.total_distance
-        self.last_distance_reached = distance_to_travel
-        for segment in self.segments:
-            if distance_to_travel <= segment.distance:
-                active_segment = segment
-                if not segment.enter_event_triggered:
-                    segment.enter_event_triggered = True
-                    event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
-                break
-            distance_to_travel -= segment.distance
-            if not segment.enter_event_triggered:
+        segments = self.segments
+        step_coords = self._step_coords
+        segment_index, segment_distance_to_travel_factor, distance_reached, segment_events = self._step_plan[step_index]
+        self.last_distance_reached = distance_reached
+        active_segment = segments[segment_index]
+        for event_segment_index, is_exit in segment_events:
+            segment = segments[event_segment_index]
+            if is_exit:
+                if not segment.exit_event_triggered:
+                    segment.exit_event_triggered = True
+                    event_handler._handle_event(event_handler.Event.SEGMENT_EXITED, segment.end)
+            elif not segment.enter_event_triggered:
                 segment.enter_event_triggered = True
                 event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
-            if not segment.exit_event_triggered:
-                segment.exit_event_triggered = True
-                event_handler._handle_event(event_handler.Event.SEGMENT_EXITED, segment.end)
-        # if the distance_to_travel is further than the last waypoint,
-        # preserve the distance from the start of the final segment
-        else:
-            active_segment = self.segments[-1]
-            distance_to_travel += active_segment.distance
-        if active_segment.distance == 0:
-            segment_distance_to_travel_factor = 0.0
-        elif self.ease:
-            segment_distance_to_travel_factor = distance_to_travel / active_segment.distance
-        else:
-            segment_distance_to_travel_factor = min((distance_to_travel / active_segment.distance, 1))
-
-        if active_segment.end.bezier_control:
-            next_coord = geometry.find_coord_on_bezier_curve(
-                active_segment.start.coord,
-                active_segment.end.bezier_control,
-                active_segment.end.coord,
-                segment_distance_to_travel_factor,
-            )
-        else:
-            next_coord = geometry.find_coord_on_line(
-                active_segment.start.coord,
-                active_segment.end.coord,
-                segment_distance_to_travel_factor,
-            )
+
+        next_coord = step_coords[step_index]
+        if next_coord is None:
+            if active_segment.end.bezier_control:
+                next_coord = geometry.find_coord_on_bezier_curve(
+                    active_segment.start.coord,
+                    active_segment.end.bezier_control,
+                    active_segment.end.coord,
+                    segment_distance_to_travel_factor,
+                )
+            else:
+                next_coord = geometry.find_coord_on_line(
+                    active_segment.start.coord,
+                    active_segment.end.coord,
+                    segment_distance_to_travel_factor,
+                )
+            step_coords[step_index] = next_coord
 
         return next_coord
 
@@ -352,10 +425,45 @@ class Motion:
         """
         self.paths: dict[str, Path] = {}
         self.character = character
-        self.current_coord: Coord = Coord(character.input_coord.column, character.input_coord.row)
+        self._current_coord: Coord = Coord(character.input_coord.column, character.input_coord.row)
         self.previous_coord: Coord = Coord(-1, -1)
         self.active_path: Path | None = None
 
+    def _clone(self, character: base_character.EffectCharacter) -> Motion:
+        """Return a new Motion for the character at this Motion's current coordinate.
+
+        Paths are not copied.
+
+        Args:
+            character (base_character.EffectCharacter): The EffectCharacter to move.
+
+        Returns:
+            Motion: The new Motion.
+
+        """
+        clone = Motion.__new__(Motion)
+        clone.paths = {}
+        clone.character = character
+        clone._current_coord = self._current_coord
+        clone.previous_coord = self.previous_coord
+        clone.active_path = None
+        return clone
+
+    @property
+    def current_coord(self) -> Coord:
+        """The current coordinate of the character.
+
+        Setting the coordinate keeps the terminal's spatial index of current coordinates up to date.
+        Use `set_coordinate` to also wake the character if it is parked by an effect iterator.
+        """
+        return self._current_coord
+
+    @current_coord.setter
+    def current_coord(self, coord: Coord) -> None:
+        self._current_coord = coord
+        if self.character._spatial_index is not None:
+            self.character._spatial_index.move(self.character, coord)
+
     def set_coordinate(self, coord: Coord) -> None:
         """Set the current coordinate to the given coordinate.
 
@@ -363,6 +471,7 @@ class Motion:
             coord (Coord): coordinate
 
         """
+        self.character._wake()
         self.current_coord = coord
 
     def new_path(
@@ -445,6 +554,39 @@ class Motion:
         """
         return self.active_path is None
 
+    def _get_idle_ticks(self) -> int | None:
+        """Return the number of upcoming moves that will not change the motion.
+
+        A character is only idle while holding at the end of its active path, after the
+        `PATH_HOLDING` event has been triggered. The final hold tick is never idle because it
+        loops or completes the path.
+
+        Returns:
+            int | None: The number of idle moves, or None if there is no active path to move along.
+
+        """
+        path = self.active_path
+        if path is None:
+            return None
+        if (
+            path.current_step == path.max_steps
+            and 0 < path.hold_time_remaining != path.hold_time
+            and self.current_coord == path.segments[-1].end.coord
+        ):
+            return path.hold_time_remaining
+        return 0
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Apply idle moves to the active path without moving the character.
+
+        Args:
+            ticks (int): The number of idle moves to apply. Must not exceed `_get_idle_ticks()`.
+
+        """
+        self.previous_coord = self.current_coord
+        if self.active_path is not None:
+            self.active_path.hold_time_remaining -= ticks
+
     def chain_paths(self, paths: list[Path], *, loop: bool = False) -> None:
         """Create a chain of paths.
 
@@ -496,6 +638,7 @@ class Motion:
             path (Path | str): The path to activate. Must be the Path itself, or the Path's ID.
 
         """
+        self.character._wake()
         if isinstance(path, str):
             found_path = self.query_path(path)
             if found_path is None:
@@ -523,6 +666,9 @@ class Motion:
             first_waypoint,
             distance_to_first_waypoint,
         )
+        previous_total_distance = self.active_path.total_distance
+        previous_origin_segment = self.active_path.origin_segment
+        previous_max_steps = self.active_path.max_steps
         self.active_path.total_distance += distance_to_first_waypoint
         if self.active_path.origin_segment:
             self.active_path.total_distance -= self.active_path.origin_segment.distance
@@ -533,6 +679,13 @@ class Motion:
         self.active_path.current_step = 0
         self.active_path.hold_time_remaining = self.active_path.hold_time
         self.active_path.max_steps = round(self.active_path.total_distance / self.active_path.speed)
+        # reactivating from the same coordinate keeps the compiled steps
+        if (
+            new_origin_segment != previous_origin_segment
+            or self.active_path.total_distance != previous_total_distance
+            or self.active_path.max_steps != previous_max_steps
+        ):
+            self.active_path._invalidate_steps()
         for segment in self.active_path.segments:
             segment.enter_event_triggered = False
             segment.exit_event_triggered = False
@@ -560,8 +713,10 @@ class Motion:
             PathNotFoundError: If `path` is a string and no path with that ID exists.
 
         """
+        self.character._wake()
         if path is None:
             self.active_path = None
+            self.character._deactivation_reported = True
             return
         if isinstance(path, str):
             found_path = self.query_path(path)
@@ -571,6 +726,7 @@ class Motion:
             found_path = path
         if self.active_path and self.active_path is found_path:
             self.active_path = None
+            self.character._deactivation_reported = True
 
     def move(self) -> None:
         """Move the character along the active path.
@@ -0,0 +1,148 @@
+"""Run a sequence of effects back to back on the same input and canvas.
+
+Classes:
+    EffectPlaylist: A sequence of effects that share the input data, terminal configuration, and canvas.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, TypeVar
+
+from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig, TerminalPrototype
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from terminaltexteffects.engine.base_effect import BaseEffect
+
+T = TypeVar("T", bound=BaseConfig)
+
+
+class EffectPlaylist:
+    """A sequence of effects that share the input data, terminal configuration, and canvas.
+
+    The input data is parsed into a `TerminalPrototype` once and passed to every effect added to the playlist.
+    Iterating the playlist yields the frames of each effect in turn, and `terminal_output()` prepares the
+    canvas once for the whole playlist with a clone of the prototype.
+
+    Example:
+        ```python
+        from terminaltexteffects.effects.effect_colorshift import ColorShift
+        from terminaltexteffects.effects.effect_decrypt import Decrypt
+        from terminaltexteffects.engine.playlist import EffectPlaylist
+
+        playlist = EffectPlaylist("EXAMPLE TEXT")
+        playlist.add_effect(Decrypt)
+        playlist.add_effect(ColorShift).effect_config.cycles = 1
+        with playlist.terminal_output() as terminal:
+            for frame in playlist:
+                terminal.print(frame)
+        ```
+
+    Args:
+        input_data (str): Text to which the effects will be applied.
+        terminal_config (TerminalConfig | None, optional): Terminal configuration shared by the effects. If not
+            provided, a new configuration will be built with default values. Defaults to None.
+
+    Attributes:
+        input_data (str): Text to which the effects will be applied.
+        terminal_config (TerminalConfig): Terminal configuration shared by the effects.
+        effects (list[BaseEffect]): The effects in the order they are played.
+
+    Methods:
+        add_effect: Add an effect to the end of the playlist.
+        terminal_output: Context manager for terminal output across all effects in the playlist.
+
+    """
+
+    def __init__(self, input_data: str, terminal_config: TerminalConfig | None = None) -> None:
+        """Initialize the playlist with the input data.
+
+        Args:
+            input_data (str): Text to which the effects will be applied.
+            terminal_config (TerminalConfig | None, optional): Terminal configuration shared by the effects. If not
+                provided, a new configuration will be built with default values. Defaults to None.
+
+        """
+        self.input_data = input_data
+        self.terminal_config: TerminalConfig = terminal_config or TerminalConfig._build_config()
+        self.effects: list[BaseEffect] = []
+        self._terminal_prototype: TerminalPrototype | None = None
+
+    def add_effect(self, effect_class: type[BaseEffect[T]], effect_config: T | None = None) -> BaseEffect[T]:
+        """Add an effect to the end of the playlist.
+
+        Args:
+            effect_class (type[BaseEffect]): The effect class to play.
+            effect_config (BaseConfig | None, optional): Effect configuration. If not provided, a new configuration
+                will be built with default values. Defaults to None.
+
+        Returns:
+            BaseEffect: The added effect. Its `effect_config` can be modified before the playlist is played.
+
+        """
+        self._terminal_prototype = TerminalPrototype.reuse_or_build(
+            self._terminal_prototype,
+            self.input_data,
+            self.terminal_config,
+        )
+        effect = effect_class(
+            self.input_data,
+            effect_config,
+            self.terminal_config,
+            terminal_prototype=self._terminal_prototype,
+        )
+        self.effects.append(effect)
+        return effect
+
+    def _get_terminal_prototype(self) -> Terminal:
+        """Return the prototype Terminal for the current input data and terminal configuration.
+
+        Returns:
+            Terminal: The prototype Terminal.
+
+        """
+        self._terminal_prototype = TerminalPrototype.reuse_or_build(
+            self._terminal_prototype,
+            self.input_data,
+            self.terminal_config,
+        )
+        return self._terminal_prototype.terminal
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the frames of each effect in the playlist in turn.
+
+        Effects use the playlist's prototype Terminal. An effect whose `input_data` or `terminal_config`
+        have been changed to differ from the playlist's builds its own.
+
+        Yields:
+            str: The next frame.
+
+        """
+        for effect in self.effects:
+            yield from effect
+
+    @contextmanager
+    def terminal_output(self, end_symbol: str = "\n") -> Generator[Terminal, None, None]:
+        """Context manager for terminal output. Prepares the terminal once for all effects and restores it after.
+
+        Args:
+            end_symbol (str, optional): Symbol to print after the last effect has completed. Defaults to newline.
+
+        Yields:
+            Terminal: Terminal object for handling output.
+
+        Raises:
+            Exception: Any exception that occurs within the context manager is re-raised
+                after the terminal state is restored.
+
+        """
+        terminal = self._get_terminal_prototype()._clone()
+        try:
+            terminal.prep_canvas()
+            yield terminal
+
+        finally:
+            terminal.restore_cursor(end_symbol)
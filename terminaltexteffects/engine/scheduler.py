@@ -0,0 +1,114 @@
+"""Scheduling of idle characters for effect iterators.
+
+Many characters spend most of their active lifetime waiting: counting down a long `Frame.duration`
+or a `Path.hold_time`. Ticking those characters every frame produces no observable change. The
+`TimerWheel` parks such characters until the tick on which their state will next change, so the
+per-frame cost of `BaseEffectIterator.update` scales with the characters that actually change.
+
+Classes:
+    TimerWheel: A hashed timer wheel that parks idle characters and wakes them when they are due.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import KeysView
+
+    from terminaltexteffects.engine.base_character import EffectCharacter
+
+
+class TimerWheel:
+    """A hashed timer wheel that parks idle characters and wakes them when they are due.
+
+    Characters are parked for a number of idle ticks reported by `EffectCharacter._get_idle_ticks`.
+    Each parked character is placed in the slot for the tick on which it must next be ticked.
+    When the wheel advances to that tick, the skipped idle ticks are applied to the character in
+    a single step and the character is returned to the caller to be ticked normally.
+
+    A parked character is woken early when its animation or motion is changed through the public
+    API (activating/deactivating a scene or path, setting the appearance or coordinate, or calling
+    `EffectCharacter.tick` directly). Only the idle ticks that have actually elapsed are applied.
+
+    Attributes:
+        current_tick (int): The number of times the wheel has been advanced.
+        MIN_IDLE_TICKS (int): Characters with fewer idle ticks than this are not parked.
+
+    """
+
+    MIN_IDLE_TICKS = 2
+
+    def __init__(self) -> None:
+        """Initialize an empty timer wheel."""
+        self.current_tick = 0
+        self._slots: dict[int, list[EffectCharacter]] = {}
+        self._parked: dict[EffectCharacter, tuple[int, int]] = {}
+
+    @property
+    def parked(self) -> KeysView[EffectCharacter]:
+        """Return a view of the currently parked characters."""
+        return self._parked.keys()
+
+    def __len__(self) -> int:
+        """Return the number of currently parked characters."""
+        return len(self._parked)
+
+    def __contains__(self, character: object) -> bool:
+        """Return whether the character is currently parked."""
+        return character in self._parked
+
+    def park(self, character: EffectCharacter, idle_ticks: int) -> None:
+        """Park a character for the given number of idle ticks.
+
+        The character is due on the tick following its idle ticks.
+
+        Args:
+            character (EffectCharacter): The character to park.
+            idle_ticks (int): The number of upcoming ticks that will not change the character.
+
+        """
+        wake_tick = self.current_tick + idle_ticks + 1
+        self._parked[character] = (self.current_tick, wake_tick)
+        self._slots.setdefault(wake_tick, []).append(character)
+        character._timer_wheel = self
+
+    def wake(self, character: EffectCharacter) -> None:
+        """Remove a character from the wheel and apply the idle ticks that have elapsed.
+
+        Args:
+            character (EffectCharacter): The character to wake. Characters that are not parked are ignored.
+
+        """
+        entry = self._parked.pop(character, None)
+        if entry is None:
+            return
+        park_tick, wake_tick = entry
+        character._timer_wheel = None
+        character._skip_idle_ticks(min(self.current_tick, wake_tick - 1) - park_tick)
+
+    def wake_all(self) -> None:
+        """Wake every parked character."""
+        for character in list(self._parked):
+            self.wake(character)
+        self._slots.clear()
+
+    def advance(self) -> list[EffectCharacter]:
+        """Advance the wheel by one tick and wake the characters that are due.
+
+        Returns:
+            list[EffectCharacter]: Characters that were due on this tick. They must be ticked by the caller.
+
+        """
+        self.current_tick += 1
+        due = self._slots.pop(self.current_tick, None)
+        if not due:
+            return []
+        woken = []
+        for character in due:
+            entry = self._parked.get(character)
+            # characters woken early or re-parked have stale slot entries
+            if entry is not None and entry[1] == self.current_tick:
+                self.wake(character)
+                woken.append(character)
+        return woken
@@ -0,0 +1,233 @@
+"""Spatial indexing of characters for range queries.
+
+Effects that look up the characters near a point every frame, such as the beams in the Spotlights effect, would
+otherwise enumerate every coordinate in the query area and look each one up individually. The `SpatialIndex`
+stores characters in a uniform grid of buckets so a query only visits the buckets that overlap the query area.
+
+Query shapes match the coordinate functions in `terminaltexteffects.utils.geometry`, so
+`get_characters_in_circle(center, diameter)` returns the characters located at the coordinates returned by
+`geometry.find_coords_in_circle(center, diameter)`.
+
+Classes:
+    SpatialIndex: A uniform grid of buckets for range queries over character coordinates.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from terminaltexteffects.utils import caches
+
+if TYPE_CHECKING:
+    from terminaltexteffects.engine.base_character import EffectCharacter
+    from terminaltexteffects.utils.geometry import Coord
+
+
+def _get_circle_row_offsets(diameter: int) -> tuple[int, ...]:
+    """Return the maximum row offset for each column offset within the circle with the given diameter.
+
+    The offsets are calculated exactly as in `geometry.find_coords_in_circle`.
+
+    Args:
+        diameter (int): The length of the major axis of the circle.
+
+    Returns:
+        tuple[int, ...]: The maximum row offset, indexed by the absolute column offset from the center.
+
+    """
+    a_squared = diameter**2
+    b_squared = (diameter / 2) ** 2
+    return tuple(int((b_squared * (1 - (offset**2) / a_squared)) ** 0.5) for offset in range(diameter + 1))
+
+
+_get_circle_row_offsets = caches.register(_get_circle_row_offsets, maxsize=1024)
+
+
+class SpatialIndex:
+    """A uniform grid of buckets for range queries over character coordinates.
+
+    Each character is stored at a single coordinate in the bucket containing that coordinate. Moving a
+    character only touches its buckets when it crosses a bucket boundary.
+
+    Characters are returned in bucket order, then in the order they entered the bucket. Callers that need a
+    specific order should sort the results.
+
+    Attributes:
+        bucket_size (int): The width and height of each bucket, in cells.
+
+    """
+
+    def __init__(self, bucket_size: int = 8) -> None:
+        """Initialize an empty spatial index.
+
+        Args:
+            bucket_size (int, optional): The width and height of each bucket, in cells. Defaults to 8.
+
+        Raises:
+            ValueError: If the bucket size is less than 1.
+
+        """
+        if bucket_size < 1:
+            msg = f"Bucket size must be at least 1, got {bucket_size}."
+            raise ValueError(msg)
+        self.bucket_size = bucket_size
+        self._buckets: dict[tuple[int, int], dict[EffectCharacter, Coord]] = {}
+        self._bucket_by_character: dict[EffectCharacter, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of characters in the index."""
+        return len(self._bucket_by_character)
+
+    def __contains__(self, character: object) -> bool:
+        """Return whether the character is in the index."""
+        return character in self._bucket_by_character
+
+    def _get_bucket_key(self, coord: Coord) -> tuple[int, int]:
+        """Return the key of the bucket containing the coordinate."""
+        return (coord.column // self.bucket_size, coord.row // self.bucket_size)
+
+    def get_coord(self, character: EffectCharacter) -> Coord | None:
+        """Return the coordinate the character is stored at, or None if it is not in the index.
+
+        Args:
+            character (EffectCharacter): The character.
+
+        Returns:
+            Coord | None: The coordinate of the character in the index.
+
+        """
+        bucket_key = self._bucket_by_character.get(character)
+        if bucket_key is None:
+            return None
+        return self._buckets[bucket_key][character]
+
+    def insert(self, character: EffectCharacter, coord: Coord) -> None:
+        """Store the character at the coordinate, moving it if it is already in the index.
+
+        Args:
+            character (EffectCharacter): The character.
+            coord (Coord): The coordinate of the character.
+
+        """
+        bucket_key = self._get_bucket_key(coord)
+        previous_bucket_key = self._bucket_by_character.get(character)
+        if previous_bucket_key == bucket_key:
+            self._buckets[bucket_key][character] = coord
+            return
+        if previous_bucket_key is not None:
+            self._remove_from_bucket(character, previous_bucket_key)
+        self._buckets.setdefault(bucket_key, {})[character] = coord
+        self._bucket_by_character[character] = bucket_key
+
+    move = insert
+
+    def remove(self, character: EffectCharacter) -> None:
+        """Remove the character from the index. Characters not in the index are ignored.
+
+        Args:
+            character (EffectCharacter): The character.
+
+        """
+        bucket_key = self._bucket_by_character.pop(character, None)
+        if bucket_key is not None:
+            self._remove_from_bucket(character, bucket_key)
+
+    def _remove_from_bucket(self, character: EffectCharacter, bucket_key: tuple[int, int]) -> None:
+        """Remove the character from the bucket, discarding the bucket if it becomes empty."""
+        bucket = self._buckets[bucket_key]
+        del bucket[character]
+        if not bucket:
+            del self._buckets[bucket_key]
+
+    def clear(self) -> None:
+        """Remove all characters from the index."""
+        self._buckets.clear()
+        self._bucket_by_character.clear()
+
+    def _iter_buckets(self, left: int, bottom: int, right: int, top: int) -> list[dict[EffectCharacter, Coord]]:
+        """Return the non-empty buckets overlapping the area bounded by the given columns and rows."""
+        buckets = self._buckets
+        bucket_size = self.bucket_size
+        first_row_key = bottom // bucket_size
+        last_row_key = top // bucket_size
+        overlapping_buckets: list[dict[EffectCharacter, Coord]] = []
+        for column_key in range(left // bucket_size, right // bucket_size + 1):
+            for row_key in range(first_row_key, last_row_key + 1):
+                bucket = buckets.get((column_key, row_key))
+                if bucket is not None:
+                    overlapping_buckets.append(bucket)
+        return overlapping_buckets
+
+    def get_characters_in_bounds(self, left: int, bottom: int, right: int, top: int) -> list[EffectCharacter]:
+        """Return the characters within the area bounded by the given columns and rows, inclusive.
+
+        Args:
+            left (int): The leftmost column.
+            bottom (int): The bottom row.
+            right (int): The rightmost column.
+            top (int): The top row.
+
+        Returns:
+            list[EffectCharacter]: The characters within the area.
+
+        """
+        if left > right or bottom > top:
+            return []
+        return [
+            character
+            for bucket in self._iter_buckets(left, bottom, right, top)
+            for character, coord in bucket.items()
+            if left <= coord.column <= right and bottom <= coord.row <= top
+        ]
+
+    def get_characters_in_rect(self, origin: Coord, distance: int) -> list[EffectCharacter]:
+        """Return the characters at the coordinates returned by `geometry.find_coords_in_rect(origin, distance)`.
+
+        Args:
+            origin (Coord): The center of the rectangle.
+            distance (int): The distance from the origin in each direction. A distance of `0` returns an
+                empty list.
+
+        Returns:
+            list[EffectCharacter]: The characters within the rectangle.
+
+        """
+        if distance <= 0:
+            return []
+        return self.get_characters_in_bounds(
+            origin.column - distance,
+            origin.row - distance,
+            origin.column + distance,
+            origin.row + distance,
+        )
+
+    def get_characters_in_circle(self, center: Coord, diameter: int) -> list[EffectCharacter]:
+        """Return the characters at the coordinates returned by `geometry.find_coords_in_circle(center, diameter)`.
+
+        The shape is an ellipse with a major axis of length diameter, which appears as a circle due to the
+        terminal cell height/width ratio.
+
+        Args:
+            center (Coord): The center of the circle.
+            diameter (int): The length of the major axis of the circle.
+
+        Returns:
+            list[EffectCharacter]: The characters within the circle.
+
+        """
+        if diameter <= 0:
+            return []
+        row_offsets = _get_circle_row_offsets(diameter)
+        center_column, center_row = center.column, center.row
+        characters: list[EffectCharacter] = []
+        for bucket in self._iter_buckets(
+            center_column - diameter,
+            center_row - row_offsets[0],
+            center_column + diameter,
+            center_row + row_offsets[0],
+        ):
+            for character, coord in bucket.items():
+                column_offset = abs(coord.column - center_column)
+                if column_offset <= diameter and abs(coord.row - center_row) <= row_offsets[column_offset]:
+                    characters.append(character)
+        return characters
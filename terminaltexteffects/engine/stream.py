@@ -0,0 +1,320 @@
+"""Animate lines of text on a scrolling canvas as they are read from a stream.
+
+Classes:
+    EffectStream: Runs effects on lines of a text stream as they arrive, on one canvas that scrolls like a log.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from copy import deepcopy
+from itertools import groupby
+from typing import TYPE_CHECKING, TypeVar
+
+from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.playlist import EffectPlaylist
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+    from typing import TextIO
+
+    from terminaltexteffects.engine.base_effect import BaseEffect
+
+T = TypeVar("T", bound=BaseConfig)
+
+
+class _LineReader:
+    """Read lines from a text stream on a background thread.
+
+    Lines are appended to a buffer as soon as they are read, so the producer is never blocked by
+    the consumer. When `max_lines` is given, the oldest buffered lines are dropped once the buffer
+    holds `max_lines` lines.
+
+    Args:
+        input_stream (TextIO): Stream to read lines from.
+        max_lines (int | None, optional): Maximum number of lines to buffer. Defaults to None.
+
+    """
+
+    def __init__(self, input_stream: TextIO, max_lines: int | None = None) -> None:
+        """Start reading lines from the stream.
+
+        Args:
+            input_stream (TextIO): Stream to read lines from.
+            max_lines (int | None, optional): Maximum number of lines to buffer. Defaults to None.
+
+        """
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._condition = threading.Condition()
+        self._closed = False
+        threading.Thread(target=self._read_lines, args=(input_stream,), daemon=True).start()
+
+    def _read_lines(self, input_stream: TextIO) -> None:
+        """Append each line read from the stream to the buffer until the stream is closed.
+
+        Args:
+            input_stream (TextIO): Stream to read lines from.
+
+        """
+        try:
+            for line in input_stream:
+                with self._condition:
+                    self._lines.append(line)
+                    self._condition.notify_all()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+
+    def drain(self) -> list[str]:
+        """Remove and return every buffered line.
+
+        Returns:
+            list[str]: The buffered lines, oldest first.
+
+        """
+        with self._condition:
+            lines = list(self._lines)
+            self._lines.clear()
+        return lines
+
+    def wait(self) -> bool:
+        """Block until a line is buffered or the stream is closed.
+
+        Returns:
+            bool: True if a line is buffered, False if the stream is closed and every line has been drained.
+
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._lines or self._closed)
+            return bool(self._lines)
+
+
+class _StreamSegment:
+    """A block of consecutive lines on the stream canvas and the frames animating it.
+
+    Args:
+        rows (list[str]): The rendered rows of the block, top row first.
+        frames (Iterator[str] | None, optional): Frames animating the block. Defaults to None.
+
+    """
+
+    def __init__(self, rows: list[str], frames: Iterator[str] | None = None) -> None:
+        """Initialize the segment and render its first frame.
+
+        Args:
+            rows (list[str]): The rendered rows of the block, top row first.
+            frames (Iterator[str] | None, optional): Frames animating the block. Defaults to None.
+
+        """
+        self.rows = rows
+        self.frames = frames
+        self.advance()
+
+    def advance(self) -> None:
+        """Replace the rows with the next frame, keeping the last frame once the animation is complete."""
+        if self.frames is None:
+            return
+        try:
+            self.rows = next(self.frames).split("\n")
+        except StopIteration:
+            self.frames = None
+
+
+class EffectStream:
+    """Run effects on lines of a text stream as they arrive, on one canvas that scrolls like a log.
+
+    Lines are read on a background thread. Each block of lines that arrives between two frames is
+    animated by its own run of the effects while earlier blocks continue animating, and the canvas
+    scrolls up to make room for it. Rows that scroll off the top of the canvas are dropped along with
+    their animation, so memory and work are bounded by the canvas height rather than the length of
+    the input. The canvas height is `canvas_height` when it is set to a positive value, and otherwise
+    the terminal height. Blank lines are kept as blank rows but are not animated.
+
+    Example:
+        ```python
+        import sys
+
+        from terminaltexteffects.effects.effect_print import Print
+        from terminaltexteffects.engine.stream import EffectStream
+
+        stream = EffectStream(sys.stdin)
+        stream.add_effect(Print)
+        if stream.wait_for_input():
+            with stream.terminal_output() as terminal:
+                for frame in stream:
+                    terminal.print(frame)
+        ```
+
+    Args:
+        input_stream (TextIO | None, optional): Stream to read lines from. Nothing is read from a TTY.
+            Defaults to `sys.stdin`.
+        terminal_config (TerminalConfig | None, optional): Terminal configuration for the canvas and the effects. If
+            not provided, a new configuration will be built with default values. Defaults to None.
+
+    Attributes:
+        terminal_config (TerminalConfig): Terminal configuration for the canvas and the effects.
+        effects (list[BaseEffect]): The effects run on each block of lines, in the order they are played. Each block
+            is played with the classes and `effect_config` of these effects.
+
+    Methods:
+        add_effect: Add an effect to the end of the effects run on each block of lines.
+        wait_for_input: Block until a non-blank line has been read or the stream is closed.
+        terminal_output: Context manager for terminal output across the whole stream.
+
+    """
+
+    def __init__(self, input_stream: TextIO | None = None, terminal_config: TerminalConfig | None = None) -> None:
+        """Initialize the canvas and start reading lines from the stream.
+
+        Args:
+            input_stream (TextIO | None, optional): Stream to read lines from. Nothing is read from a TTY.
+                Defaults to `sys.stdin`.
+            terminal_config (TerminalConfig | None, optional): Terminal configuration for the canvas and the effects.
+                If not provided, a new configuration will be built with default values. Defaults to None.
+
+        """
+        self.terminal_config: TerminalConfig = terminal_config or TerminalConfig._build_config()
+        self.effects: list[BaseEffect] = []
+        canvas_config = deepcopy(self.terminal_config)
+        # The input dimensions are unknown up front, so the canvas falls back to the terminal dimensions.
+        canvas_config.canvas_width = max(canvas_config.canvas_width, 0)
+        canvas_config.canvas_height = max(canvas_config.canvas_height, 0)
+        self._terminal = Terminal("", canvas_config)
+        self._canvas_height = self._terminal.visible_top - self._terminal.visible_bottom + 1
+        self._canvas_width = self._terminal.visible_right - self._terminal.visible_left + 1
+        self._pending: list[str] = []
+        input_stream = input_stream or sys.stdin
+        if input_stream.isatty():
+            input_stream = io.StringIO()
+        self._reader = _LineReader(input_stream, self._canvas_height)
+
+    def add_effect(self, effect_class: type[BaseEffect[T]], effect_config: T | None = None) -> BaseEffect[T]:
+        """Add an effect to the end of the effects run on each block of lines.
+
+        Args:
+            effect_class (type[BaseEffect]): The effect class to play.
+            effect_config (BaseConfig | None, optional): Effect configuration. If not provided, a new configuration
+                will be built with default values. Defaults to None.
+
+        Returns:
+            BaseEffect: The added effect. Its `effect_config` can be modified before the stream is played.
+
+        """
+        effect = effect_class("", effect_config, self.terminal_config)
+        self.effects.append(effect)
+        return effect
+
+    def wait_for_input(self) -> bool:
+        """Block until a non-blank line has been read or the stream is closed.
+
+        Returns:
+            bool: True if a non-blank line has been read, False if the stream closed without one.
+
+        """
+        while not any(line.strip() for line in self._pending):
+            if not self._reader.wait():
+                return False
+            self._pending = [*self._pending, *self._reader.drain()][-self._canvas_height :]
+        return True
+
+    def _get_segments(self, lines: list[str]) -> Iterator[_StreamSegment]:
+        """Split lines into blocks of blank and non-blank lines and yield a segment for each.
+
+        Args:
+            lines (list[str]): Lines read from the stream, including line endings.
+
+        Yields:
+            _StreamSegment: A static segment for each block of blank lines, or an animated segment for each block
+                of non-blank lines.
+
+        """
+        segment_config = deepcopy(self.terminal_config)
+        segment_config.canvas_width = self._canvas_width
+        segment_config.canvas_height = -1
+        segment_config.anchor_canvas = "sw"
+        segment_config.ignore_terminal_dimensions = False
+        segment_config.reuse_canvas = False
+        segment_config.frame_rate = 0
+        for is_blank, block_lines in groupby((line.rstrip("\r\n") for line in lines), lambda line: not line.strip()):
+            block = list(block_lines)
+            if is_blank:
+                yield _StreamSegment([" " * self._canvas_width] * len(block))
+                continue
+            playlist = EffectPlaylist("\n".join(block), segment_config)
+            for effect in self.effects:
+                playlist.add_effect(type(effect), effect.effect_config)
+            yield _StreamSegment([], iter(playlist))
+
+    def _get_frame(self, segments: deque[_StreamSegment]) -> str:
+        """Return the canvas frame for the rows of the segments that fit on the canvas.
+
+        Args:
+            segments (deque[_StreamSegment]): The segments on the canvas, oldest first.
+
+        Returns:
+            str: The formatted frame, top row first.
+
+        """
+        rows = [row for segment in segments for row in segment.rows][-self._canvas_height :]
+        rows = [" " * self._canvas_width] * (self._canvas_height - len(rows)) + rows
+        margin = " " * (self._terminal.visible_left - 1)
+        bottom_rows = [" " * self._terminal.visible_right] * (self._terminal.visible_bottom - 1)
+        return "\n".join([margin + row for row in rows] + bottom_rows)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield frames of the canvas until the stream is closed and every block has been animated.
+
+        While no block is animating, this blocks until more lines are read instead of yielding frames.
+
+        Yields:
+            str: The next frame.
+
+        """
+        segments: deque[_StreamSegment] = deque()
+        while True:
+            lines = [*self._pending, *self._reader.drain()]
+            self._pending = []
+            segments.extend(self._get_segments(lines))
+            while len(segments) > 1 and sum(len(segment.rows) for segment in segments) - len(
+                segments[0].rows,
+            ) >= self._canvas_height:
+                segments.popleft()
+            if not any(segment.frames for segment in segments):
+                if lines:
+                    yield self._get_frame(segments)
+                if not self._reader.wait():
+                    return
+                continue
+            if self._terminal._frame_rate:
+                self._terminal.enforce_framerate()
+            yield self._get_frame(segments)
+            for segment in segments:
+                segment.advance()
+
+    @contextmanager
+    def terminal_output(self, end_symbol: str = "\n") -> Generator[Terminal, None, None]:
+        """Context manager for terminal output. Prepares the canvas once for the whole stream and restores it after.
+
+        Args:
+            end_symbol (str, optional): Symbol to print after the stream has closed. Defaults to newline.
+
+        Yields:
+            Terminal: Terminal object for handling output.
+
+        Raises:
+            Exception: Any exception that occurs within the context manager is re-raised
+                after the terminal state is restored.
+
+        """
+        try:
+            self._terminal.prep_canvas()
+            yield self._terminal
+
+        finally:
+            self._terminal.restore_cursor(end_symbol)
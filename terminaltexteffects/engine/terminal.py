@@ -5,13 +5,20 @@ Classes:
     Canvas: Represents the canvas in the terminal. Canvas bounds are derived from the input text dimensions,
         terminal dimensions, and relevant TerminalConfig options.
     Terminal: A class for managing the terminal state and output.
+    TerminalPrototype: A Terminal parsed once from input data, to be cloned for each effect run on the input.
 """
 
 from __future__ import annotations
 
+import copy
+import itertools
+import mmap
+import operator
+import os
 import random
 import re
 import shutil
+import stat
 import sys
 import time
 import typing
@@ -20,6 +27,7 @@ from typing import Literal
 
 from terminaltexteffects.engine.base_character import EffectCharacter
 from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.spatial_index import SpatialIndex
 from terminaltexteffects.utils import ansitools, argutils
 from terminaltexteffects.utils.argutils import CharacterGroup, CharacterSort, ColorSort
 from terminaltexteffects.utils.exceptions import (
@@ -527,6 +535,8 @@ class Terminal:
     Methods:
         get_piped_input:
             Gets the piped input from stdin.
+        read_input_file:
+            Reads input from a file, decoding only the lines that can land on the canvas.
         prep_canvas:
             Prepares the terminal for the effect by adding empty lines and hiding the cursor.
         restore_cursor:
@@ -537,6 +547,10 @@ class Terminal:
             Get a list of all EffectCharacters grouped by the specified CharacterGroup grouping.
         get_character_by_input_coord:
             Get an EffectCharacter by its input coordinates.
+        get_characters_in_circle:
+            Get the EffectCharacters within a circle around a coordinate.
+        get_characters_in_rect:
+            Get the EffectCharacters within a rectangle around a coordinate.
         set_character_visibility:
             Set the visibility of a character.
         get_formatted_output_string:
@@ -551,6 +565,11 @@ class Terminal:
         r"(?:\x1b\][^\x07]*(?:\x07|\x1b\\))|(?:\x1b\[[0-?]*[ -/]*[@-~])|(?:\x1b.)",
     )
     csi_sequence_pattern: typing.ClassVar[re.Pattern[str]] = re.compile(r"\x1b\[([0-?]*)([ -/]*)([@-~])")
+    _lone_carriage_return_pattern: typing.ClassVar[re.Pattern[bytes]] = re.compile(rb"\r(?!\n)")
+    input_token_pattern: typing.ClassVar[re.Pattern[str]] = re.compile(
+        r"(?P<text>[^\x1b\n\r\t]+)|(?P<newline>\n)|(?P<carriage_return>\r)|(?P<tab>\t)"
+        r"|(?P<escape_sequence>" + ansi_escape_sequence_pattern.pattern + r"|\x1b)",
+    )
 
     def __init__(self, input_data: str, config: TerminalConfig | None = None) -> None:
         """Initialize the Terminal.
@@ -595,7 +614,18 @@ class Terminal:
             (character.input_coord): character for character in self._input_characters
         }
         self._inner_fill_characters, self._outer_fill_characters = self._make_fill_characters()
+        self._initial_next_character_id = self._next_character_id
         self._setup_character_neighbors()
+        self._input_coord_index: SpatialIndex | None = None
+        self._current_coord_index: SpatialIndex | None = None
+        self._sorted_characters_cache: dict[
+            tuple[bool, bool, bool, bool, CharacterSort],
+            tuple[EffectCharacter, ...],
+        ] = {}
+        self._grouped_characters_cache: dict[
+            tuple[bool, bool, bool, bool, CharacterGroup],
+            tuple[tuple[EffectCharacter, ...], ...],
+        ] = {}
         self._visible_characters: set[EffectCharacter] = set()
         self._frame_rate = self.config.frame_rate
         self._last_time_printed = time.monotonic()
@@ -756,23 +786,21 @@ class Terminal:
 
         def build_character(
             symbol: str,
-            active_sequences: dict[str, str],
-            active_colors: dict[str, Color | None],
-            active_styles: dict[str, bool],
+            input_colors: tuple[tuple[str, str, Color], ...],
+            *,
+            bold: bool,
         ) -> EffectCharacter:
             """Build an input character with the current terminal configuration and input colors."""
             character = EffectCharacter(self._next_character_id, symbol, 0, 0)
             self._next_character_id += 1
-            for sequence_type, sequence in active_sequences.items():
-                color = active_colors[sequence_type]
-                if sequence and color:
-                    character._input_ansi_sequences[sequence_type] = sequence
-                    self._input_colors_frequency[color] = self._input_colors_frequency.get(color, 0) + 1
-                    if sequence_type == "fg_color":
-                        character.animation.input_fg_color = color
-                    else:
-                        character.animation.input_bg_color = color
-            character.animation.input_bold = active_styles["bold"]
+            for sequence_type, sequence, color in input_colors:
+                character._input_ansi_sequences[sequence_type] = sequence
+                self._input_colors_frequency[color] = self._input_colors_frequency.get(color, 0) + 1
+                if sequence_type == "fg_color":
+                    character.animation.input_fg_color = color
+                else:
+                    character.animation.input_bg_color = color
+            character.animation.input_bold = bold
             character.animation.no_color = self.config.no_color
             character.animation.use_xterm_colors = self.config.xterm_colors
             character.animation.existing_color_handling = self.config.existing_color_handling
@@ -781,85 +809,113 @@ class Terminal:
                 character.animation.set_appearance(character.input_symbol)
             return character
 
-        screen: dict[tuple[int, int], EffectCharacter] = {}
+        def get_input_colors(
+            active_sequences: dict[str, str],
+            active_colors: dict[str, Color | None],
+        ) -> tuple[tuple[str, str, Color], ...]:
+            """Return the active color sequences that apply to the next input characters."""
+            input_colors: list[tuple[str, str, Color]] = []
+            for sequence_type, sequence in active_sequences.items():
+                color = active_colors[sequence_type]
+                if sequence and color:
+                    input_colors.append((sequence_type, sequence, color))
+            return tuple(input_colors)
+
+        def is_trimmable(character: EffectCharacter) -> bool:
+            """Return whether a character is an uncolored space that is trimmed from the end of a line."""
+            return character.input_symbol == " " and not any(
+                (character.animation.input_fg_color, character.animation.input_bg_color),
+            )
+
+        if "\x1b" not in input_data and "\r" not in input_data:
+            # fast path: without escape sequences or carriage returns, each line maps directly to a row
+            lines = [line.expandtabs(self.config.tab_width) for line in input_data.split("\n")]
+            row_width = max(max(len(line) for line in lines), 1)
+            first_fill_id = self._next_character_id + sum(len(line) for line in lines)
+            characters = []
+            for line in lines:
+                line_start_id = self._next_character_id
+                character_line = [build_character(symbol, (), bold=False) for symbol in line.rstrip(" ")]
+                self._next_character_id = line_start_id + len(line)
+                characters.append(character_line)
+            # fill characters for the unused columns of each row are trimmed, but still consume IDs
+            self._next_character_id = first_fill_id + sum(row_width - len(line) for line in lines)
+            while characters and not characters[-1]:
+                characters.pop()
+            return characters or [[build_character(" ", (), bold=False)]]
+
+        screen: dict[int, dict[int, EffectCharacter]] = {}
         active_sequences = {"fg_color": "", "bg_color": ""}
         active_colors: dict[str, Color | None] = {"fg_color": None, "bg_color": None}
         active_styles = {"bold": False}
         standard_fg_parameter: dict[str, int | None] = {"fg_color": None}
+        input_colors: tuple[tuple[str, str, Color], ...] = ()
         row = column = 0
-        char_index = max_row = max_column = 0
-        while char_index < len(input_data):
-            if input_data[char_index] == "\x1b":
-                sequence_match = self.ansi_escape_sequence_pattern.match(input_data, char_index)
-                if not sequence_match:
-                    raise UnsupportedAnsiSequenceError(input_data[char_index])
-                sequence = sequence_match.group(0)
-                if sequence.startswith("\x1b["):
-                    csi_match = self.csi_sequence_pattern.fullmatch(sequence)
-                    if not csi_match:
-                        raise UnsupportedAnsiSequenceError(sequence)
-                    final_byte = csi_match.group(3)
-                    if final_byte == "m":
-                        apply_sgr_sequence(
-                            sequence,
-                            active_sequences,
-                            active_colors,
-                            active_styles,
-                            standard_fg_parameter,
-                        )
-                    elif is_supported_private_mode_sequence(sequence):
-                        pass
-                    else:
-                        row, column = apply_cursor_sequence(sequence, row, column)
-                        max_row = max(max_row, row)
-                        max_column = max(max_column, column)
-                else:
-                    raise UnsupportedAnsiSequenceError(sequence)
-                char_index = sequence_match.end()
-            elif input_data[char_index] == "\n":
+        max_row = max_column = 0
+        for token in self.input_token_pattern.finditer(input_data):
+            token_type = token.lastgroup
+            if token_type == "text":
+                row_screen = screen.setdefault(row, {})
+                for symbol in token.group():
+                    row_screen[column] = build_character(symbol, input_colors, bold=active_styles["bold"])
+                    column += 1
+                max_row = max(max_row, row)
+                max_column = max(max_column, column - 1)
+            elif token_type == "newline":
                 row += 1
                 column = 0
                 max_row = max(max_row, row)
-                char_index += 1
-            elif input_data[char_index] == "\r":
+            elif token_type == "carriage_return":
                 column = 0
-                char_index += 1
+            elif token_type == "tab":
+                row_screen = screen.setdefault(row, {})
+                for _ in range(self.config.tab_width - (column % self.config.tab_width)):
+                    row_screen[column] = build_character(" ", input_colors, bold=active_styles["bold"])
+                    column += 1
+                max_row = max(max_row, row)
+                max_column = max(max_column, column - 1)
             else:
-                symbol = input_data[char_index]
-                if symbol == "\t":
-                    symbol = " "
-                    spaces_to_next_tab = self.config.tab_width - (column % self.config.tab_width)
-                else:
-                    spaces_to_next_tab = 1
-                for _ in range(spaces_to_next_tab):
-                    screen[(row, column)] = build_character(symbol, active_sequences, active_colors, active_styles)
+                sequence = token.group()
+                csi_match = self.csi_sequence_pattern.fullmatch(sequence) if sequence.startswith("\x1b[") else None
+                if not csi_match:
+                    raise UnsupportedAnsiSequenceError(sequence)
+                if csi_match.group(3) == "m":
+                    apply_sgr_sequence(
+                        sequence,
+                        active_sequences,
+                        active_colors,
+                        active_styles,
+                        standard_fg_parameter,
+                    )
+                    input_colors = get_input_colors(active_sequences, active_colors)
+                elif not is_supported_private_mode_sequence(sequence):
+                    row, column = apply_cursor_sequence(sequence, row, column)
                     max_row = max(max_row, row)
                     max_column = max(max_column, column)
-                    column += 1
-                char_index += 1
 
         characters: list[list[EffectCharacter]] = []
         for screen_row in range(max_row + 1):
+            row_screen = screen.get(screen_row, {})
+            # trailing uncolored spaces are trimmed, so only build the row up to its last kept character
+            line_end = max(
+                (screen_column + 1 for screen_column, character in row_screen.items() if not is_trimmable(character)),
+                default=0,
+            )
             character_line: list[EffectCharacter] = []
-            for screen_column in range(max_column + 1):
-                character = screen.get((screen_row, screen_column))
+            for screen_column in range(line_end):
+                character = row_screen.get(screen_column)
                 if character is None:
-                    character = build_character(
-                        " ",
-                        {"fg_color": "", "bg_color": ""},
-                        {"fg_color": None, "bg_color": None},
-                        {"bold": False},
-                    )
+                    character = build_character(" ", (), bold=False)
                 character_line.append(character)
-            while character_line and character_line[-1].input_symbol == " " and not any(
-                (character_line[-1].animation.input_fg_color, character_line[-1].animation.input_bg_color),
-            ):
-                character_line.pop()
+            # fill characters for the trimmed columns still consume IDs
+            self._next_character_id += sum(
+                1 for screen_column in range(line_end, max_column + 1) if screen_column not in row_screen
+            )
             characters.append(character_line)
         while characters and not characters[-1]:
             characters.pop()
 
-        return characters or [[build_character(" ", active_sequences, active_colors, active_styles)]]
+        return characters or [[build_character(" ", input_colors, bold=active_styles["bold"])]]
 
     def _calc_canvas_offsets(self) -> tuple[int, int]:
         """Calculate terminal-space offsets for the anchored canvas.
@@ -956,6 +1012,158 @@ class Terminal:
             return ""
         return sys.stdin.read()
 
+    @staticmethod
+    def read_input_file(path: str | os.PathLike[str], config: TerminalConfig | None = None) -> str:
+        """Read input data from a file, decoding only the lines that can land on the canvas.
+
+        Regular files are memory-mapped. When the file has more lines than the canvas can show
+        and the text is anchored to the north or south of the canvas, only the lines that will be
+        anchored within the canvas are decoded. If the input width affects where the text is placed,
+        the rest of the file is scanned for a wider line, and the whole file is decoded if one is
+        found. The whole file is also decoded when it contains escape sequences or lone carriage
+        returns, when `wrap_text` is enabled, when the canvas height follows the input height, or
+        when the text is centered vertically. Line endings are normalized as with `Path.read_text()`.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the file to read.
+            config (TerminalConfig | None, optional): Configuration the input will be displayed with. Defaults to None.
+
+        Returns:
+            str: The input data.
+
+        """
+        if config is None:
+            config = TerminalConfig._build_config()
+        with open(path, "rb") as input_file:  # noqa: PTH123
+            file_stat = os.fstat(input_file.fileno())
+            if not stat.S_ISREG(file_stat.st_mode):
+                input_bytes = input_file.read()
+            elif file_stat.st_size == 0:
+                input_bytes = b""
+            else:
+                with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as input_map:
+                    start, end = Terminal._get_input_file_window(input_map, config)
+                    input_bytes = input_map[start:end]
+        return input_bytes.decode("UTF-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    @staticmethod
+    def _get_input_file_window(input_map: mmap.mmap, config: TerminalConfig) -> tuple[int, int]:
+        """Return the start and end offsets of the lines in a mapped input file that can land on the canvas.
+
+        Args:
+            input_map (mmap.mmap): The mapped input file.
+            config (TerminalConfig): Configuration the input will be displayed with.
+
+        Returns:
+            tuple[int, int]: Start and end byte offsets of the window.
+
+        """
+        size = len(input_map)
+        if (
+            config.wrap_text
+            or config.anchor_text not in ("sw", "s", "se", "nw", "n", "ne")
+            or input_map.find(b"\x1b") != -1
+            or Terminal._lone_carriage_return_pattern.search(input_map)
+        ):
+            return 0, size
+        if config.canvas_height > 0:
+            max_rows = config.canvas_height
+        elif config.canvas_height == 0 or not config.ignore_terminal_dimensions:
+            try:
+                max_rows = shutil.get_terminal_size().lines
+            except OSError:
+                max_rows = 24
+        else:
+            return 0, size
+
+        def is_blank(start: int, end: int) -> bool:
+            """Return whether a line is trimmed to nothing by input preprocessing."""
+            return not input_map[start:end].strip(b" \t\r")
+
+        if config.anchor_text in ("sw", "s", "se"):
+            # the text is anchored to the bottom of the canvas, so the last lines are shown. trailing
+            # blank lines are dropped by preprocessing and do not count towards the canvas rows.
+            end = size
+            line_start = input_map.rfind(b"\n", 0, end) + 1
+            while line_start and is_blank(line_start, end):
+                end = line_start - 1
+                line_start = input_map.rfind(b"\n", 0, end) + 1
+            newline = end
+            for _ in range(max_rows):
+                newline = input_map.rfind(b"\n", 0, newline)
+                if newline == -1:
+                    return 0, size
+            return Terminal._check_input_file_window_width(input_map, config, newline + 1, end)
+
+        # the text is anchored to the top of the canvas, so the lines from the first non-blank line are shown.
+        # the window is extended through the next non-blank line so blank lines at the bottom of the canvas
+        # are not dropped.
+        line_start = 0
+        while line_start < size:
+            line_end = input_map.find(b"\n", line_start)
+            if line_end == -1 or not is_blank(line_start, line_end):
+                break
+            line_start = line_end + 1
+        start = line_start
+        for _ in range(max_rows):
+            newline = input_map.find(b"\n", line_start)
+            if newline == -1:
+                return 0, size
+            line_start = newline + 1
+        while line_start < size:
+            line_end = input_map.find(b"\n", line_start)
+            if line_end == -1:
+                line_end = size
+            if not is_blank(line_start, line_end):
+                return Terminal._check_input_file_window_width(input_map, config, start, line_end)
+            line_start = line_end + 1
+        return 0, size
+
+    @staticmethod
+    def _check_input_file_window_width(
+        input_map: mmap.mmap,
+        config: TerminalConfig,
+        start: int,
+        end: int,
+    ) -> tuple[int, int]:
+        """Return the window if text placed from it lands where it would if the whole file were read.
+
+        The input width sets the canvas width when `canvas_width` is `-1` and positions text that is not
+        anchored to the west of the canvas. In those cases the window is only used when no line outside
+        of it is wider than the widest line within it. Only lines with more bytes than the window width,
+        or with tabs, can be wider, so only those lines are decoded.
+
+        Args:
+            input_map (mmap.mmap): The mapped input file.
+            config (TerminalConfig): Configuration the input will be displayed with.
+            start (int): Start byte offset of the window.
+            end (int): End byte offset of the window.
+
+        Returns:
+            tuple[int, int]: Start and end byte offsets of the window, or of the whole file.
+
+        """
+        if config.canvas_width != -1 and config.anchor_text in ("sw", "nw"):
+            return start, end
+
+        def get_width(line: bytes) -> int:
+            """Return the width of a line once it is decoded and preprocessed."""
+            return len(line.decode("UTF-8").rstrip("\r").expandtabs(config.tab_width).rstrip(" "))
+
+        window_width = max(get_width(line) for line in input_map[start:end].split(b"\n"))
+        candidate_pattern = rb"[^\n]{%d,}" % (window_width + 1)
+        if input_map.find(b"\t") != -1:
+            # tabs are expanded by preprocessing, so a line with tabs can be wider than its length in bytes
+            candidate_pattern += rb"|[^\n]*\t[^\n]*"
+        # each candidate is matched from the newline before it, so the first line is checked on its own
+        candidates = itertools.chain(
+            (input_map[: input_map.find(b"\n")],),
+            (match.group(1) for match in re.finditer(rb"\n(%s)" % candidate_pattern, input_map)),
+        )
+        if any(get_width(candidate) > window_width for candidate in candidates):
+            return 0, len(input_map)
+        return start, end
+
     def _wrap_lines(
         self,
         lines: list[list[EffectCharacter]],
@@ -1057,6 +1265,49 @@ class Terminal:
                 neighbor_coord = Coord(column=coord.column + delta[0], row=coord.row + delta[1])
                 char.neighbors[direction] = self.character_by_input_coord.get(neighbor_coord)
 
+    def _clone(self) -> Terminal:
+        """Return a new Terminal for the same input with its characters in their initial state.
+
+        The input is not parsed again and the canvas geometry is reused. New input and fill characters
+        are created with the same IDs, symbols, coordinates, input colors, and neighbors as the characters
+        built by `__init__`, without running `EffectCharacter.__init__`. Characters added with `add_character()`
+        are not cloned. The clone has its own copy of the configuration.
+
+        Returns:
+            Terminal: A new Terminal in the state of a newly constructed Terminal.
+
+        """
+        terminal = copy.copy(self)
+        terminal.config = copy.deepcopy(self.config)
+        terminal.canvas = copy.copy(self.canvas)
+        terminal._next_character_id = self._initial_next_character_id
+        terminal._input_colors_frequency = dict(self._input_colors_frequency)
+        clones = {
+            character: character._clone()
+            for character in (*self._input_characters, *self._inner_fill_characters, *self._outer_fill_characters)
+        }
+        terminal._input_characters = [clones[character] for character in self._input_characters]
+        terminal._inner_fill_characters = [clones[character] for character in self._inner_fill_characters]
+        terminal._outer_fill_characters = [clones[character] for character in self._outer_fill_characters]
+        terminal._added_characters = []
+        terminal.character_by_input_coord = {
+            coord: clones[character] for coord, character in self.character_by_input_coord.items()
+        }
+        for character, clone in clones.items():
+            clone.neighbors = {
+                direction: None if neighbor is None else clones[neighbor]
+                for direction, neighbor in character.neighbors.items()
+            }
+        terminal._input_coord_index = None
+        terminal._current_coord_index = None
+        terminal._sorted_characters_cache = {}
+        terminal._grouped_characters_cache = {}
+        terminal._visible_characters = set()
+        terminal._frame_rate = terminal.config.frame_rate
+        terminal._last_time_printed = time.monotonic()
+        terminal._update_terminal_state()
+        return terminal
+
     def add_character(self, symbol: str, coord: Coord) -> EffectCharacter:
         """Add a character to the terminal for printing.
 
@@ -1082,6 +1333,11 @@ class Terminal:
 
         self._added_characters.append(character)
         self._next_character_id += 1
+        self._sorted_characters_cache.clear()
+        self._grouped_characters_cache.clear()
+        if self._current_coord_index is not None:
+            self._current_coord_index.insert(character, character.motion.current_coord)
+            character._spatial_index = self._current_coord_index
         return character
 
     def get_input_colors(self, sort: ColorSort = ColorSort.MOST_TO_LEAST) -> list[Color]:
@@ -1115,6 +1371,26 @@ class Terminal:
             )
         raise InvalidColorSortError(sort)
 
+    def _collect_characters(
+        self,
+        *,
+        input_chars: bool,
+        inner_fill_chars: bool,
+        outer_fill_chars: bool,
+        added_chars: bool,
+    ) -> list[EffectCharacter]:
+        """Return the characters of the selected kinds, in input, inner fill, outer fill, added order."""
+        all_characters: list[EffectCharacter] = []
+        if input_chars:
+            all_characters.extend(self._input_characters)
+        if inner_fill_chars:
+            all_characters.extend(self._inner_fill_characters)
+        if outer_fill_chars:
+            all_characters.extend(self._outer_fill_characters)
+        if added_chars:
+            all_characters.extend(self._added_characters)
+        return all_characters
+
     def get_characters(
         self,
         *,
@@ -1130,6 +1406,9 @@ class Terminal:
         sort options interleave characters from the beginning and end of the default
         top-to-bottom, left-to-right ordering.
 
+        Sorted orders are cached per combination of character kinds and sort until a character is
+        added with `add_character()`. Each call returns a new list.
+
         Args:
             input_chars (bool, optional): whether to include input characters. Defaults to True.
             inner_fill_chars (bool, optional): whether to include inner fill characters. Defaults to False.
@@ -1145,25 +1424,45 @@ class Terminal:
             InvalidCharacterSortError: If an invalid sort option is provided.
 
         """
-        all_characters: list[EffectCharacter] = []
-        if input_chars:
-            all_characters.extend(self._input_characters)
-        if inner_fill_chars:
-            all_characters.extend(self._inner_fill_characters)
-        if outer_fill_chars:
-            all_characters.extend(self._outer_fill_characters)
-        if added_chars:
-            all_characters.extend(self._added_characters)
+        cache_key = (input_chars, inner_fill_chars, outer_fill_chars, added_chars, sort)
+        sorted_characters = self._sorted_characters_cache.get(cache_key)
+        if sorted_characters is None:
+            sorted_characters = tuple(
+                self._sort_characters(
+                    self._collect_characters(
+                        input_chars=input_chars,
+                        inner_fill_chars=inner_fill_chars,
+                        outer_fill_chars=outer_fill_chars,
+                        added_chars=added_chars,
+                    ),
+                    sort,
+                ),
+            )
+            self._sorted_characters_cache[cache_key] = sorted_characters
 
+        all_characters = list(sorted_characters)
+        if sort is CharacterSort.RANDOM:
+            random.shuffle(all_characters)
+        return all_characters
+
+    @staticmethod
+    def _sort_characters(all_characters: list[EffectCharacter], sort: CharacterSort) -> list[EffectCharacter]:
+        """Sort the characters in place by the given sort, and return them.
+
+        Characters are left in the default top-to-bottom, left-to-right order for `CharacterSort.RANDOM`,
+        which is shuffled by the caller.
+
+        Raises:
+            InvalidCharacterSortError: If an invalid sort option is provided.
+
+        """
         # default sort TOP_TO_BOTTOM_LEFT_TO_RIGHT
         all_characters.sort(
             key=lambda character: (-character.input_coord.row, character.input_coord.column),
         )
 
-        if sort is CharacterSort.RANDOM:
-            random.shuffle(all_characters)
-
-        elif sort in (
+        if sort in (
+            CharacterSort.RANDOM,
             CharacterSort.TOP_TO_BOTTOM_LEFT_TO_RIGHT,
             CharacterSort.BOTTOM_TO_TOP_RIGHT_TO_LEFT,
         ):
@@ -1184,9 +1483,13 @@ class Terminal:
             CharacterSort.OUTSIDE_ROW_TO_MIDDLE,
             CharacterSort.MIDDLE_ROW_TO_OUTSIDE,
         ):
-            all_characters = [
-                all_characters.pop(0) if i % 2 == 0 else all_characters.pop(-1) for i in range(len(all_characters))
-            ]
+            # alternate between the first and last remaining characters
+            front_count = (len(all_characters) + 1) // 2
+            interleaved: list[EffectCharacter] = []
+            for front_character, back_character in zip(all_characters[:front_count], reversed(all_characters)):
+                interleaved.append(front_character)
+                interleaved.append(back_character)
+            all_characters[:] = interleaved[: len(all_characters)]
             if sort is CharacterSort.MIDDLE_ROW_TO_OUTSIDE:
                 all_characters.reverse()
         else:
@@ -1205,6 +1508,9 @@ class Terminal:
     ) -> list[list[EffectCharacter]]:
         """Get a list of all EffectCharacters grouped by the specified CharacterGroup grouping.
 
+        Groups are built in a single pass over the characters and cached per combination of character
+        kinds and grouping until a character is added with `add_character()`. Each call returns new lists.
+
         Args:
             grouping (CharacterGroup, optional): order to group the characters. Defaults to ROW_TOP_TO_BOTTOM.
             input_chars (bool, optional): whether to include input characters. Defaults to True.
@@ -1220,103 +1526,103 @@ class Terminal:
             InvalidCharacterGroupError: If an invalid grouping option is provided.
 
         """
-        all_characters: list[EffectCharacter] = []
-        if input_chars:
-            all_characters.extend(self._input_characters)
-        if inner_fill_chars:
-            all_characters.extend(self._inner_fill_characters)
-        if outer_fill_chars:
-            all_characters.extend(self._outer_fill_characters)
-        if added_chars:
-            all_characters.extend(self._added_characters)
+        cache_key = (input_chars, inner_fill_chars, outer_fill_chars, added_chars, grouping)
+        groups = self._grouped_characters_cache.get(cache_key)
+        if groups is None:
+            groups = self._group_characters(
+                self._collect_characters(
+                    input_chars=input_chars,
+                    inner_fill_chars=inner_fill_chars,
+                    outer_fill_chars=outer_fill_chars,
+                    added_chars=added_chars,
+                ),
+                grouping,
+            )
+            self._grouped_characters_cache[cache_key] = groups
+        return [list(group) for group in groups]
+
+    def _group_characters(
+        self,
+        all_characters: list[EffectCharacter],
+        grouping: CharacterGroup,
+    ) -> tuple[tuple[EffectCharacter, ...], ...]:
+        """Group the characters by the given grouping.
+
+        Characters are bucketed by their group index in a single pass. Within a group, characters are
+        ordered bottom to top, left to right. Row, column and diagonal groups are limited to the indexes
+        within the canvas.
 
+        Raises:
+            InvalidCharacterGroupError: If an invalid grouping option is provided.
+
+        """
         all_characters.sort(
             key=lambda character: (character.input_coord.row, character.input_coord.column),
         )
 
+        group_index: typing.Callable[[Coord], int]
         if grouping in (
             CharacterGroup.COLUMN_LEFT_TO_RIGHT,
             CharacterGroup.COLUMN_RIGHT_TO_LEFT,
         ):
-            columns = []
-            for column_index in range(self.canvas.right + 1):
-                characters_in_column = [
-                    character for character in all_characters if character.input_coord.column == column_index
-                ]
-                if characters_in_column:
-                    columns.append(characters_in_column)
-            if grouping == CharacterGroup.COLUMN_RIGHT_TO_LEFT:
-                columns.reverse()
-            return columns
-
-        if grouping in (
+            group_index = operator.attrgetter("column")
+            index_range = range(self.canvas.right + 1)
+            reverse = grouping == CharacterGroup.COLUMN_RIGHT_TO_LEFT
+        elif grouping in (
             CharacterGroup.ROW_BOTTOM_TO_TOP,
             CharacterGroup.ROW_TOP_TO_BOTTOM,
         ):
-            rows = []
-            for row_index in range(self.canvas.top + 1):
-                characters_in_row = [
-                    character for character in all_characters if character.input_coord.row == row_index
-                ]
-                if characters_in_row:
-                    rows.append(characters_in_row)
-            if grouping == CharacterGroup.ROW_TOP_TO_BOTTOM:
-                rows.reverse()
-            return rows
-        if grouping in (
+            group_index = operator.attrgetter("row")
+            index_range = range(self.canvas.top + 1)
+            reverse = grouping == CharacterGroup.ROW_TOP_TO_BOTTOM
+        elif grouping in (
             CharacterGroup.DIAGONAL_BOTTOM_LEFT_TO_TOP_RIGHT,
             CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT,
         ):
-            diagonals = []
-            for diagonal_index in range(self.canvas.top + self.canvas.right + 1):
-                characters_in_diagonal = [
-                    character
-                    for character in all_characters
-                    if character.input_coord.row + character.input_coord.column == diagonal_index
-                ]
-                if characters_in_diagonal:
-                    diagonals.append(characters_in_diagonal)
-            if grouping == CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT:
-                diagonals.reverse()
-            return diagonals
-        if grouping in (
+
+            def group_index(coord: Coord) -> int:
+                return coord.row + coord.column
+
+            index_range = range(self.canvas.top + self.canvas.right + 1)
+            reverse = grouping == CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT
+        elif grouping in (
             CharacterGroup.DIAGONAL_TOP_LEFT_TO_BOTTOM_RIGHT,
             CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT,
         ):
-            diagonals = []
-            for diagonal_index in range(
-                self.canvas.left - self.canvas.top,
-                self.canvas.right - self.canvas.bottom + 1,
-            ):
-                characters_in_diagonal = [
-                    character
-                    for character in all_characters
-                    if character.input_coord.column - character.input_coord.row == diagonal_index
-                ]
-                if characters_in_diagonal:
-                    diagonals.append(characters_in_diagonal)
-            if grouping == CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT:
-                diagonals.reverse()
-            return diagonals
-        if grouping in (
+
+            def group_index(coord: Coord) -> int:
+                return coord.column - coord.row
+
+            index_range = range(self.canvas.left - self.canvas.top, self.canvas.right - self.canvas.bottom + 1)
+            reverse = grouping == CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT
+        elif grouping in (
             CharacterGroup.CENTER_TO_OUTSIDE,
             CharacterGroup.OUTSIDE_TO_CENTER,
         ):
-            distance_map: dict[int, list[EffectCharacter]] = {}
-            for character in all_characters:
-                distance = abs(character.input_coord.column - self.canvas.text_center.column) + abs(
-                    character.input_coord.row - self.canvas.text_center.row,
-                )
-                if distance not in distance_map:
-                    distance_map[distance] = []
-                distance_map[distance].append(character)
-            ordered_distances = sorted(
-                distance_map.keys(),
-                reverse=grouping is CharacterGroup.OUTSIDE_TO_CENTER,
-            )
-            return [distance_map[distance] for distance in ordered_distances]
+            text_center = self.canvas.text_center
+
+            def group_index(coord: Coord) -> int:
+                return abs(coord.column - text_center.column) + abs(coord.row - text_center.row)
 
-        raise InvalidCharacterGroupError(grouping)
+            index_range = None
+            reverse = grouping is CharacterGroup.OUTSIDE_TO_CENTER
+        else:
+            raise InvalidCharacterGroupError(grouping)
+
+        buckets: dict[int, list[EffectCharacter]] = {}
+        for character in all_characters:
+            index = group_index(character.input_coord)
+            bucket = buckets.get(index)
+            if bucket is None:
+                buckets[index] = [character]
+            else:
+                bucket.append(character)
+        ordered_indexes = sorted(
+            index for index in buckets if index_range is None or index_range.start <= index < index_range.stop
+        )
+        if reverse:
+            ordered_indexes.reverse()
+        return tuple(tuple(buckets[index]) for index in ordered_indexes)
 
     def get_character_by_input_coord(self, coord: Coord) -> EffectCharacter | None:
         """Get an EffectCharacter by its input coordinates.
@@ -1334,6 +1640,86 @@ class Terminal:
         """
         return self.character_by_input_coord.get(coord, None)
 
+    def _get_spatial_index(self, *, current_coords: bool) -> SpatialIndex:
+        """Return the spatial index over input or current coordinates, building it on first use.
+
+        The input coordinate index holds the characters in `character_by_input_coord`. The current
+        coordinate index holds all characters, including added characters, and is kept up to date by
+        `Motion` as the characters move.
+
+        Args:
+            current_coords (bool): Whether to return the index over current coordinates.
+
+        Returns:
+            SpatialIndex: The spatial index.
+
+        """
+        if not current_coords:
+            if self._input_coord_index is None:
+                self._input_coord_index = SpatialIndex()
+                for coord, character in self.character_by_input_coord.items():
+                    self._input_coord_index.insert(character, coord)
+            return self._input_coord_index
+        if self._current_coord_index is None:
+            self._current_coord_index = SpatialIndex()
+            for character in self.get_characters(outer_fill_chars=True, inner_fill_chars=True, added_chars=True):
+                self._current_coord_index.insert(character, character.motion.current_coord)
+                character._spatial_index = self._current_coord_index
+        return self._current_coord_index
+
+    def get_characters_in_circle(
+        self,
+        center: Coord,
+        diameter: int,
+        *,
+        current_coords: bool = False,
+    ) -> list[EffectCharacter]:
+        """Get the EffectCharacters within a circle around a coordinate.
+
+        The circle matches `geometry.find_coords_in_circle(center, diameter)`. Characters are found through
+        a spatial index, so the cost depends on the number of characters near the circle rather than on
+        the number of coordinates within it.
+
+        By default, characters are located by their input coordinates and lookup is limited to the characters
+        in `character_by_input_coord`, as in `get_character_by_input_coord()`. With `current_coords`, all
+        characters are located by their current motion coordinates.
+
+        Args:
+            center (Coord): The center of the circle.
+            diameter (int): The length of the major axis of the circle.
+            current_coords (bool, optional): Whether to locate characters by their current coordinates.
+                Defaults to False.
+
+        Returns:
+            list[EffectCharacter]: The characters within the circle, in no particular order.
+
+        """
+        return self._get_spatial_index(current_coords=current_coords).get_characters_in_circle(center, diameter)
+
+    def get_characters_in_rect(
+        self,
+        origin: Coord,
+        distance: int,
+        *,
+        current_coords: bool = False,
+    ) -> list[EffectCharacter]:
+        """Get the EffectCharacters within a rectangle around a coordinate.
+
+        The rectangle matches `geometry.find_coords_in_rect(origin, distance)`. Characters are located as
+        described in `get_characters_in_circle()`.
+
+        Args:
+            origin (Coord): The center of the rectangle.
+            distance (int): The distance from the origin in each direction.
+            current_coords (bool, optional): Whether to locate characters by their current coordinates.
+                Defaults to False.
+
+        Returns:
+            list[EffectCharacter]: The characters within the rectangle, in no particular order.
+
+        """
+        return self._get_spatial_index(current_coords=current_coords).get_characters_in_rect(origin, distance)
+
     def set_character_visibility(self, character: EffectCharacter, is_visible: bool) -> None:  # noqa: FBT001
         """Set whether a character participates in terminal rendering.
 
@@ -1454,3 +1840,86 @@ class Terminal:
         sys.stdout.write(ansitools.dec_restore_cursor_position())
         sys.stdout.write(ansitools.dec_save_cursor_position())
         sys.stdout.write(ansitools.move_cursor_up(self.visible_top))
+
+
+class TerminalPrototype:
+    """A Terminal parsed once from input data, to be cloned for each effect run on the input.
+
+    The input data is parsed the first time `terminal` is used. The prototype keeps a copy of the terminal
+    configuration it was built with, so it can be checked against the current input data and configuration before
+    it is reused. Its Terminal's characters must not be animated, use `Terminal._clone()` to get a Terminal for an
+    effect iterator.
+
+    Args:
+        input_data (str): The input data parsed into the Terminal.
+        terminal_config (TerminalConfig): Configuration for the Terminal.
+
+    Attributes:
+        input_data (str): The input data parsed into the Terminal.
+        terminal_config (TerminalConfig): A copy of the configuration the Terminal was built with.
+        terminal (Terminal): The Terminal parsed from the input data, parsed on first use.
+
+    Methods:
+        matches: Return whether the prototype was built from the input data and terminal configuration.
+        reuse_or_build: Return a prototype for the input data and terminal configuration, reusing one if it matches.
+
+    """
+
+    def __init__(self, input_data: str, terminal_config: TerminalConfig) -> None:
+        """Initialize the prototype with the input data and a copy of the terminal configuration.
+
+        Args:
+            input_data (str): The input data parsed into the Terminal.
+            terminal_config (TerminalConfig): Configuration for the Terminal.
+
+        """
+        self.input_data = input_data
+        self.terminal_config = copy.deepcopy(terminal_config)
+        self._terminal: Terminal | None = None
+
+    @property
+    def terminal(self) -> Terminal:
+        """The Terminal parsed from the input data, parsed on first use.
+
+        Raises:
+            UnsupportedAnsiSequenceError: If the input data contains an unsupported ANSI sequence.
+
+        """
+        if self._terminal is None:
+            self._terminal = Terminal(self.input_data, self.terminal_config)
+        return self._terminal
+
+    def matches(self, input_data: str, terminal_config: TerminalConfig) -> bool:
+        """Return whether the prototype was built from the input data and terminal configuration.
+
+        Args:
+            input_data (str): The input data to compare.
+            terminal_config (TerminalConfig): The terminal configuration to compare.
+
+        Returns:
+            bool: True if the input data and terminal configuration equal the ones the prototype was built with.
+
+        """
+        return self.input_data == input_data and self.terminal_config == terminal_config
+
+    @classmethod
+    def reuse_or_build(
+        cls,
+        prototype: TerminalPrototype | None,
+        input_data: str,
+        terminal_config: TerminalConfig,
+    ) -> TerminalPrototype:
+        """Return a prototype for the input data and terminal configuration, reusing the given one if it matches.
+
+        Args:
+            prototype (TerminalPrototype | None): The prototype to reuse, if any.
+            input_data (str): The input data to parse.
+            terminal_config (TerminalConfig): Configuration for the Terminal.
+
+        Returns:
+            TerminalPrototype: The given prototype if it matches, otherwise a new prototype.
+
+        """
+        if prototype is not None and prototype.matches(input_data, terminal_config):
+            return prototype
+        return cls(input_data, terminal_config)
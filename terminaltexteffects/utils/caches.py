@@ -0,0 +1,279 @@
+"""Registry of the memoization caches used by the engine and utility functions.
+
+Frequently called pure functions, such as `geometry.find_coord_on_line` and `graphics.shift_color_towards`,
+are memoized with bounded LRU caches. Each cache is registered here by name so it can be inspected, resized,
+and cleared at runtime. This is useful in long-lived processes that run many effects.
+
+Example:
+    ```python
+    from terminaltexteffects.utils import caches
+
+    caches.set_maxsize(1024, "geometry.find_coord_on_line")
+    with caches.scope():
+        ...  # run an effect
+    print(caches.stats()["geometry.find_coord_on_line"])
+    ```
+
+Classes:
+    CacheStats: Statistics for a registered cache.
+
+Functions:
+    register: Memoize a function with a registered LRU cache.
+    names: Return the names of the registered caches.
+    stats: Return statistics for the registered caches.
+    set_maxsize: Set the maximum size of registered caches.
+    clear: Clear registered caches.
+    scope: Context manager that clears registered caches when it exits.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import sys
+import typing
+from dataclasses import dataclass
+
+from terminaltexteffects.utils.exceptions import CacheNotFoundError, CacheSizeError
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Statistics for a registered cache.
+
+    Hits, misses, and evictions are counted from the time the cache is registered. Entries removed by
+    `clear` or by resizing the cache are not counted as evictions.
+
+    Attributes:
+        name (str): The name of the cache.
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls that ran the function.
+        evictions (int): The number of entries discarded because the cache was full.
+        currsize (int): The number of entries in the cache.
+        maxsize (int | None): The maximum number of entries in the cache, or None if it is unbounded.
+
+    """
+
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int | None
+
+
+class _RegisteredCache:
+    """An LRU cache around a function that can be resized and tracks statistics across clears."""
+
+    def __init__(self, name: str, func: typing.Callable[..., typing.Any], maxsize: int | None) -> None:
+        """Initialize the cache.
+
+        Args:
+            name (str): The name of the cache.
+            func (Callable): The function to memoize.
+            maxsize (int | None): The maximum number of entries, or None for an unbounded cache.
+
+        """
+        self.name = name
+        self.func = func
+        self.maxsize = maxsize
+        self.cached = self._new_cached(maxsize)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _new_cached(self, maxsize: int | None) -> typing.Callable[..., typing.Any]:
+        """Return the function memoized with a new LRU cache of the given size."""
+        return functools.wraps(self.func)(functools.lru_cache(maxsize=maxsize)(self.func))
+
+    def _retire(self) -> None:
+        """Add the statistics of the current LRU cache to the totals before it is cleared or replaced."""
+        info = self.cached.cache_info()
+        self._hits += info.hits
+        self._misses += info.misses
+        self._evictions += self._current_evictions(info.misses, info.currsize)
+
+    def _current_evictions(self, misses: int, currsize: int) -> int:
+        """Return the evictions of the current LRU cache. Every miss adds an entry to a bounded, non-zero cache."""
+        if not self.maxsize:
+            return 0
+        return misses - currsize
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._retire()
+        self.cached.cache_clear()
+
+    def set_maxsize(self, maxsize: int | None) -> None:
+        """Replace the cache with an empty cache of the given size.
+
+        The memoized function is rebound in the module it was defined in, so calls through the module
+        use the new cache.
+
+        Args:
+            maxsize (int | None): The maximum number of entries, or None for an unbounded cache.
+
+        """
+        self._retire()
+        previous_cached = self.cached
+        self.maxsize = maxsize
+        self.cached = self._new_cached(maxsize)
+        module = sys.modules.get(self.func.__module__)
+        if module is not None and getattr(module, self.func.__name__, None) is previous_cached:
+            setattr(module, self.func.__name__, self.cached)
+
+    def stats(self) -> CacheStats:
+        """Return the statistics for the cache."""
+        info = self.cached.cache_info()
+        return CacheStats(
+            name=self.name,
+            hits=self._hits + info.hits,
+            misses=self._misses + info.misses,
+            evictions=self._evictions + self._current_evictions(info.misses, info.currsize),
+            currsize=info.currsize,
+            maxsize=self.maxsize,
+        )
+
+
+_registry: dict[str, _RegisteredCache] = {}
+
+
+def _validate_maxsize(maxsize: int | None) -> None:
+    """Raise CacheSizeError if the maximum size is not None or an int >= 0."""
+    if maxsize is not None and (not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0):
+        raise CacheSizeError(maxsize)
+
+
+def register(func: F, *, maxsize: int | None, name: str = "") -> F:
+    """Memoize a function with a registered LRU cache.
+
+    The returned function is a `functools.lru_cache` wrapper and must be assigned to the function's name in
+    its module, e.g. `find_coord_on_line = caches.register(find_coord_on_line, maxsize=16384)`. Resizing the
+    cache with `set_maxsize` rebinds that name to a new wrapper, so callers should look the function up
+    through its module rather than importing it directly. Use `clear` rather than the wrapper's
+    `cache_clear()` so the cleared statistics are kept in the totals reported by `stats`.
+
+    Args:
+        func (F): The function to memoize. Its arguments must be hashable.
+        maxsize (int | None): The maximum number of entries, or None for an unbounded cache.
+        name (str, optional): The name of the cache. Defaults to the last component of the function's module
+            and its qualified name, e.g. `geometry.find_coord_on_line`.
+
+    Raises:
+        CacheSizeError: If `maxsize` is not None or an int >= 0.
+
+    Returns:
+        F: The memoized function.
+
+    """
+    _validate_maxsize(maxsize)
+    if not name:
+        name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+    cache = _RegisteredCache(name, func, maxsize)
+    _registry[name] = cache
+    return typing.cast("F", cache.cached)
+
+
+def _get(name: str) -> _RegisteredCache:
+    """Return the registered cache with the given name.
+
+    Raises:
+        CacheNotFoundError: If no cache is registered with the name.
+
+    """
+    cache = _registry.get(name)
+    if cache is None:
+        raise CacheNotFoundError(name)
+    return cache
+
+
+def names() -> list[str]:
+    """Return the names of the registered caches.
+
+    Returns:
+        list[str]: The names of the registered caches, in registration order.
+
+    """
+    return list(_registry)
+
+
+def stats(*cache_names: str) -> dict[str, CacheStats]:
+    """Return statistics for the registered caches.
+
+    Args:
+        *cache_names (str): Names of the caches. If none are given, statistics for all caches are returned.
+
+    Raises:
+        CacheNotFoundError: If a name is not registered.
+
+    Returns:
+        dict[str, CacheStats]: A mapping of cache name to CacheStats.
+
+    """
+    return {name: _get(name).stats() for name in cache_names or _registry}
+
+
+def set_maxsize(maxsize: int | None, *cache_names: str) -> None:
+    """Set the maximum size of registered caches.
+
+    Resizing a cache discards its entries and rebinds the memoized function in its module.
+
+    Args:
+        maxsize (int | None): The maximum number of entries, or None for unbounded caches. A size of 0
+            disables caching.
+        *cache_names (str): Names of the caches to resize. If none are given, all caches are resized.
+
+    Raises:
+        CacheSizeError: If `maxsize` is not None or an int >= 0.
+        CacheNotFoundError: If a name is not registered.
+
+    """
+    _validate_maxsize(maxsize)
+    caches = [_get(name) for name in cache_names or _registry]
+    for cache in caches:
+        cache.set_maxsize(maxsize)
+
+
+def clear(*cache_names: str) -> None:
+    """Clear registered caches.
+
+    Args:
+        *cache_names (str): Names of the caches to clear. If none are given, all caches are cleared.
+
+    Raises:
+        CacheNotFoundError: If a name is not registered.
+
+    """
+    caches = [_get(name) for name in cache_names or _registry]
+    for cache in caches:
+        cache.clear()
+
+
+@contextlib.contextmanager
+def scope(*cache_names: str) -> Iterator[None]:
+    """Clear registered caches when the context exits.
+
+    Use a scope around an effect run to discard the entries it cached, for example in a long-lived process
+    that renders many different inputs.
+
+    Args:
+        *cache_names (str): Names of the caches to clear. If none are given, all caches are cleared.
+
+    Raises:
+        CacheNotFoundError: If a name is not registered.
+
+    Yields:
+        None
+
+    """
+    for name in cache_names:
+        _get(name)
+    try:
+        yield
+    finally:
+        clear(*cache_names)
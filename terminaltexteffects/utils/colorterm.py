@@ -7,6 +7,8 @@ Functions:
 
 from __future__ import annotations
 
+from terminaltexteffects.utils import caches
+
 
 def _hex_to_int(hex_color: str) -> tuple[int, int, int]:
     """Convert a hex color string into an RGB integer tuple.
@@ -23,10 +25,36 @@ def _hex_to_int(hex_color: str) -> tuple[int, int, int]:
     return ints[0], ints[1], ints[2]
 
 
+# Precomputed SGR sequences for the XTerm-256 color codes, indexed by color code.
+_xterm_sequences = {
+    location: tuple(f"\x1b[{location};5;{color_code}m" for color_code in range(256)) for location in (38, 48)
+}
+
+
+def _rgb_sequence(hex_color: str, location: int) -> str:
+    """Return the SGR sequence for an RGB hex color string.
+
+    Args:
+        hex_color (str): Hex color string in the range 000000 -> FFFFFF. '#' is optional.
+        location (int): ANSI SGR color selector, where `38` applies foreground color
+            and `48` applies background color.
+
+    Returns:
+        str: The ANSI escape sequence for the color.
+
+    """
+    color_ints = _hex_to_int(hex_color)
+    return f"\x1b[{location};2;{color_ints[0]};{color_ints[1]};{color_ints[2]}m"
+
+
+_rgb_sequence = caches.register(_rgb_sequence, maxsize=8192)
+
+
 def _color(color_code: str | int, location: int) -> str:
     """Return an ANSI escape sequence to color the foreground/background of text.
 
-    This is a helper function for fg() and bg().
+    This is a helper function for fg() and bg(). XTerm-256 sequences are looked up in a
+    precomputed table and RGB sequences are cached.
 
     Args:
         color_code (str | int): The color code to be converted.
@@ -38,16 +66,16 @@ def _color(color_code: str | int, location: int) -> str:
 
     Raises:
         ValueError: If the color code is not in the range 000000 -> FFFFFF or 0 -> 255.
+        TypeError: If the color code is not a string or an int.
 
     """
     if isinstance(color_code, str):
-        color_ints = _hex_to_int(color_code)
-        sequence = f"\x1b[{location};2;{color_ints[0]};{color_ints[1]};{color_ints[2]}m"
+        sequence = _rgb_sequence(color_code, location)
     elif isinstance(color_code, int):
         if color_code not in range(256):
             msg = f"Got color code ({color_code}): xterm color codes must be an integer: 0 <= n <= 255"
             raise ValueError(msg)
-        sequence = f"\x1b[{location};5;{color_code}m"
+        sequence = _xterm_sequences[location][color_code]
     else:
         msg = (
             f"Got color code ({color_code}): Color must be either hex string #000000 -> #FFFFFF or"
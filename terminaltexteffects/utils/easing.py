@@ -38,6 +38,7 @@ Functions:
     out_bounce: Ease out using a bounce function.
     in_out_bounce: Ease in/out using a bounce function.
     make_easing: Create a cubic Bezier easing function using the provided control points.
+    sample_easing: Return the values of an easing function at every step of a fixed number of steps.
 """
 
 from __future__ import annotations
@@ -47,6 +48,8 @@ import math
 import typing
 from dataclasses import InitVar, dataclass, field
 
+from terminaltexteffects.utils import caches
+
 # EasingFunction is a type alias for a function that takes a float between 0 and 1 and returns a float between 0 and 1.
 EasingFunction = typing.Callable[[float], float]
 "EasingFunctions take a float between 0 and 1 and return a float between 0 and 1."
@@ -573,7 +576,28 @@ def make_easing(x1: float, y1: float, x2: float, y2: float) -> EasingFunction:
     return functools.wraps(bezier_easing)(functools.lru_cache(maxsize=8192)(bezier_easing))
 
 
-make_easing = functools.wraps(make_easing)(functools.lru_cache(maxsize=8192)(make_easing))
+make_easing = caches.register(make_easing, maxsize=8192)
+
+
+def sample_easing(easing_function: EasingFunction, total_steps: int) -> tuple[float, ...]:
+    """Return the values of an easing function at every step of a fixed number of steps.
+
+    The value at index `step` is `easing_function(step / total_steps)`, so looking up a step returns
+    exactly the value of calling the easing function. Samples are cached and shared by every caller
+    easing over the same number of steps, such as the engine's eased scenes and `EasingTracker`.
+
+    Args:
+        easing_function (EasingFunction): The easing function to sample.
+        total_steps (int): The number of steps. Must be greater than 0.
+
+    Returns:
+        tuple[float, ...]: The eased values for steps `0` through `total_steps`.
+
+    """
+    return tuple(easing_function(step / total_steps) for step in range(total_steps + 1))
+
+
+sample_easing = caches.register(sample_easing, maxsize=1024)
 
 
 @dataclass
@@ -618,8 +642,8 @@ class EasingTracker:
         """Advance the easing tracker by one step.
 
         If the current step is less than the total steps, increment the current step,
-        update the progress ratio, compute the new eased value using the easing function,
-        and calculate the step delta.
+        update the progress ratio, look up the new eased value in the shared samples of the
+        easing function (see `sample_easing`), and calculate the step delta.
 
         If clamp is enabled, the eased value is constrained between 0 and 1.
 
@@ -630,7 +654,7 @@ class EasingTracker:
         if self.current_step < self.total_steps:
             self.current_step += 1
             self.progress_ratio = self.current_step / self.total_steps
-            self.eased_value = self.easing_function(self.progress_ratio)
+            self.eased_value = sample_easing(self.easing_function, self.total_steps)[self.current_step]
             if self._clamp:
                 self.eased_value = max(0.0, min(self.eased_value, 1.0))
             self.step_delta = self.eased_value - self._last_eased_value
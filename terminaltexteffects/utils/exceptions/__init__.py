@@ -11,6 +11,7 @@ from terminaltexteffects.utils.exceptions.base_character_exceptions import (
     EventRegistrationCallerError,
     EventRegistrationTargetError,
 )
+from terminaltexteffects.utils.exceptions.cache_exceptions import CacheNotFoundError, CacheSizeError
 from terminaltexteffects.utils.exceptions.motion_exceptions import (
     ActivateEmptyPathError,
     DuplicatePathIDError,
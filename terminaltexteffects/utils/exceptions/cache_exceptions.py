@@ -0,0 +1,43 @@
+"""Custom exceptions for handling errors related to the cache registry in the terminaltexteffects package."""
+
+from __future__ import annotations
+
+from terminaltexteffects.utils.exceptions.base_terminaltexteffects_exception import TerminalTextEffectsError
+
+
+class CacheNotFoundError(TerminalTextEffectsError):
+    """Raised when a cache name is not registered in the cache registry.
+
+    Ref `terminaltexteffects.utils.caches.names()` for the registered cache names.
+
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize a CacheNotFoundError.
+
+        Args:
+            name (str): The cache name that was not found.
+
+        """
+        self.name = name
+        self.message = f"Cache `{name}` is not registered. Ref caches.names()."
+        super().__init__(self.message)
+
+
+class CacheSizeError(TerminalTextEffectsError):
+    """Raised when an invalid maximum size is provided for a cache.
+
+    Cache sizes must be `None` (unbounded) or an integer greater than or equal to 0.
+
+    """
+
+    def __init__(self, maxsize: int | None) -> None:
+        """Initialize a CacheSizeError.
+
+        Args:
+            maxsize (int | None): The invalid maximum size.
+
+        """
+        self.maxsize = maxsize
+        self.message = f"Invalid cache size: `{maxsize}`. Cache sizes must be None or an int >= 0."
+        super().__init__(self.message)
@@ -13,14 +13,26 @@ Functions:
     find_length_of_bezier_curve: Finds the length of a quadratic or cubic bezier curve.
     find_length_of_line: Finds the length of a line intersecting two coordinates.
     find_normalized_distance_from_center: Returns the normalized distance from the center of the Canvas.
+    find_coords_on_circles: Finds points on many circles.
+    find_coords_on_bezier_curves: Finds points on many bezier curves at many parameter values.
+    find_coords_on_lines: Finds points on many lines at many parameter values.
+
+The batch functions return the same coordinates as the scalar functions. If NumPy is installed, the arithmetic for
+the batch is vectorized, otherwise the scalar functions are called for each item.
 """
 
 from __future__ import annotations
 
-import functools
 import math
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Iterator, Sequence
+
+from terminaltexteffects.utils import caches
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
 
 
 @dataclass(eq=True, frozen=True)
@@ -86,7 +98,7 @@ def find_coords_on_circle(origin: Coord, radius: int, coords_limit: int = 0, *,
     return points
 
 
-find_coords_on_circle = functools.wraps(find_coords_on_circle)(functools.lru_cache(maxsize=8192)(find_coords_on_circle))
+find_coords_on_circle = caches.register(find_coords_on_circle, maxsize=8192)
 
 
 def find_coords_in_circle(center: Coord, diameter: int) -> list[Coord]:
@@ -120,7 +132,7 @@ def find_coords_in_circle(center: Coord, diameter: int) -> list[Coord]:
     return coords_in_ellipse
 
 
-find_coords_in_circle = functools.wraps(find_coords_in_circle)(functools.lru_cache(maxsize=8192)(find_coords_in_circle))
+find_coords_in_circle = caches.register(find_coords_in_circle, maxsize=8192)
 
 
 def find_coords_in_rect(origin: Coord, distance: int) -> list[Coord]:
@@ -152,7 +164,7 @@ def find_coords_in_rect(origin: Coord, distance: int) -> list[Coord]:
     return coords
 
 
-find_coords_in_rect = functools.wraps(find_coords_in_rect)(functools.lru_cache(maxsize=8192)(find_coords_in_rect))
+find_coords_in_rect = caches.register(find_coords_in_rect, maxsize=8192)
 
 
 def find_coords_on_rect(origin: Coord, half_width: int, half_height: int) -> list[Coord]:
@@ -185,7 +197,7 @@ def find_coords_on_rect(origin: Coord, half_width: int, half_height: int) -> lis
     return coords
 
 
-find_coords_on_rect = functools.wraps(find_coords_on_rect)(functools.lru_cache(maxsize=8192)(find_coords_on_rect))
+find_coords_on_rect = caches.register(find_coords_on_rect, maxsize=8192)
 
 
 def extrapolate_along_ray(origin: Coord, target: Coord, offset_from_target: float) -> Coord:
@@ -215,9 +227,7 @@ def extrapolate_along_ray(origin: Coord, target: Coord, offset_from_target: floa
     return Coord(round(next_column), round(next_row))
 
 
-extrapolate_along_ray = functools.wraps(extrapolate_along_ray)(
-    functools.lru_cache(maxsize=8192)(extrapolate_along_ray),
-)
+extrapolate_along_ray = caches.register(extrapolate_along_ray, maxsize=8192)
 
 
 def find_coord_on_bezier_curve(start: Coord, control: tuple[Coord, ...], end: Coord, t: float) -> Coord:
@@ -249,9 +259,7 @@ def find_coord_on_bezier_curve(start: Coord, control: tuple[Coord, ...], end: Co
     return Coord(round(result.column), round(result.row))
 
 
-find_coord_on_bezier_curve = functools.wraps(find_coord_on_bezier_curve)(
-    functools.lru_cache(maxsize=16384)(find_coord_on_bezier_curve),
-)
+find_coord_on_bezier_curve = caches.register(find_coord_on_bezier_curve, maxsize=16384)
 
 
 def find_coord_on_line(start: Coord, end: Coord, t: float) -> Coord:
@@ -271,7 +279,7 @@ def find_coord_on_line(start: Coord, end: Coord, t: float) -> Coord:
     return Coord(round(x), round(y))
 
 
-find_coord_on_line = functools.wraps(find_coord_on_line)(functools.lru_cache(maxsize=16384)(find_coord_on_line))
+find_coord_on_line = caches.register(find_coord_on_line, maxsize=16384)
 
 
 def find_length_of_bezier_curve(start: Coord, control: tuple[Coord, ...] | Coord, end: Coord) -> float:
@@ -302,9 +310,7 @@ def find_length_of_bezier_curve(start: Coord, control: tuple[Coord, ...] | Coord
     return length
 
 
-find_length_of_bezier_curve = functools.wraps(find_length_of_bezier_curve)(
-    functools.lru_cache(maxsize=4096)(find_length_of_bezier_curve),
-)
+find_length_of_bezier_curve = caches.register(find_length_of_bezier_curve, maxsize=4096)
 
 
 def find_length_of_line(coord1: Coord, coord2: Coord, *, double_row_diff: bool = False) -> float:
@@ -330,7 +336,7 @@ def find_length_of_line(coord1: Coord, coord2: Coord, *, double_row_diff: bool =
     return math.hypot(column_diff, row_diff)
 
 
-find_length_of_line = functools.wraps(find_length_of_line)(functools.lru_cache(maxsize=8192)(find_length_of_line))
+find_length_of_line = caches.register(find_length_of_line, maxsize=8192)
 
 
 def find_normalized_distance_from_center(bottom: int, top: int, left: int, right: int, other_coord: Coord) -> float:
@@ -371,6 +377,127 @@ def find_normalized_distance_from_center(bottom: int, top: int, left: int, right
     return distance / (max_distance / 2)
 
 
-find_normalized_distance_from_center = functools.wraps(find_normalized_distance_from_center)(
-    functools.lru_cache(maxsize=8192)(find_normalized_distance_from_center),
-)
+find_normalized_distance_from_center = caches.register(find_normalized_distance_from_center, maxsize=8192)
+
+
+def _get_unit_circle(coords_limit: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return the cosine and sine of the angles used by `find_coords_on_circle` for the given number of points.
+
+    The values are calculated with `math` rather than NumPy so they match the scalar function exactly.
+    """
+    angle_step = 2 * math.pi / coords_limit
+    angles = [angle_step * i for i in range(coords_limit)]
+    return tuple(math.cos(angle) for angle in angles), tuple(math.sin(angle) for angle in angles)
+
+
+_get_unit_circle = caches.register(_get_unit_circle, maxsize=256)
+
+
+def _unique_coords(columns: list[int], rows: list[int], *, unique: bool) -> list[Coord]:
+    """Return Coords for the columns and rows, removing duplicates if unique is True."""
+    coords = [Coord(column, row) for column, row in zip(columns, rows)]
+    if unique:
+        return list(dict.fromkeys(coords))
+    return coords
+
+
+def find_coords_on_circles(
+    circles: Sequence[tuple[Coord, int]],
+    coords_limit: int = 0,
+    *,
+    unique: bool = True,
+) -> list[list[Coord]]:
+    """Find points on many circles.
+
+    Equivalent to calling `find_coords_on_circle` for each circle. Circles with the same radius are calculated
+    together when NumPy is installed.
+
+    Args:
+        circles (Sequence[tuple[Coord, int]]): (origin, radius) pairs for the circles.
+        coords_limit (int): limit the number of coords returned for each circle, if 0, the number of points is
+            calculated based on the circumference of each circle
+        unique (bool): whether to remove duplicate points. Defaults to True.
+
+    Returns:
+        list[list[Coord]]: list of Coord points on each circle, in the order of `circles`
+
+    """
+    if np is None:
+        return [list(find_coords_on_circle(origin, radius, coords_limit, unique=unique)) for origin, radius in circles]
+    results: list[list[Coord]] = [[] for _ in circles]
+    groups: dict[int, list[int]] = {}
+    for index, (_, radius) in enumerate(circles):
+        if radius:
+            groups.setdefault(radius, []).append(index)
+    for radius, indexes in groups.items():
+        limit = coords_limit or round(2 * math.pi * radius)
+        cosines, sines = _get_unit_circle(limit)
+        origin_columns = np.array([[circles[index][0].column] for index in indexes])
+        origin_rows = np.array([[circles[index][0].row] for index in indexes])
+        x = origin_columns + radius * np.array(cosines)
+        # correct for terminal character height/width ratio by doubling the x distance from origin
+        x = x + (x - origin_columns)
+        y = origin_rows + radius * np.array(sines)
+        for index, columns, rows in zip(indexes, np.rint(x).astype(int).tolist(), np.rint(y).astype(int).tolist()):
+            results[index] = _unique_coords(columns, rows, unique=unique)
+    return results
+
+
+def find_coords_on_bezier_curves(
+    curves: Sequence[tuple[Coord, tuple[Coord, ...], Coord]],
+    t_values: Sequence[float],
+) -> list[list[Coord]]:
+    """Find points on many bezier curves at many parameter values.
+
+    Equivalent to calling `find_coord_on_bezier_curve` for each curve and parameter value. Curves of the same
+    degree are calculated together when NumPy is installed.
+
+    Args:
+        curves (Sequence[tuple[Coord, tuple[Coord, ...], Coord]]): (start, control, end) for the curves.
+        t_values (Sequence[float]): The distance factors between the start and end coordinates.
+
+    Returns:
+        list[list[Coord]]: For each curve, the coordinates corresponding to each parameter value.
+
+    """
+    if np is None:
+        return [
+            [find_coord_on_bezier_curve(start, control, end, t) for t in t_values] for start, control, end in curves
+        ]
+    results: list[list[Coord]] = [[] for _ in curves]
+    groups: dict[int, list[int]] = {}
+    for index, (_, control, _) in enumerate(curves):
+        groups.setdefault(len(control), []).append(index)
+    t = np.array(t_values, dtype=float)[None, :, None]
+    one_minus_t = 1 - t
+    for indexes in groups.values():
+        points = [(curves[index][0], *curves[index][1], curves[index][2]) for index in indexes]
+        columns = np.array([[point.column for point in curve_points] for curve_points in points])[:, None, :]
+        rows = np.array([[point.row for point in curve_points] for curve_points in points])[:, None, :]
+        # de Casteljau's algorithm, one level of the recursion at a time for every curve and parameter value
+        while columns.shape[-1] > 1:
+            columns = one_minus_t * columns[..., :-1] + t * columns[..., 1:]
+            rows = one_minus_t * rows[..., :-1] + t * rows[..., 1:]
+        curve_columns = np.rint(columns[..., 0]).astype(int).tolist()
+        curve_rows = np.rint(rows[..., 0]).astype(int).tolist()
+        for index, point_columns, point_rows in zip(indexes, curve_columns, curve_rows):
+            results[index] = [Coord(column, row) for column, row in zip(point_columns, point_rows)]
+    return results
+
+
+def find_coords_on_lines(lines: Sequence[tuple[Coord, Coord]], t_values: Sequence[float]) -> list[list[Coord]]:
+    """Find points on many lines at many parameter values.
+
+    Equivalent to calling `find_coord_on_line` for each line and parameter value.
+
+    Args:
+        lines (Sequence[tuple[Coord, Coord]]): (start, end) for the lines.
+        t_values (Sequence[float]): The distance factors between the start and end coordinates.
+
+    Returns:
+        list[list[Coord]]: For each line, the coordinates corresponding to each parameter value.
+
+    """
+    if np is None:
+        return [[find_coord_on_line(start, end, t) for t in t_values] for start, end in lines]
+    return find_coords_on_bezier_curves([(start, (), end) for start, end in lines], t_values)
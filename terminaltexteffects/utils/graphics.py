@@ -6,18 +6,19 @@ Classes:
     ColorPair: Represents a pair of colors to specify a character's foreground and background colors.
     Gradient: A list of `Color` objects transitioning from one color stop to another. Supports various gradient
         directions.
+    CoordinateColorMapping: A read-only mapping of coordinates to gradient colors that computes colors on lookup.
 """
 
 from __future__ import annotations
 
-import functools
 import itertools
+import math
 import random
 import typing
 from dataclasses import InitVar, dataclass, field
 from enum import Enum, auto
 
-from terminaltexteffects.utils import ansitools, colorterm, geometry, hexterm
+from terminaltexteffects.utils import ansitools, caches, colorterm, geometry, hexterm
 
 if typing.TYPE_CHECKING:
     from collections.abc import Iterator
@@ -29,6 +30,9 @@ class Color:
     The color can be initialized with an XTerm-256 color code or an RGB hex color string. Can be printed
     to display the color code and appearance as a color block.
 
+    Colors are interned by value. Creating a Color with a value that has been used before returns the existing
+    instance, so the value is only validated and parsed once. Color instances are shared and must not be modified.
+
     Attributes:
         color_arg (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
         xterm_color (int | None): The XTerm-256 color code. None if the color is an RGB hex color string.
@@ -36,14 +40,15 @@ class Color:
 
     Properties:
         rgb_ints (tuple[int, int, int]): Returns the RGB values as a tuple of integers.
+        packed_rgb (int): Returns the RGB values packed into a single integer.
 
     Raises:
         ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
 
     """
 
-    def __init__(self, color_value: int | str) -> None:
-        """Initialize a Color object.
+    def __new__(cls, color_value: int | str) -> Color:
+        """Return the Color for the value, creating and validating it if it has not been used before.
 
         Args:
             color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
@@ -52,26 +57,60 @@ class Color:
         Raises:
             ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
 
+        Returns:
+            Color: The Color for the value.
+
         """
         if isinstance(color_value, str):
             color_value = color_value.strip("#")
-        self.color_arg = color_value
-        self.xterm_color: int | None = None
-        if hexterm.is_valid_color(color_value):
-            if isinstance(color_value, int):
-                self.xterm_color = color_value
-                self.rgb_color = hexterm.xterm_to_hex(color_value)
-            else:
-                self.rgb_color = color_value
-                self.xterm_color = None
-        else:
-            msg = (
-                "Invalid color value. Color must be an XTerm-256 color code or an RGB hex color string. "
-                "Example: 255 or 'ffffff' or '#ffffff'"
-            )
-            raise ValueError(
-                msg,
-            )
+        elif type(color_value) is not int:
+            # the cache is keyed on equality, so values such as 1.0 and True must not reach it
+            raise ValueError(_INVALID_COLOR_MESSAGE)
+        return _get_color(cls, color_value)
+
+    def __init__(self, color_value: int | str) -> None:
+        """Initialize a Color object.
+
+        The color is created and validated by `__new__`, which returns an interned instance, so there is nothing
+        left to initialize.
+
+        Args:
+            color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
+                Example: 255 or 'ffffff' or '#ffffff'
+
+        Raises:
+            ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
+
+        """
+
+    def _set_values(
+        self,
+        color_arg: int | str,
+        rgb_color: str,
+        xterm_color: int | None,
+        rgb_ints: tuple[int, int, int],
+    ) -> None:
+        """Set the attributes of a new Color."""
+        self.color_arg = color_arg
+        self.xterm_color = xterm_color
+        self.rgb_color = rgb_color
+        self._rgb_ints = rgb_ints
+        self._packed_rgb = (rgb_ints[0] << 16) | (rgb_ints[1] << 8) | rgb_ints[2]
+
+    @classmethod
+    def _from_rgb_ints(cls, red: int, green: int, blue: int) -> Color:
+        """Return the Color for RGB values that are known to be in the range 0-255, without validating them.
+
+        Args:
+            red (int): The red value.
+            green (int): The green value.
+            blue (int): The blue value.
+
+        Returns:
+            Color: The Color for the RGB values.
+
+        """
+        return _get_color_from_rgb_ints(cls, red, green, blue)
 
     @property
     def rgb_ints(self) -> tuple[int, int, int]:
@@ -81,7 +120,17 @@ class Color:
             tuple[int, int, int]: The RGB values as a tuple of integers.
 
         """
-        return colorterm._hex_to_int(self.rgb_color)
+        return self._rgb_ints
+
+    @property
+    def packed_rgb(self) -> int:
+        """Returns the RGB values packed into a single integer, e.g. 0xFF8000 for 'ff8000'.
+
+        Returns:
+            int: The RGB values packed into a single integer.
+
+        """
+        return self._packed_rgb
 
     def __repr__(self) -> str:
         """Return a string representation of the Color object."""
@@ -122,6 +171,67 @@ class Color:
         """Return an iterator yielding this `Color` instance once."""
         return iter((self,))
 
+    def __reduce__(self) -> tuple[type[Color], tuple[int | str]]:
+        """Return the arguments used to recreate the Color when it is pickled."""
+        return (type(self), (self.color_arg,))
+
+    def __copy__(self) -> Color:
+        """Return this Color. Colors are shared and must not be modified, so copies are not needed."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> Color:
+        """Return this Color. Colors are shared and must not be modified, so copies are not needed."""
+        return self
+
+
+_INVALID_COLOR_MESSAGE = (
+    "Invalid color value. Color must be an XTerm-256 color code or an RGB hex color string. "
+    "Example: 255 or 'ffffff' or '#ffffff'"
+)
+
+
+def _get_color(cls: type[Color], color_value: int | str) -> Color:
+    """Create and validate a Color. Interned by `Color.__new__`.
+
+    Args:
+        cls (type[Color]): The Color class.
+        color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string without '#'.
+
+    Raises:
+        ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
+
+    Returns:
+        Color: The new Color.
+
+    """
+    if not hexterm.is_valid_color(color_value):
+        raise ValueError(_INVALID_COLOR_MESSAGE)
+    color = object.__new__(cls)
+    if isinstance(color_value, int):
+        rgb_color = hexterm.xterm_to_hex(color_value)
+        color._set_values(color_value, rgb_color, color_value, colorterm._hex_to_int(rgb_color))
+    else:
+        color._set_values(color_value, color_value, None, colorterm._hex_to_int(color_value))
+    return color
+
+
+_get_color = caches.register(_get_color, maxsize=65536, name="graphics.Color")
+
+
+def _get_color_from_rgb_ints(cls: type[Color], red: int, green: int, blue: int) -> Color:
+    """Create a Color from RGB values in the range 0-255 without validation. Interned by `Color._from_rgb_ints`."""
+    color = object.__new__(cls)
+    rgb_color = f"{red:02x}{green:02x}{blue:02x}"
+    color._set_values(rgb_color, rgb_color, None, (red, green, blue))
+    return color
+
+
+_get_color_from_rgb_ints = caches.register(
+    _get_color_from_rgb_ints,
+    maxsize=65536,
+    name="graphics.Color._from_rgb_ints",
+)
+
 
 @dataclass()
 class ColorPair:
@@ -251,13 +361,18 @@ class Gradient:
             Color: The color at the fraction of the gradient.
 
         """
-        if fraction < 0 or fraction > 1:
+        if not 0 <= fraction <= 1:
             msg = "Fraction must be 0 <= fraction <= 1."
             raise ValueError(msg)
-        for i in range(1, len(self.spectrum) + 1):
-            if fraction <= i / len(self.spectrum):
-                return self.spectrum[i - 1]
-        return self.spectrum[-1]
+        # Find the first index i (1-based) where fraction <= i / len(spectrum). The estimate is corrected in both
+        # directions so floating point rounding gives the same color as comparing against every index.
+        spectrum_length = len(self.spectrum)
+        index = max(math.ceil(fraction * spectrum_length), 1)
+        while index > 1 and fraction <= (index - 1) / spectrum_length:
+            index -= 1
+        while index < spectrum_length and fraction > index / spectrum_length:
+            index += 1
+        return self.spectrum[index - 1]
 
     def _generate(self, steps: int | tuple[int, ...]) -> list[Color]:
         """Calculate a gradient of colors between two colors using linear interpolation.
@@ -277,62 +392,20 @@ class Gradient:
         The step count includes the stop for each pair. Total number of colors in the resulting gradient spectrum:
         sum(steps) + 1
 
+        Spectra are cached by stops, steps, and loop, so gradients with the same arguments share the generated
+        colors. Each Gradient gets its own copy of the spectrum list.
+
         Returns:
             list[Color]: List (length=sum(steps) + 1) of generated `Color` objects. The first and last
                 colors are the start and end stops, respectively.
 
         """
-        if isinstance(steps, int):
-            steps = (steps,)
-            for step in steps:
-                if step < 1:
-                    msg = "Steps must be greater than 0."
-                    raise ValueError(msg)
-        spectrum: list[Color] = []
-        if len(self._stops) == 1:
-            color = self._stops[0]
-            spectrum.extend(color for _ in range(steps[0]))
-            return spectrum
-        if self._loop:
+        if not isinstance(steps, int):
+            steps = tuple(steps)
+        spectrum = _generate_spectrum(self._stops, steps, loop=self._loop)
+        if self._loop and len(self._stops) > 1:
             self._stops = (*self._stops, self._stops[0])
-        a, b = itertools.tee(self._stops)
-        next(b, None)
-        color_pairs = list(zip(a, b))
-        steps = steps[: len(color_pairs)]
-        if len(steps) < len(color_pairs):
-            steps = steps + (steps[-1],) * (len(color_pairs) - len(steps))
-        color_pair: tuple[Color, Color]
-        for color_pair, step_count in zip(color_pairs, steps):
-            if step_count < 1:
-                msg = f"Invalid steps: {step_count} | Steps must be greater than 0."
-                raise ValueError(msg)
-            start, end = color_pair
-            start_color_ints = start.rgb_ints
-            end_color_ints = end.rgb_ints
-            # Initialize an empty list to store the gradient colors
-            gradient_colors: list[Color] = []
-            # Calculate the color deltas for each RGB value
-            red_delta = (end_color_ints[0] - start_color_ints[0]) // step_count
-            green_delta = (end_color_ints[1] - start_color_ints[1]) // step_count
-            blue_delta = (end_color_ints[2] - start_color_ints[2]) // step_count
-            # Calculate the intermediate colors and add them to the gradient colors list
-            range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
-            for i in range(range_start, max(step_count, 0)):
-                red = start_color_ints[0] + (red_delta * i)
-                green = start_color_ints[1] + (green_delta * i)
-                blue = start_color_ints[2] + (blue_delta * i)
-
-                # Ensure that the RGB values are within the valid range of 0-255
-                red = max(0, min(red, 255))
-                green = max(0, min(green, 255))
-                blue = max(0, min(blue, 255))
-
-                # Convert the RGB values to a hex color string and add it to the gradient colors list
-                gradient_colors.append(Color(f"{red:02x}{green:02x}{blue:02x}"))
-            # Add the end color to the gradient colors list
-            gradient_colors.append(end)
-            spectrum.extend(gradient_colors)
-        return spectrum
+        return list(spectrum)
 
     def build_coordinate_color_mapping(
         self,
@@ -341,13 +414,16 @@ class Gradient:
         min_column: int,
         max_column: int,
         direction: Gradient.Direction,
-    ) -> dict[geometry.Coord, Color]:
+    ) -> CoordinateColorMapping:
         """Build a mapping of coordinates to colors based on the gradient and a direction.
 
         For example, a vertical gradient will have the same color for each character in a row. When applied across all
         characters in the canvas, the gradient will be visible as a vertical gradient. The mapping respects the
         provided row and column bounds for every direction.
 
+        The mapping is read-only and computes colors when they are looked up, so it does not store a color for
+        every coordinate.
+
         Args:
             min_row (int): The minimum row value. Must be greater than 0 and less than or equal to max_row.
             max_row (int): The maximum row value. Must be greater than 0 and greater than or equal to min_row.
@@ -356,7 +432,7 @@ class Gradient:
             direction (Gradient.Direction): The direction of the gradient.
 
         Returns:
-            dict[geometry.Coord, Color]: A mapping of coordinates to `Color` objects.
+            CoordinateColorMapping: A mapping of coordinates to `Color` objects.
 
         """
         if any(value < 1 for value in (max_row, max_column, min_row, min_column)):
@@ -365,43 +441,7 @@ class Gradient:
         if min_row > max_row or min_column > max_column:
             msg = "min_row and min_column must be less than or equal to max_row and max_column."
             raise ValueError(msg)
-        row_offset = min_row - 1
-        column_offset = min_column - 1
-        gradient_mapping: dict[geometry.Coord, Color] = {}
-        if direction == Gradient.Direction.VERTICAL:
-            for row_value in range(min_row, max_row + 1):
-                fraction = (row_value - row_offset) / (max_row - row_offset)
-                color = self.get_color_at_fraction(fraction)
-                for column_value in range(min_column, max_column + 1):
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-        elif direction == Gradient.Direction.HORIZONTAL:
-            for column_value in range(min_column, max_column + 1):
-                fraction = (column_value - column_offset) / (max_column - column_offset)
-                color = self.get_color_at_fraction(fraction)
-                for row_value in range(min_row, max_row + 1):
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-        elif direction == Gradient.Direction.RADIAL:
-            for row_value in range(min_row, max_row + 1):
-                for column_value in range(min_column, max_column + 1):
-                    distance_from_center = geometry.find_normalized_distance_from_center(
-                        min_row,
-                        max_row,
-                        min_column,
-                        max_column,
-                        geometry.Coord(column_value, row_value),
-                    )
-                    color = self.get_color_at_fraction(distance_from_center)
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-        elif direction == Gradient.Direction.DIAGONAL:
-            for row_value in range(min_row, max_row + 1):
-                for column_value in range(min_column, max_column + 1):
-                    fraction = (((row_value - row_offset) * 2) + (column_value - column_offset)) / (
-                        ((max_row - row_offset) * 2) + (max_column - column_offset)
-                    )
-                    color = self.get_color_at_fraction(fraction)
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-
-        return gradient_mapping
+        return CoordinateColorMapping(self, min_row, max_row, min_column, max_column, direction)
 
     def __iter__(self) -> Iterator[Color]:
         """Return an iterator over the Gradient object."""
@@ -429,6 +469,196 @@ class Gradient:
         )
 
 
+class CoordinateColorMapping(typing.Mapping[geometry.Coord, Color]):
+    """A read-only mapping of coordinates to gradient colors, built by `Gradient.build_coordinate_color_mapping`.
+
+    Colors are computed when a coordinate is looked up. Vertical and horizontal gradients store one color per row
+    or column. Radial and diagonal gradients calculate the color from the row and column. Iteration yields the
+    coordinates in the same order as a dictionary built row by row, or column by column for horizontal gradients.
+
+    Attributes:
+        min_row (int): The minimum row value.
+        max_row (int): The maximum row value.
+        min_column (int): The minimum column value.
+        max_column (int): The maximum column value.
+        direction (Gradient.Direction): The direction of the gradient.
+
+    """
+
+    def __init__(
+        self,
+        gradient: Gradient,
+        min_row: int,
+        max_row: int,
+        min_column: int,
+        max_column: int,
+        direction: Gradient.Direction,
+    ) -> None:
+        """Initialize a CoordinateColorMapping.
+
+        Args:
+            gradient (Gradient): The gradient providing the colors.
+            min_row (int): The minimum row value.
+            max_row (int): The maximum row value.
+            min_column (int): The minimum column value.
+            max_column (int): The maximum column value.
+            direction (Gradient.Direction): The direction of the gradient.
+
+        """
+        self._gradient = gradient
+        self.min_row = min_row
+        self.max_row = max_row
+        self.min_column = min_column
+        self.max_column = max_column
+        self.direction = direction
+        row_offset = min_row - 1
+        column_offset = min_column - 1
+        self._row_colors: list[Color] = []
+        self._column_colors: list[Color] = []
+        if direction == Gradient.Direction.VERTICAL:
+            self._row_colors = [
+                gradient.get_color_at_fraction((row_value - row_offset) / (max_row - row_offset))
+                for row_value in range(min_row, max_row + 1)
+            ]
+        elif direction == Gradient.Direction.HORIZONTAL:
+            self._column_colors = [
+                gradient.get_color_at_fraction((column_value - column_offset) / (max_column - column_offset))
+                for column_value in range(min_column, max_column + 1)
+            ]
+
+    def _color_at(self, column_value: int, row_value: int) -> Color:
+        """Return the color for a coordinate within the bounds."""
+        if self.direction == Gradient.Direction.VERTICAL:
+            return self._row_colors[row_value - self.min_row]
+        if self.direction == Gradient.Direction.HORIZONTAL:
+            return self._column_colors[column_value - self.min_column]
+        if self.direction == Gradient.Direction.RADIAL:
+            distance_from_center = geometry.find_normalized_distance_from_center(
+                self.min_row,
+                self.max_row,
+                self.min_column,
+                self.max_column,
+                geometry.Coord(column_value, row_value),
+            )
+            return self._gradient.get_color_at_fraction(distance_from_center)
+        row_offset = self.min_row - 1
+        column_offset = self.min_column - 1
+        fraction = (((row_value - row_offset) * 2) + (column_value - column_offset)) / (
+            ((self.max_row - row_offset) * 2) + (self.max_column - column_offset)
+        )
+        return self._gradient.get_color_at_fraction(fraction)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the key is a coordinate within the bounds of the mapping."""
+        return (
+            isinstance(key, geometry.Coord)
+            and self.min_row <= key.row <= self.max_row
+            and self.min_column <= key.column <= self.max_column
+        )
+
+    def __getitem__(self, key: geometry.Coord) -> Color:
+        """Return the color for the coordinate.
+
+        Raises:
+            KeyError: If the key is not a coordinate within the bounds of the mapping.
+
+        """
+        if key not in self:
+            raise KeyError(key)
+        return self._color_at(key.column, key.row)
+
+    def __iter__(self) -> Iterator[geometry.Coord]:
+        """Return an iterator over the coordinates in the mapping."""
+        if self.direction == Gradient.Direction.HORIZONTAL:
+            for column_value in range(self.min_column, self.max_column + 1):
+                for row_value in range(self.min_row, self.max_row + 1):
+                    yield geometry.Coord(column_value, row_value)
+        else:
+            for row_value in range(self.min_row, self.max_row + 1):
+                for column_value in range(self.min_column, self.max_column + 1):
+                    yield geometry.Coord(column_value, row_value)
+
+    def __len__(self) -> int:
+        """Return the number of coordinates in the mapping."""
+        return (self.max_row - self.min_row + 1) * (self.max_column - self.min_column + 1)
+
+
+def _generate_spectrum(
+    stops: tuple[Color, ...],
+    steps: int | tuple[int, ...],
+    *,
+    loop: bool,
+) -> tuple[Color, ...]:
+    """Generate the spectrum of a Gradient. Ref `Gradient._generate`.
+
+    Args:
+        stops (tuple[Color, ...]): The color stops.
+        steps (int | tuple[int, ...]): Number of steps or a tuple of step values for generating the spectrum.
+        loop (bool): Whether the final color transitions back to the first color.
+
+    Raises:
+        ValueError: If a step value is less than 1.
+
+    Returns:
+        tuple[Color, ...]: The colors of the spectrum.
+
+    """
+    if isinstance(steps, int):
+        steps = (steps,)
+        for step in steps:
+            if step < 1:
+                msg = "Steps must be greater than 0."
+                raise ValueError(msg)
+    spectrum: list[Color] = []
+    if len(stops) == 1:
+        color = stops[0]
+        spectrum.extend(color for _ in range(steps[0]))
+        return tuple(spectrum)
+    if loop:
+        stops = (*stops, stops[0])
+    a, b = itertools.tee(stops)
+    next(b, None)
+    color_pairs = list(zip(a, b))
+    steps = steps[: len(color_pairs)]
+    if len(steps) < len(color_pairs):
+        steps = steps + (steps[-1],) * (len(color_pairs) - len(steps))
+    color_pair: tuple[Color, Color]
+    for color_pair, step_count in zip(color_pairs, steps):
+        if step_count < 1:
+            msg = f"Invalid steps: {step_count} | Steps must be greater than 0."
+            raise ValueError(msg)
+        start, end = color_pair
+        start_color_ints = start.rgb_ints
+        end_color_ints = end.rgb_ints
+        # Initialize an empty list to store the gradient colors
+        gradient_colors: list[Color] = []
+        # Calculate the color deltas for each RGB value
+        red_delta = (end_color_ints[0] - start_color_ints[0]) // step_count
+        green_delta = (end_color_ints[1] - start_color_ints[1]) // step_count
+        blue_delta = (end_color_ints[2] - start_color_ints[2]) // step_count
+        # Calculate the intermediate colors and add them to the gradient colors list
+        range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
+        for i in range(range_start, max(step_count, 0)):
+            red = start_color_ints[0] + (red_delta * i)
+            green = start_color_ints[1] + (green_delta * i)
+            blue = start_color_ints[2] + (blue_delta * i)
+
+            # Ensure that the RGB values are within the valid range of 0-255
+            red = max(0, min(red, 255))
+            green = max(0, min(green, 255))
+            blue = max(0, min(blue, 255))
+
+            # Convert the RGB values to a hex color string and add it to the gradient colors list
+            gradient_colors.append(Color._from_rgb_ints(red, green, blue))
+        # Add the end color to the gradient colors list
+        gradient_colors.append(end)
+        spectrum.extend(gradient_colors)
+    return tuple(spectrum)
+
+
+_generate_spectrum = caches.register(_generate_spectrum, maxsize=4096)
+
+
 def random_color() -> Color:
     """Return a random `Color` created from a six-digit RGB hex value.
 
@@ -461,13 +691,8 @@ def shift_color_towards(color: Color, target_color: Color, factor: float) -> Col
         return start + (end - start) * factor
 
     # Normalize RGB values
-    color_red = int(color.rgb_color[0:2], 16) / 255
-    color_green = int(color.rgb_color[2:4], 16) / 255
-    color_blue = int(color.rgb_color[4:6], 16) / 255
-
-    target_red = int(target_color.rgb_color[0:2], 16) / 255
-    target_green = int(target_color.rgb_color[2:4], 16) / 255
-    target_blue = int(target_color.rgb_color[4:6], 16) / 255
+    color_red, color_green, color_blue = (value / 255 for value in color.rgb_ints)
+    target_red, target_green, target_blue = (value / 255 for value in target_color.rgb_ints)
 
     # Interpolate RGB values
     new_red = interpolate(color_red, target_red, factor)
@@ -479,4 +704,4 @@ def shift_color_towards(color: Color, target_color: Color, factor: float) -> Col
     return Color(shifted_color)
 
 
-shift_color_towards = functools.wraps(shift_color_towards)(functools.lru_cache(maxsize=8192)(shift_color_towards))
+shift_color_towards = caches.register(shift_color_towards, maxsize=8192)
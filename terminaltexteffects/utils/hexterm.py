@@ -9,6 +9,8 @@ Functions:
 
 from __future__ import annotations
 
+from terminaltexteffects.utils import caches
+
 xterm_to_hex_map = {
     0: "#000000",
     1: "#800000",
@@ -271,11 +273,26 @@ xterm_to_hex_map = {
 xterm_to_rgb_map = {k: (int(v[1:3], 16), int(v[3:5], 16), int(v[5:7], 16)) for k, v in xterm_to_hex_map.items()}
 
 
+# XTerm colors 16-231 form a 6x6x6 cube with these channel levels, color = 16 + 36 * red + 6 * green + blue.
+_CUBE_LEVELS = (0x00, 0x5F, 0x87, 0xAF, 0xD7, 0xFF)
+# (level index, absolute difference) of the closest cube level for each channel value, lowest level on ties.
+_nearest_cube_level = tuple(
+    min(((index, abs(value - level)) for index, level in enumerate(_CUBE_LEVELS)), key=lambda item: item[1])
+    for value in range(256)
+)
+_system_colors = tuple((xterm_color, *xterm_to_rgb_map[xterm_color]) for xterm_color in range(16))
+_grayscale_colors = tuple((xterm_color, *xterm_to_rgb_map[xterm_color]) for xterm_color in range(232, 256))
+
+
 def hex_to_xterm(hex_color: str) -> int:
     """Convert RGB Hex colors to their closest XTerm-256 color.
 
     Closeness is determined by the mean absolute difference across the red, green,
-    and blue channels.
+    and blue channels. Ties resolve to the lowest XTerm-256 color code.
+
+    The difference is a sum over the channels, so the closest color in the 6x6x6 color cube is found by
+    choosing the closest level for each channel. Only the 16 system colors and 24 grayscale colors are
+    compared directly. Results are cached.
 
     Args:
         hex_color (str): RGB Hex color code, '#' is optional
@@ -286,13 +303,26 @@ def hex_to_xterm(hex_color: str) -> int:
     """
     # Strip '#' if present and convert hex to RGB
     color_string = hex_color.strip("#")
-    input_rgb = tuple(int(color_string[i : i + 2], 16) for i in range(0, 6, 2))
+    red, green, blue = (int(color_string[i : i + 2], 16) for i in range(0, 6, 2))
+
+    # Compare candidates in ascending color code order so ties resolve to the lowest code
+    min_diff = 766
+    for xterm_color, xterm_red, xterm_green, xterm_blue in _system_colors:
+        diff = abs(red - xterm_red) + abs(green - xterm_green) + abs(blue - xterm_blue)
+        if diff < min_diff:
+            min_diff = diff
+            closest_color = xterm_color
 
-    # Compute the differences between input color and each xterm color
-    min_diff = float("inf")
+    red_level, red_diff = _nearest_cube_level[red]
+    green_level, green_diff = _nearest_cube_level[green]
+    blue_level, blue_diff = _nearest_cube_level[blue]
+    diff = red_diff + green_diff + blue_diff
+    if diff < min_diff:
+        min_diff = diff
+        closest_color = 16 + 36 * red_level + 6 * green_level + blue_level
 
-    for xterm_color, xterm_rgb in xterm_to_rgb_map.items():
-        diff = sum(abs(input_rgb[i] - xterm_rgb[i]) for i in range(3)) / 3
+    for xterm_color, xterm_red, xterm_green, xterm_blue in _grayscale_colors:
+        diff = abs(red - xterm_red) + abs(green - xterm_green) + abs(blue - xterm_blue)
         if diff < min_diff:
             min_diff = diff
             closest_color = xterm_color
@@ -300,6 +330,9 @@ def hex_to_xterm(hex_color: str) -> int:
     return closest_color  # type: ignore[unbound]
 
 
+hex_to_xterm = caches.register(hex_to_xterm, maxsize=65536)
+
+
 def xterm_to_hex(xterm_color: int) -> str:
     """Convert XTerm-256 color code to RGB Hex color code.
 
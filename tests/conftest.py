@@ -46,7 +46,7 @@ from terminaltexteffects.effects import (
     effect_wipe,
 )
 from terminaltexteffects.engine.terminal import TerminalConfig
-from terminaltexteffects.utils import geometry, graphics
+from terminaltexteffects.utils import caches
 from terminaltexteffects.utils.argutils import CharacterGroup
 from terminaltexteffects.utils.easing import (
     EasingFunction,
@@ -229,16 +229,7 @@ ANCHORS = ["sw", "s", "se", "e", "ne", "n", "nw", "w", "c"]
 def clear_lru_cache() -> Generator[None, Any, None]:
     """Fixture to clear utility LRU caches."""
     yield
-    graphics.shift_color_towards.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_coords_on_circle.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_coords_in_circle.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_coords_in_rect.cache_clear()  # type: ignore[attr-defined]
-    geometry.extrapolate_along_ray.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_coord_on_bezier_curve.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_coord_on_line.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_length_of_bezier_curve.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_length_of_line.cache_clear()  # type: ignore[attr-defined]
-    geometry.find_normalized_distance_from_center.cache_clear()  # type: ignore[attr-defined]
+    caches.clear()
 
 
 @pytest.fixture
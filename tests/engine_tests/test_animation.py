@@ -4,7 +4,7 @@ import pytest
 
 from terminaltexteffects.engine.animation import CharacterVisual, Frame, Scene
 from terminaltexteffects.engine.base_character import EffectCharacter
-from terminaltexteffects.utils import easing
+from terminaltexteffects.utils import caches, easing
 from terminaltexteffects.utils.exceptions import (
     ActivateEmptySceneError,
     AnimationSceneError,
@@ -68,17 +68,50 @@ def test_character_visual_init(character_visual_all_modes_enabled: CharacterVisu
     )
 
 
+def test_character_visual_format_prefix_is_shared() -> None:
+    """Test that visuals with different symbols and the same modes and colors reuse the formatting prefix."""
+    cache_stats = caches.stats("animation._get_format_prefix")["animation._get_format_prefix"]
+    first = CharacterVisual("a", bold=True, _fg_color_code=200, _bg_color_code="00ff00")
+    second = CharacterVisual("b", bold=True, _fg_color_code=200, _bg_color_code="00ff00")
+    assert first.formatted_symbol == "\x1b[1m\x1b[38;5;200m\x1b[48;2;0;255;0ma\x1b[0m"
+    assert second.formatted_symbol == "\x1b[1m\x1b[38;5;200m\x1b[48;2;0;255;0mb\x1b[0m"
+    new_stats = caches.stats("animation._get_format_prefix")["animation._get_format_prefix"]
+    assert (new_stats.misses - cache_stats.misses, new_stats.hits - cache_stats.hits) == (1, 1)
+
+
 def test_character_visual_init_default(character_visual_default: CharacterVisual) -> None:
     """Test that the default formatted symbol is 'a'."""
     assert character_visual_default.formatted_symbol == "a"
 
 
+def test_character_visual_is_immutable(character_visual_default: CharacterVisual) -> None:
+    """Test that CharacterVisual attributes cannot be reassigned."""
+    with pytest.raises(AttributeError):
+        character_visual_default.symbol = "b"  # type: ignore[misc]
+
+
+def test_character_visuals_are_interned(character: EffectCharacter) -> None:
+    """Test that frames and appearances with the same symbol, modes and colors share a CharacterVisual."""
+    scene = character.animation.new_scene()
+    scene.add_frame("a", 1, colors=ColorPair(fg="ff0000"))
+    scene.add_frame("a", 2, colors=ColorPair(fg="ff0000"))
+    scene.add_frame("a", 1, colors=ColorPair(fg="ff0000"), bold=True)
+    scene.add_frame("a", 1, colors=ColorPair(fg="00ff00"))
+    visuals = [frame.character_visual for frame in scene.frames]
+    assert visuals[0] is visuals[1]
+    assert len({id(visual) for visual in visuals}) == 3
+    assert visuals[0].colors == ColorPair(fg="ff0000")
+    other_character = EffectCharacter(1, "a", 0, 0)
+    character.animation.set_appearance("b", ColorPair(fg="ff0000"))
+    other_character.animation.set_appearance("b", ColorPair(fg="ff0000"))
+    assert character.animation.current_character_visual is other_character.animation.current_character_visual
+
+
 def test_frame_init(character_visual_default: CharacterVisual) -> None:
     """Test that the Frame instance is correctly initialized."""
     frame = Frame(character_visual=character_visual_default, duration=5)
     assert frame.character_visual == character_visual_default
     assert frame.duration == 5
-    assert frame.ticks_elapsed == 0
 
 
 def test_scene_init() -> None:
@@ -90,6 +123,40 @@ def test_scene_init() -> None:
     assert scene.ease == easing.in_sine
 
 
+def test_scene_frames_are_read_only() -> None:
+    """Test that the frames returned by the Scene cannot be mutated in place."""
+    scene = Scene(scene_id="test_scene")
+    scene.add_frame(symbol="a", duration=1)
+    with pytest.raises(AttributeError):
+        scene.frames.append(scene.frames[0])  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError):
+        scene.played_frames.append(scene.frames[0])  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        scene.frames[0] = scene.frames[0]  # type: ignore[index]
+    assert len(scene.frames) == 1
+
+
+def test_scene_frame_views_follow_the_cursor_and_phase_offset(character: EffectCharacter) -> None:
+    """Test that the frame views index the remaining and played frames in playback order."""
+    template = character.animation.new_scene()
+    for symbol in "abcd":
+        template.add_frame(symbol=symbol, duration=1)
+    scene = character.animation.new_scene_from_template(template, phase_offset=1)
+    scene.get_next_visual()
+    frames = scene.frames
+    assert [frame.character_visual.symbol for frame in frames] == ["c", "d", "a"]
+    assert frames[-1].character_visual.symbol == "a"
+    assert [frame.character_visual.symbol for frame in frames[1:]] == ["d", "a"]
+    assert [frame.character_visual.symbol for frame in scene.played_frames] == ["b"]
+    assert frames == tuple(frames)
+    with pytest.raises(IndexError):
+        frames[3]
+    scene.get_next_visual()
+    scene.add_frame(symbol="e", duration=1)
+    assert [frame.character_visual.symbol for frame in frames] == ["c", "d", "a"]
+    assert [frame.character_visual.symbol for frame in scene.frames] == ["d", "a", "e"]
+
+
 def test_scene_add_frame() -> None:
     """Test that a frame can be added to the Scene instance."""
     scene = Scene(scene_id="test_scene")
@@ -188,6 +255,100 @@ def test_animation_new_scene_id_generation_deleted_scene(character: EffectCharac
     character.animation.new_scene()
 
 
+def build_template() -> Scene:
+    """Return a looping template scene with three frames of different durations."""
+    template = Scene("template", is_looping=True)
+    template.add_frame("a", 1, colors=ColorPair(fg=Color("ff0000")))
+    template.add_frame("b", 2, colors=ColorPair(fg=Color("00ff00")))
+    template.add_frame("c", 3, colors=ColorPair(fg=Color("0000ff")))
+    return template
+
+
+def test_animation_new_scene_from_template_shares_frames(character: EffectCharacter) -> None:
+    """Test that scenes created from a template share its frames and keep their own playback state."""
+    template = build_template()
+    other_character = EffectCharacter(1, "b", 1, 0)
+    scene = character.animation.new_scene_from_template(template)
+    other_scene = other_character.animation.new_scene_from_template(template, scene_id="other")
+    assert scene.scene_id == "template"
+    assert other_scene.scene_id == "other"
+    assert scene.is_looping is True
+    assert scene._frames is template._frames is other_scene._frames
+    character.animation.activate_scene(scene)
+    other_character.animation.activate_scene(other_scene)
+    for _ in range(2):
+        character.animation.step_animation()
+    assert character.animation.current_character_visual.symbol == "b"
+    assert other_character.animation.current_character_visual.symbol == "a"
+    assert len(scene.played_frames) == 1
+    assert not other_scene.played_frames
+
+
+def test_animation_new_scene_from_template_phase_offset(character: EffectCharacter) -> None:
+    """Test that a phase offset plays the template frames rotated, matching a scene built in that order."""
+    template = build_template()
+    scene = character.animation.new_scene_from_template(template, phase_offset=-1)
+    assert [frame.character_visual.symbol for frame in scene.frames] == ["c", "a", "b"]
+    reference_character = EffectCharacter(1, "a", 0, 0)
+    reference_scene = reference_character.animation.new_scene(scene_id="reference", is_looping=True)
+    for frame in scene.frames:
+        reference_scene.add_frame("x", frame.duration, colors=frame.character_visual.colors)
+    character.animation.activate_scene(scene)
+    reference_character.animation.activate_scene(reference_scene)
+    for _ in range(14):
+        character.animation.step_animation()
+        reference_character.animation.step_animation()
+        assert (
+            character.animation.current_character_visual.colors
+            == reference_character.animation.current_character_visual.colors
+        )
+
+
+def test_animation_new_scene_from_template_eased_phase_offset(character: EffectCharacter) -> None:
+    """Test that eased scenes created with a phase offset play like a scene built in the rotated order."""
+    template = Scene("template", ease=easing.in_out_sine)
+    for symbol, duration in zip("abc", (1, 3, 2)):
+        template.add_frame(symbol, duration)
+    reference = Scene("reference", ease=easing.in_out_sine)
+    for symbol, duration in zip("bca", (3, 2, 1)):
+        reference.add_frame(symbol, duration)
+    played = []
+    for scene in (character.animation.new_scene_from_template(template, phase_offset=1), reference):
+        character.animation.activate_scene(scene)
+        symbols = []
+        while character.animation.active_scene:
+            character.animation.step_animation()
+            symbols.append(character.animation.current_character_visual.symbol)
+        played.append(symbols)
+    assert played[0] == played[1]
+    assert played[0][0] == "b"
+
+
+def test_animation_new_scene_from_template_add_frame_copies_frames(character: EffectCharacter) -> None:
+    """Test that adding a frame to a scene created from a template does not modify the template."""
+    template = build_template()
+    scene = character.animation.new_scene_from_template(template, phase_offset=1)
+    scene.add_frame("d", 1)
+    assert [frame.character_visual.symbol for frame in template.frames] == ["a", "b", "c"]
+    assert [frame.character_visual.symbol for frame in scene.frames] == ["b", "c", "a", "d"]
+    assert scene.frame_index_map[0].character_visual.symbol == "b"
+    assert scene.easing_total_steps == 7
+    template.add_frame("e", 1)
+    assert len(scene.frames) == 4
+
+
+def test_animation_new_scene_from_template_existing_colors(character: EffectCharacter) -> None:
+    """Test that preexisting input colors override template frame colors."""
+    character.animation.existing_color_handling = "always"
+    character.uses_input_preexisting_colors = True
+    character.animation.input_fg_color = Color("#ffffff")
+    template = build_template()
+    scene = character.animation.new_scene_from_template(template, phase_offset=1)
+    assert scene._frames is not template._frames
+    assert [frame.character_visual.symbol for frame in scene.frames] == ["b", "c", "a"]
+    assert all(frame.character_visual.colors == ColorPair(fg="ffffff") for frame in scene.frames)
+
+
 def test_animation_query_scene(character: EffectCharacter) -> None:
     """Test that a scene can be queried from the animation."""
     animation = character.animation
@@ -320,6 +481,17 @@ def test_animation_adjust_color_brightness_zero(character: EffectCharacter) -> N
     assert new_color == Color("#000000")
 
 
+def test_animation_adjust_color_brightness_rounds_factor(character: EffectCharacter) -> None:
+    """Ensure nearby brightness factors are rounded to one cache entry."""
+    color = Color("#4a90d9")
+    cache_stats = caches.stats("animation._adjust_color_brightness")["animation._adjust_color_brightness"]
+    new_color = character.animation.adjust_color_brightness(color, 0.5)
+    for brightness in (0.501, 0.4999, 0.504):
+        assert character.animation.adjust_color_brightness(color, brightness) is new_color
+    new_stats = caches.stats("animation._adjust_color_brightness")["animation._adjust_color_brightness"]
+    assert (new_stats.misses - cache_stats.misses, new_stats.hits - cache_stats.hits) == (1, 3)
+
+
 def test_animation_adjust_color_brightness_negative(character: EffectCharacter) -> None:
     """Ensure negative brightness factors are clamped to black."""
     red = Color("#ff0000")
@@ -662,10 +834,24 @@ def test_scene_reset_scene(character: EffectCharacter) -> None:
     new_scene.add_frame(symbol="b", duration=3)
     for _ in range(4):
         new_scene.get_next_visual()
+    assert len(new_scene.played_frames) == 1
+    assert new_scene.current_frame_ticks_elapsed == 1
     new_scene.reset_scene()
-    for sequence in new_scene.frames:
-        assert sequence.ticks_elapsed == 0
+    assert new_scene.current_frame_ticks_elapsed == 0
+    assert [frame.character_visual.symbol for frame in new_scene.frames] == ["a", "b"]
+    assert not new_scene.played_frames
+
+
+def test_scene_looping_playback_returns_to_first_frame(character: EffectCharacter) -> None:
+    """Verify a looping scene plays its frames in order and restarts after the final frame."""
+    new_scene = character.animation.new_scene(scene_id="test_scene", is_looping=True)
+    new_scene.add_frame(symbol="a", duration=2)
+    new_scene.add_frame(symbol="b", duration=1)
+    symbols = [new_scene.get_next_visual().symbol for _ in range(7)]
+    assert symbols == ["a", "a", "b", "a", "a", "b", "a"]
+    assert len(new_scene.frames) == 2
     assert not new_scene.played_frames
+    assert new_scene.current_frame_ticks_elapsed == 1
 
 
 def test_scene_id_equality(character: EffectCharacter) -> None:
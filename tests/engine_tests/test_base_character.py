@@ -9,6 +9,7 @@ import pytest
 from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
 from terminaltexteffects.engine.animation import Scene
 from terminaltexteffects.engine.motion import Path
+from terminaltexteffects.engine.scheduler import TimerWheel
 from terminaltexteffects.utils.exceptions.base_character_exceptions import (
     DuplicateEventRegistrationError,
     EventRegistrationCallerError,
@@ -376,10 +377,71 @@ def test_effectcharacter_tick_scene_and_path(effectcharacter: EffectCharacter) -
     s.add_frame("a", duration=2)
     effectcharacter.animation.activate_scene(s)
     effectcharacter.tick()
-    assert effectcharacter.animation.active_scene.frames[0].ticks_elapsed == 1  # type: ignore[union-attr]
+    assert effectcharacter.animation.active_scene.current_frame_ticks_elapsed == 1  # type: ignore[union-attr]
     assert effectcharacter.motion.active_path.current_step == 1  # type: ignore[union-attr]
 
 
 def test_effectcharacter_equal_invalid_type(effectcharacter: EffectCharacter) -> None:
     """Test that __eq__ returns NotImplemented when comparing with an invalid type."""
     assert effectcharacter.__eq__("a") is NotImplemented
+
+
+def test_eventhandler_handle_event_runs_actions_in_registration_order(eventhandler: EventHandler) -> None:
+    """Test that compiled actions run in registration order and unregistered events are ignored."""
+    calls: list[Any] = []
+    scene = eventhandler.character.animation.new_scene(scene_id="test_scene")
+    for index in range(3):
+        eventhandler.register_event(
+            EventHandler.Event.SCENE_COMPLETE,
+            scene,
+            EventHandler.Action.CALLBACK,
+            EventHandler.Callback(lambda character, i: calls.append((character, i)), index),
+        )
+    eventhandler.register_event(EventHandler.Event.SCENE_COMPLETE, scene, EventHandler.Action.SET_LAYER, 4)
+    eventhandler._handle_event(EventHandler.Event.SCENE_ACTIVATED, scene)
+    assert calls == []
+    eventhandler._handle_event(EventHandler.Event.SCENE_COMPLETE, scene)
+    assert calls == [(eventhandler.character, 0), (eventhandler.character, 1), (eventhandler.character, 2)]
+    assert eventhandler.character.layer == 4
+
+
+def test_eventhandler_set_coordinate_action_wakes_parked_character(eventhandler: EventHandler) -> None:
+    """Test that the SET_COORDINATE action moves the character through Motion.set_coordinate."""
+    scene = eventhandler.character.animation.new_scene(scene_id="test_scene")
+    eventhandler.register_event(
+        EventHandler.Event.SCENE_COMPLETE,
+        scene,
+        EventHandler.Action.SET_COORDINATE,
+        Coord(15, 3),
+    )
+    timer_wheel = TimerWheel()
+    timer_wheel.park(eventhandler.character, 5)
+    eventhandler._handle_event(EventHandler.Event.SCENE_COMPLETE, scene)
+    assert eventhandler.character.motion.current_coord == Coord(15, 3)
+    assert eventhandler.character not in timer_wheel
+
+
+def test_eventhandler_clear_events(eventhandler: EventHandler) -> None:
+    """Test that clear_events removes registrations and their compiled actions."""
+    path = eventhandler.character.motion.new_path(path_id="test_path")
+    eventhandler.register_event(EventHandler.Event.PATH_COMPLETE, path, EventHandler.Action.SET_LAYER, 2)
+    eventhandler.clear_events()
+    assert eventhandler.registered_events == {}
+    eventhandler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    assert eventhandler.character.layer == 0
+    eventhandler.register_event(EventHandler.Event.PATH_COMPLETE, path, EventHandler.Action.SET_LAYER, 2)
+    eventhandler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    assert eventhandler.character.layer == 2
+
+
+def test_eventhandler_registered_events_is_a_read_only_view(eventhandler: EventHandler) -> None:
+    """Test that registered_events reflects the handled actions and cannot be edited around them."""
+    path = eventhandler.character.motion.new_path(path_id="test_path")
+    key = (EventHandler.Event.PATH_COMPLETE, path)
+    eventhandler.register_event(*key, EventHandler.Action.SET_LAYER, 2)
+    assert dict(eventhandler.registered_events) == {key: [(EventHandler.Action.SET_LAYER, 2)]}
+    with pytest.raises(TypeError):
+        eventhandler.registered_events[key] = []  # type: ignore[index]
+    eventhandler.registered_events[key].clear()
+    eventhandler._handle_event(*key)
+    assert eventhandler.character.layer == 2
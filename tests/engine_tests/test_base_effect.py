@@ -0,0 +1,154 @@
+"""Tests for BaseEffectIterator active character maintenance."""
+
+from __future__ import annotations
+
+import pytest
+
+from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
+from terminaltexteffects.engine.terminal import TerminalConfig, TerminalPrototype
+from terminaltexteffects.utils.geometry import Coord
+
+pytestmark = [pytest.mark.engine, pytest.mark.smoke]
+
+
+class UpdateOnlyIterator(BaseEffectIterator[BaseConfig]):
+    """Minimal iterator that only runs `update`."""
+
+    def __next__(self) -> str:
+        """Update the active characters and return the current frame."""
+        if not self.active_characters:
+            raise StopIteration
+        self.update()
+        return self.frame
+
+
+class UpdateOnlyEffect(BaseEffect[BaseConfig]):
+    """Minimal effect that iterates with `UpdateOnlyIterator`."""
+
+    _config_cls = BaseConfig
+    _iterator_cls = UpdateOnlyIterator
+
+
+@pytest.fixture
+def iterator() -> UpdateOnlyIterator:
+    """Fixture for creating an iterator over a small input."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    effect = UpdateOnlyEffect("abc", BaseConfig(), terminal_config)
+    return UpdateOnlyIterator(effect)
+
+
+def add_scene(character: EffectCharacter, duration: int, *, is_looping: bool = False) -> None:
+    """Activate a single frame scene on the character."""
+    scene = character.animation.new_scene(scene_id="scn", is_looping=is_looping)
+    scene.add_frame("x", duration)
+    character.animation.activate_scene(scene)
+
+
+def test_update_removes_character_when_scene_completes(iterator: UpdateOnlyIterator) -> None:
+    """Test that a character is removed on the update its only scene completes."""
+    character = iterator.terminal.get_characters()[0]
+    add_scene(character, 3)
+    iterator.active_characters.add(character)
+    for _ in range(2):
+        iterator.update()
+        assert character in iterator.active_characters
+    iterator.update()
+    assert character not in iterator.active_characters
+
+
+def test_update_removes_character_when_path_completes(iterator: UpdateOnlyIterator) -> None:
+    """Test that a character is removed on the update its only path completes."""
+    character = iterator.terminal.get_characters()[0]
+    path = character.motion.new_path(speed=1)
+    path.new_waypoint(Coord(character.input_coord.column + 2, character.input_coord.row))
+    character.motion.activate_path(path)
+    iterator.active_characters.add(character)
+    updates = 0
+    while character in iterator.active_characters:
+        iterator.update()
+        updates += 1
+    assert updates == path.max_steps
+
+
+def test_update_keeps_character_with_chained_path(iterator: UpdateOnlyIterator) -> None:
+    """Test that a character reporting a completed path is kept when another path is activated."""
+    character = iterator.terminal.get_characters()[0]
+    first_path = character.motion.new_path(speed=1)
+    first_path.new_waypoint(Coord(character.input_coord.column + 1, character.input_coord.row))
+    second_path = character.motion.new_path(speed=1)
+    second_path.new_waypoint(Coord(character.input_coord.column + 3, character.input_coord.row))
+    character.motion.chain_paths([first_path, second_path])
+    character.motion.activate_path(first_path)
+    iterator.active_characters.add(character)
+    iterator.update()
+    assert character.motion.active_path is second_path
+    assert character in iterator.active_characters
+
+
+def test_update_removes_inactive_and_looping_characters(iterator: UpdateOnlyIterator) -> None:
+    """Test that characters with nothing to do, or only a looping scene, are removed after one update."""
+    idle_character, looping_character, active_character = iterator.terminal.get_characters()
+    add_scene(looping_character, 3, is_looping=True)
+    add_scene(active_character, 3)
+    iterator.active_characters.update((idle_character, looping_character, active_character))
+    iterator.update()
+    assert iterator.active_characters == {active_character}
+
+
+def test_update_removes_character_deactivated_between_updates(iterator: UpdateOnlyIterator) -> None:
+    """Test that a character deactivated outside of update is removed on the next update."""
+    character = iterator.terminal.get_characters()[0]
+    add_scene(character, 10)
+    iterator.active_characters.add(character)
+    iterator.update()
+    character.animation.deactivate_scene()
+    assert character in iterator.active_characters
+    iterator.update()
+    assert character not in iterator.active_characters
+
+
+def test_iterators_clone_the_terminal_prototype() -> None:
+    """Test that each iterator gets a fresh clone of a prototype terminal that is parsed once."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    effect = UpdateOnlyEffect("abc", BaseConfig(), terminal_config)
+    first_iterator = UpdateOnlyIterator(effect)
+    add_scene(first_iterator.terminal.get_characters()[0], 3)
+    prototype = effect._get_terminal_prototype()
+    second_iterator = UpdateOnlyIterator(effect)
+    assert effect._get_terminal_prototype() is prototype
+    assert first_iterator.terminal is not second_iterator.terminal
+    assert second_iterator.terminal.get_characters()[0].animation.scenes == {}
+    with effect.terminal_output() as terminal:
+        assert terminal is not prototype
+        assert terminal.get_characters()[0] is not prototype.get_characters()[0]
+    assert effect._get_terminal_prototype() is prototype
+
+
+def test_terminal_prototype_rebuilt_when_inputs_change() -> None:
+    """Test that the prototype terminal follows changes to the input data and terminal config."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    effect = UpdateOnlyEffect("abc", BaseConfig(), terminal_config)
+    prototype = effect._get_terminal_prototype()
+    effect.terminal_config.no_color = True
+    assert effect._get_terminal_prototype() is not prototype
+    assert UpdateOnlyIterator(effect).terminal.config.no_color is True
+    effect.input_data = "abcd"
+    assert len(UpdateOnlyIterator(effect).terminal.get_characters()) == 4
+
+
+def test_effect_uses_matching_terminal_prototype() -> None:
+    """Test that an effect uses a given prototype while it matches and builds its own once it does not."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    prototype = TerminalPrototype("abc", terminal_config)
+    effect = UpdateOnlyEffect("abc", BaseConfig(), terminal_config, terminal_prototype=prototype)
+    assert effect._get_terminal_prototype() is prototype.terminal
+    assert TerminalPrototype.reuse_or_build(prototype, "abc", terminal_config) is prototype
+    effect.input_data = "abcd"
+    assert effect._get_terminal_prototype() is not prototype.terminal
+    assert len(prototype.terminal.get_characters()) == 3
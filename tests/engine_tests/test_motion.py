@@ -340,6 +340,37 @@ def test_path_step_multiple_segments_mutiple_bezier(character: EffectCharacter)
         current_point = p.step(character.event_handler)
 
 
+def test_path_step_plan_shared_between_translated_paths() -> None:
+    """Test that paths identical up to translation share a step plan but resolve their own coordinates."""
+    characters = [EffectCharacter(0, "a", 1, 1), EffectCharacter(1, "b", 6, 3)]
+    paths = []
+    for character in characters:
+        path = character.motion.new_path(speed=0.7, ease=easing.in_out_quad)
+        column, row = character.input_coord.column, character.input_coord.row
+        path.new_waypoint(Coord(column + 9, row + 2))
+        path.new_waypoint(Coord(column + 3, row + 7), bezier_control=Coord(column + 12, row + 9))
+        character.motion.activate_path(path)
+        paths.append(path)
+        character.motion.move()
+    assert paths[0]._step_plan is paths[1]._step_plan
+    assert paths[0]._step_coords[0] != paths[1]._step_coords[0]
+
+
+def test_path_step_reactivation_reuses_coordinates(character: EffectCharacter) -> None:
+    """Test that reactivating a path from the same coordinate reuses the compiled steps."""
+    path = character.motion.new_path(speed=2)
+    path.new_waypoint(Coord(10, 0))
+    character.motion.activate_path(path)
+    first_coords = [path.step(character.event_handler) for _ in range(path.max_steps)]
+    step_coords = path._step_coords
+    character.motion.activate_path(path)
+    assert path._step_coords is step_coords
+    assert [path.step(character.event_handler) for _ in range(path.max_steps)] == first_coords
+    character.motion.set_coordinate(Coord(3, 0))
+    character.motion.activate_path(path)
+    assert path._step_plan is None
+
+
 def test_path_equality() -> None:
     """Test equality of paths with the same waypoints."""
     p1 = Path("p")
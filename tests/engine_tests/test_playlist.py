@@ -0,0 +1,85 @@
+"""Tests for playing effects back to back with EffectPlaylist."""
+
+from __future__ import annotations
+
+import pytest
+
+from terminaltexteffects.effects.effect_print import Print
+from terminaltexteffects.effects.effect_wipe import Wipe
+from terminaltexteffects.engine.playlist import EffectPlaylist
+from terminaltexteffects.engine.terminal import TerminalConfig
+from terminaltexteffects.utils.exceptions import UnsupportedAnsiSequenceError
+
+pytestmark = [pytest.mark.engine, pytest.mark.smoke]
+
+
+@pytest.fixture
+def terminal_config() -> TerminalConfig:
+    """Fixture for a terminal config without frame rate limiting."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    return terminal_config
+
+
+def test_playlist_plays_effects_in_order(terminal_config: TerminalConfig) -> None:
+    """Test that the playlist yields the frames of each effect in turn."""
+    playlist = EffectPlaylist("abc\ndef", terminal_config)
+    print_effect = playlist.add_effect(Print)
+    wipe_effect = playlist.add_effect(Wipe)
+    assert playlist.effects == [print_effect, wipe_effect]
+    assert list(playlist) == list(Print("abc\ndef", terminal_config=terminal_config)) + list(
+        Wipe("abc\ndef", terminal_config=terminal_config),
+    )
+
+
+def test_playlist_shares_terminal_prototype(terminal_config: TerminalConfig) -> None:
+    """Test that the input is parsed once for all effects and the output terminal."""
+    playlist = EffectPlaylist("abc", terminal_config)
+    print_effect = playlist.add_effect(Print)
+    wipe_effect = playlist.add_effect(Wipe)
+    for _ in playlist:
+        pass
+    prototype = playlist._get_terminal_prototype()
+    assert print_effect._get_terminal_prototype() is prototype
+    assert wipe_effect._get_terminal_prototype() is prototype
+    with playlist.terminal_output() as terminal:
+        assert terminal is not prototype
+        assert terminal.canvas == prototype.canvas
+
+
+def test_playlist_parses_input_when_played(terminal_config: TerminalConfig) -> None:
+    """Test that adding effects does not parse the input, so input errors are raised when the playlist is played."""
+    playlist = EffectPlaylist("abc\x1b[2J", terminal_config)
+    print_effect = playlist.add_effect(Print)
+    with pytest.raises(UnsupportedAnsiSequenceError):
+        list(print_effect)
+
+
+def test_playlist_effect_with_changed_terminal_config_builds_own_prototype(terminal_config: TerminalConfig) -> None:
+    """Test that an effect whose terminal config differs from the playlist's does not use the shared prototype."""
+    playlist = EffectPlaylist("abc", terminal_config)
+    playlist.add_effect(Print)
+    wipe_effect = playlist.add_effect(Wipe)
+    wipe_effect.terminal_config = TerminalConfig._build_config()
+    wipe_effect.terminal_config.frame_rate = 0
+    wipe_effect.terminal_config.canvas_width = 10
+    for _ in playlist:
+        pass
+    assert wipe_effect._get_terminal_prototype() is not playlist._get_terminal_prototype()
+    assert wipe_effect._get_terminal_prototype().canvas.right == 10
+
+
+def test_playlist_terminal_output_prepares_canvas_once(
+    terminal_config: TerminalConfig,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that the canvas is prepared and the cursor restored once for the whole playlist."""
+    playlist = EffectPlaylist("abc", terminal_config)
+    playlist.add_effect(Print)
+    playlist.add_effect(Print)
+    with playlist.terminal_output() as terminal:
+        for frame in playlist:
+            terminal.print(frame)
+    output = capsys.readouterr().out
+    assert output.count("\x1b[?25l") == 1
+    assert output.endswith("\x1b[?25h\n")
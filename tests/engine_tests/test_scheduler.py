@@ -0,0 +1,213 @@
+"""Tests for the TimerWheel scheduler and idle character parking in BaseEffectIterator.update."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from terminaltexteffects.effects.effect_burn import Burn
+from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.base_config import BaseConfig
+from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
+from terminaltexteffects.engine.scheduler import TimerWheel
+from terminaltexteffects.engine.terminal import TerminalConfig
+from terminaltexteffects.utils.geometry import Coord
+from terminaltexteffects.utils.graphics import Color, ColorPair
+
+pytestmark = [pytest.mark.engine, pytest.mark.smoke]
+
+
+class UpdateOnlyIterator(BaseEffectIterator[BaseConfig]):
+    """Minimal iterator that only runs `update`."""
+
+    def __next__(self) -> str:
+        """Update the active characters and return the current frame."""
+        if not self.active_characters:
+            raise StopIteration
+        self.update()
+        return self.frame
+
+
+class UpdateOnlyEffect(BaseEffect[BaseConfig]):
+    """Minimal effect that iterates with `UpdateOnlyIterator`."""
+
+    _config_cls = BaseConfig
+    _iterator_cls = UpdateOnlyIterator
+
+
+def make_iterator() -> UpdateOnlyIterator:
+    """Create an iterator over a small input."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    effect = UpdateOnlyEffect("ab", BaseConfig(), terminal_config)
+    return UpdateOnlyIterator(effect)
+
+
+def setup_character(character: EffectCharacter) -> None:
+    """Give the character a long-duration scene and a held path."""
+    scene = character.animation.new_scene(scene_id="scn")
+    scene.add_frame("x", 7, colors=ColorPair(fg=Color("ff0000")))
+    scene.add_frame("y", 1)
+    scene.add_frame("z", 5)
+    path = character.motion.new_path(path_id="pth", speed=1, hold_time=9)
+    path.new_waypoint(Coord(character.input_coord.column + 3, character.input_coord.row))
+    character.animation.activate_scene(scene)
+    character.motion.activate_path(path)
+
+
+def snapshot(character: EffectCharacter) -> tuple:
+    """Return the observable state of a character, with the coordinate relative to its input coordinate."""
+    return (
+        character.animation.current_character_visual,
+        character.motion.current_coord.column - character.input_coord.column,
+        character.motion.current_coord.row - character.input_coord.row,
+        character.is_active,
+    )
+
+
+def test_timer_wheel_park_and_advance() -> None:
+    """Test that a parked character is returned on the tick it is due."""
+    wheel = TimerWheel()
+    character = EffectCharacter(0, "a", 1, 1)
+    wheel.park(character, 3)
+    assert character in wheel
+    assert character._timer_wheel is wheel
+    assert [wheel.advance() for _ in range(4)] == [[], [], [], [character]]
+    assert character not in wheel
+    assert character._timer_wheel is None
+
+
+def test_timer_wheel_wake_applies_elapsed_ticks_only() -> None:
+    """Test that waking a character early only applies the ticks that have elapsed."""
+    wheel = TimerWheel()
+    character = EffectCharacter(0, "a", 1, 1)
+    scene = character.animation.new_scene(scene_id="scn")
+    scene.add_frame("x", 10)
+    character.animation.activate_scene(scene)
+    character.tick()
+    wheel.park(character, character._get_idle_ticks())
+    wheel.advance()
+    wheel.advance()
+    character.tick()
+    assert character not in wheel
+    assert scene.current_frame_ticks_elapsed == 4
+    assert wheel.advance() == []
+
+
+def test_timer_wheel_wake_all() -> None:
+    """Test that wake_all empties the wheel."""
+    wheel = TimerWheel()
+    characters = [EffectCharacter(i, "a", 1, 1) for i in range(3)]
+    for i, character in enumerate(characters):
+        wheel.park(character, i + 2)
+    wheel.wake_all()
+    assert len(wheel) == 0
+    assert all(character._timer_wheel is None for character in characters)
+
+
+def test_effectcharacter_idle_ticks() -> None:
+    """Test idle tick reporting for frame durations, holds and characters with nothing to do."""
+    character = EffectCharacter(0, "a", 1, 1)
+    assert character._get_idle_ticks() == 0
+    setup_character(character)
+    # moving along the path is never idle
+    character.tick()
+    assert character._get_idle_ticks() == 0
+    character.motion.deactivate_path()
+    assert character._get_idle_ticks() == 5
+
+
+def test_effectcharacter_idle_ticks_looping_scene_with_complete_event() -> None:
+    """Test that looping scenes with SCENE_COMPLETE actions are never idle."""
+    character = EffectCharacter(0, "a", 1, 1)
+    scene = character.animation.new_scene(scene_id="scn", is_looping=True)
+    scene.add_frame("x", 10)
+    character.animation.activate_scene(scene)
+    assert character._get_idle_ticks() == 9
+    character.event_handler.register_event(
+        character.event_handler.Event.SCENE_COMPLETE,
+        scene,
+        character.event_handler.Action.SET_LAYER,
+        1,
+    )
+    assert character._get_idle_ticks() == 0
+
+
+def test_update_parks_idle_characters_with_identical_results() -> None:
+    """Test that parked characters produce the same state on every tick as characters ticked directly."""
+    iterator = make_iterator()
+    parked_character, reference_character = iterator.terminal.get_characters()
+    for character in (parked_character, reference_character):
+        setup_character(character)
+    iterator.active_characters.add(parked_character)
+    parked_ticks = 0
+    while iterator.active_characters:
+        iterator.update()
+        reference_character.tick()
+        parked_ticks += parked_character in iterator.timer_wheel
+        assert snapshot(parked_character) == snapshot(reference_character)
+    assert parked_ticks
+    assert not reference_character.is_active
+
+
+def test_update_wakes_characters_removed_from_active_set() -> None:
+    """Test that a parked character removed from the active set only receives the ticks it was given."""
+    iterator = make_iterator()
+    character = iterator.terminal.get_characters()[0]
+    scene = character.animation.new_scene(scene_id="scn")
+    scene.add_frame("x", 10)
+    scene.add_frame("y", 10)
+    character.animation.activate_scene(scene)
+    iterator.active_characters.add(character)
+    for _ in range(3):
+        iterator.update()
+    assert character in iterator.timer_wheel
+    iterator.active_characters = set()
+    iterator.update()
+    assert character not in iterator.timer_wheel
+    assert scene.current_frame_ticks_elapsed == 3
+
+
+def test_update_ticks_unparked_characters_in_active_set_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that parked characters are skipped and the rest tick in the iteration order of the active set."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    iterator = UpdateOnlyIterator(UpdateOnlyEffect("abcdefgh", BaseConfig(), terminal_config))
+    characters = iterator.terminal.get_characters()
+    for index, character in enumerate(characters):
+        if index % 2:
+            setup_character(character)
+            character.motion.deactivate_path()
+        else:
+            path = character.motion.new_path(path_id="pth", speed=0.1)
+            path.new_waypoint(Coord(character.input_coord.column, character.input_coord.row + 5))
+            character.motion.activate_path(path)
+    iterator.active_characters.update(reversed(characters))
+    iterator.update()
+    iterator.update()
+    parked_characters = set(characters[1::2])
+    assert parked_characters <= set(iterator.timer_wheel.parked)
+
+    ticked = []
+    monkeypatch.setattr(EffectCharacter, "tick", lambda character: ticked.append(character))
+    iterator.update()
+    assert ticked == [character for character in iterator.active_characters if character not in parked_characters]
+
+
+def test_update_renders_random_effects_like_ticking_every_character(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that frames of an effect drawing random numbers while ticking match ticking every active character."""
+
+    def tick_every_character(self: BaseEffectIterator) -> None:
+        for character in self.active_characters:
+            character.tick()
+        self.active_characters -= {character for character in self.active_characters if not character.is_active}
+
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    input_data = "Burn the\nmidnight oil\n  until dawn"
+    random.seed(1234)
+    parked_frames = list(Burn(input_data, terminal_config=terminal_config))
+    monkeypatch.setattr(BaseEffectIterator, "update", tick_every_character)
+    random.seed(1234)
+    assert parked_frames == list(Burn(input_data, terminal_config=terminal_config))
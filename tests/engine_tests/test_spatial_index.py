@@ -0,0 +1,53 @@
+"""Tests for the SpatialIndex used for range queries over character coordinates."""
+
+from __future__ import annotations
+
+import pytest
+
+from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.spatial_index import SpatialIndex
+from terminaltexteffects.utils.geometry import Coord
+
+pytestmark = [pytest.mark.engine, pytest.mark.smoke]
+
+
+def test_spatial_index_insert_move_remove() -> None:
+    """Test that characters are moved between buckets and removed."""
+    index = SpatialIndex(bucket_size=4)
+    character = EffectCharacter(0, "a", 1, 1)
+    index.insert(character, Coord(1, 1))
+    assert character in index
+    assert len(index) == 1
+    index.move(character, Coord(2, 3))
+    assert index.get_coord(character) == Coord(2, 3)
+    assert index._buckets == {(0, 0): {character: Coord(2, 3)}}
+    index.move(character, Coord(-1, 9))
+    assert index._buckets == {(-1, 2): {character: Coord(-1, 9)}}
+    index.remove(character)
+    index.remove(character)
+    assert character not in index
+    assert index.get_coord(character) is None
+    assert not index._buckets
+
+
+def test_spatial_index_get_characters_in_bounds() -> None:
+    """Test that bounds queries are inclusive and only return characters within the bounds."""
+    index = SpatialIndex(bucket_size=3)
+    characters = {}
+    for column in range(-5, 6):
+        for row in range(-5, 6):
+            character = EffectCharacter(len(characters), "a", column, row)
+            characters[Coord(column, row)] = character
+            index.insert(character, Coord(column, row))
+    found = index.get_characters_in_bounds(-2, 0, 1, 4)
+    assert len(found) == 4 * 5
+    assert {index.get_coord(character) for character in found} == {
+        Coord(column, row) for column in range(-2, 2) for row in range(5)
+    }
+    assert index.get_characters_in_bounds(1, 0, 0, 4) == []
+
+
+def test_spatial_index_invalid_bucket_size() -> None:
+    """Test that a bucket size less than 1 is rejected."""
+    with pytest.raises(ValueError, match="Bucket size"):
+        SpatialIndex(bucket_size=0)
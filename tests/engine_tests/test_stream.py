@@ -0,0 +1,70 @@
+"""Tests for animating streamed lines with EffectStream."""
+
+from __future__ import annotations
+
+import io
+import os
+
+import pytest
+
+from terminaltexteffects.effects.effect_print import Print
+from terminaltexteffects.engine.stream import EffectStream
+from terminaltexteffects.engine.terminal import TerminalConfig
+
+pytestmark = [pytest.mark.engine, pytest.mark.smoke]
+
+
+@pytest.fixture
+def terminal_config() -> TerminalConfig:
+    """Fixture for a terminal config with a small canvas and no frame rate limiting."""
+    terminal_config = TerminalConfig._build_config()
+    terminal_config.frame_rate = 0
+    terminal_config.canvas_height = 4
+    terminal_config.canvas_width = 8
+    terminal_config.no_color = True
+    return terminal_config
+
+
+def _get_text_rows(frame: str) -> list[str]:
+    """Return the rows of a frame with the Print effect's cursor and padding removed."""
+    return [row.replace("█", "").rstrip() for row in frame.split("\n")]
+
+
+def test_stream_wait_for_input_is_tty(monkeypatch: pytest.MonkeyPatch, terminal_config: TerminalConfig) -> None:
+    """Test that nothing is read from a TTY."""
+    input_stream = io.StringIO("abc\n")
+    monkeypatch.setattr(input_stream, "isatty", lambda: True)
+    stream = EffectStream(input_stream, terminal_config)
+    assert not stream.wait_for_input()
+    assert list(stream) == []
+
+
+def test_stream_wait_for_input_skips_blank_lines(terminal_config: TerminalConfig) -> None:
+    """Test that a stream of blank lines has no input."""
+    assert not EffectStream(io.StringIO("\n  \n"), terminal_config).wait_for_input()
+
+
+def test_stream_scrolls_lines_on_one_canvas(terminal_config: TerminalConfig) -> None:
+    """Test that every frame covers the canvas and the canvas holds the last lines, blank lines included."""
+    stream = EffectStream(io.StringIO("one\ntwo\n\nthree\nfour\n"), terminal_config)
+    stream.add_effect(Print)
+    assert stream.wait_for_input()
+    frames = list(stream)
+    assert all(len(frame.split("\n")) == 4 for frame in frames)
+    assert _get_text_rows(frames[-1]) == ["two", "", "three", "four"]
+
+
+def test_stream_animates_new_lines_on_the_running_canvas(terminal_config: TerminalConfig) -> None:
+    """Test that lines read while an animation is running join the same canvas instead of waiting for it."""
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd) as input_stream, os.fdopen(write_fd, "w") as producer:
+        stream = EffectStream(input_stream, terminal_config)
+        stream.add_effect(Print)
+        producer.write("first\n")
+        producer.flush()
+        assert stream.wait_for_input()
+        frames = iter(stream)
+        assert _get_text_rows(next(frames))[:3] == ["", "", ""]
+        producer.write("second\n")
+        producer.close()
+        assert _get_text_rows(list(frames)[-1]) == ["", "", "first", "second"]
@@ -1,9 +1,10 @@
 import shutil
-from typing import NoReturn
+from pathlib import Path
+from typing import Literal, NoReturn
 
 import pytest
 
-from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
 from terminaltexteffects.engine.terminal import Canvas, Terminal, TerminalConfig
 from terminaltexteffects.utils.argutils import CharacterGroup, CharacterSort, ColorSort
 from terminaltexteffects.utils.exceptions import (
@@ -11,6 +12,7 @@ from terminaltexteffects.utils.exceptions import (
     InvalidCharacterSortError,
     InvalidColorSortError,
 )
+from terminaltexteffects.utils import geometry
 from terminaltexteffects.utils.geometry import Coord
 from terminaltexteffects.utils.graphics import Color
 
@@ -145,6 +147,26 @@ def test_terminal_init_ignore_terminal_dimensions() -> None:
     terminal._terminal_width = 4
 
 
+def test_terminal_preprocess_input_data_plain_text_matches_tokenized_input() -> None:
+    input_data = "ab \tc  \n\n d\t\n"
+    plain_terminal = Terminal(input_data="", config=TerminalConfig._build_config())
+    plain_terminal._next_character_id = 0
+    plain_lines = plain_terminal._preprocess_input_data(input_data)
+    # a reset sequence does not change the output but forces the tokenized path
+    tokenized_terminal = Terminal(input_data="", config=TerminalConfig._build_config())
+    tokenized_terminal._next_character_id = 0
+    tokenized_lines = tokenized_terminal._preprocess_input_data("\x1b[0m" + input_data)
+    assert [[character.input_symbol for character in line] for line in plain_lines] == [
+        ["a", "b", " ", " ", "c"],
+        [],
+        [" ", "d"],
+    ]
+    assert [[character.character_id for character in line] for line in plain_lines] == [
+        [character.character_id for character in line] for line in tokenized_lines
+    ]
+    assert plain_terminal._next_character_id == tokenized_terminal._next_character_id
+
+
 def test_terminal_preprocess_input_data_existing_color() -> None:
     # test ANSI color string
     # char pos - symbol - fg - bg
@@ -281,6 +303,136 @@ def test_terminal_get_piped_input_is_not_tty(monkeypatch: pytest.MonkeyPatch) ->
     assert Terminal.get_piped_input() == "test"
 
 
+def test_terminal_read_input_file_south_anchor_reads_last_lines(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("one\ntwo\nthree\nfour\n\n  \n", encoding="utf-8")
+    config = TerminalConfig._build_config()
+    config.canvas_height = 2
+    assert Terminal.read_input_file(input_file, config) == "three\nfour"
+
+
+def test_terminal_read_input_file_north_anchor_reads_first_lines(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"\r\none\r\n\r\n\r\nfour\r\nfive\r\n")
+    config = TerminalConfig._build_config()
+    config.canvas_height = 2
+    config.anchor_text = "n"
+    # leading blank lines are skipped, and the window runs through the next non-blank line and its carriage return
+    assert Terminal.read_input_file(input_file, config) == "one\n\n\nfour\n"
+
+
+@pytest.mark.parametrize(
+    ("input_bytes", "anchor_text", "wrap_text"),
+    [
+        (b"one\ntwo\nthree", "c", False),
+        (b"one\ntwo\nthree", "sw", True),
+        (b"one\n\x1b[31mtwo\nthree", "sw", False),
+        (b"one\ntwo\rthree\nfour", "sw", False),
+        (b"one", "sw", False),
+        (b"", "sw", False),
+    ],
+)
+def test_terminal_read_input_file_reads_whole_file(
+    tmp_path: Path,
+    input_bytes: bytes,
+    anchor_text: Literal["sw", "c"],
+    wrap_text: bool,  # noqa: FBT001
+) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(input_bytes)
+    config = TerminalConfig._build_config()
+    config.canvas_height = 1
+    config.anchor_text = anchor_text
+    config.wrap_text = wrap_text
+    assert Terminal.read_input_file(input_file, config) == input_file.read_text(encoding="utf-8")
+
+
+def test_terminal_read_input_file_window_places_characters_like_whole_file(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("".join(f"line {index}\n" for index in range(100)), encoding="utf-8")
+    config = TerminalConfig._build_config()
+    config.canvas_height = 5
+    config.canvas_width = 10
+    whole_terminal = Terminal(input_file.read_text(encoding="utf-8"), config)
+    window_terminal = Terminal(Terminal.read_input_file(input_file, config), config)
+    assert [(character.input_coord, character.input_symbol) for character in whole_terminal.get_characters()] == [
+        (character.input_coord, character.input_symbol) for character in window_terminal.get_characters()
+    ]
+
+
+@pytest.mark.parametrize("canvas_width", [80, -1])
+@pytest.mark.parametrize(
+    ("anchor_text", "wide_line_index"),
+    [("sw", 0), ("s", 0), ("se", 0), ("nw", 10), ("n", 10), ("ne", 10)],
+)
+def test_terminal_read_input_file_window_places_characters_like_whole_file_with_unequal_widths(
+    tmp_path: Path,
+    canvas_width: int,
+    anchor_text: Literal["sw", "s", "se", "nw", "n", "ne"],
+    wide_line_index: int,
+) -> None:
+    input_file = tmp_path / "input.txt"
+    lines = [f"line {index}" for index in range(11)]
+    lines[wide_line_index] = "w" * 60
+    input_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    config = TerminalConfig._build_config()
+    config.canvas_height = 3
+    config.canvas_width = canvas_width
+    config.anchor_text = anchor_text
+    config.ignore_terminal_dimensions = True
+    whole_terminal = Terminal(input_file.read_text(encoding="utf-8"), config)
+    window_terminal = Terminal(Terminal.read_input_file(input_file, config), config)
+    assert window_terminal.canvas.right == whole_terminal.canvas.right
+    assert [(character.input_coord, character.input_symbol) for character in whole_terminal.get_characters()] == [
+        (character.input_coord, character.input_symbol) for character in window_terminal.get_characters()
+    ]
+
+
+def test_terminal_read_input_file_window_keeps_widest_line(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("one\ntwo\nthree\n\tfour\n", encoding="utf-8")
+    config = TerminalConfig._build_config()
+    config.canvas_height = 2
+    config.anchor_text = "se"
+    assert Terminal.read_input_file(input_file, config) == "three\n\tfour"
+
+
+def test_terminal_clone_matches_new_terminal() -> None:
+    config = TerminalConfig._build_config()
+    config.existing_color_handling = "always"
+    input_data = "a\x1b[31mb c\x1b[0m\n  d"
+    prototype = Terminal(input_data, config)
+    clone = prototype._clone()
+    terminal = Terminal(input_data, config)
+    all_kinds = {"inner_fill_chars": True, "outer_fill_chars": True}
+
+    def character_state(character: EffectCharacter) -> tuple:
+        return (
+            character.character_id,
+            character.input_symbol,
+            character.input_coord,
+            character.motion.current_coord,
+            character.is_fill_character,
+            character.animation.input_fg_color,
+            character.animation.current_character_visual,
+            {direction: neighbor and neighbor.character_id for direction, neighbor in character.neighbors.items()},
+        )
+
+    assert [character_state(character) for character in clone.get_characters(**all_kinds)] == [
+        character_state(character) for character in terminal.get_characters(**all_kinds)
+    ]
+    assert clone._next_character_id == terminal._next_character_id
+    assert clone.get_input_colors() == terminal.get_input_colors()
+    assert clone.config is not prototype.config
+    prototype_characters = set(map(id, prototype.get_characters(**all_kinds)))
+    for character in clone.get_characters(**all_kinds):
+        assert id(character) not in prototype_characters
+        assert all(
+            neighbor is None or clone.get_character_by_input_coord(neighbor.input_coord) is neighbor
+            for neighbor in character.neighbors.values()
+        )
+
+
 def test_terminal_wrap_lines() -> None:
     config = TerminalConfig._build_config()
     terminal = Terminal(input_data="testtesttest", config=config)
@@ -533,6 +685,39 @@ def test_terminal_get_characters_grouped_invalid_grouping() -> None:
         terminal.get_characters_grouped(grouping="invalid")  # type: ignore[arg-type] # testing invalid group
 
 
+def test_terminal_get_characters_cached_views_are_independent_lists() -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcde\nfghij\nklmno", config=config)
+    characters = terminal.get_characters()
+    characters.pop()
+    assert len(terminal.get_characters()) == 15
+    rows = terminal.get_characters_grouped(CharacterGroup.ROW_TOP_TO_BOTTOM)
+    rows[0].clear()
+    rows.pop()
+    assert [len(row) for row in terminal.get_characters_grouped(CharacterGroup.ROW_TOP_TO_BOTTOM)] == [5, 5, 5]
+
+
+def test_terminal_get_characters_cache_invalidated_by_add_character() -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcde\nfghij\nklmno", config=config)
+    assert len(terminal.get_characters(added_chars=True)) == 15
+    assert len(terminal.get_characters_grouped(CharacterGroup.COLUMN_LEFT_TO_RIGHT, added_chars=True)) == 5
+    added = terminal.add_character("z", Coord(1, 1))
+    assert terminal.get_characters(added_chars=True, sort=CharacterSort.BOTTOM_TO_TOP_LEFT_TO_RIGHT)[1] is added
+    columns = terminal.get_characters_grouped(CharacterGroup.COLUMN_LEFT_TO_RIGHT, added_chars=True)
+    assert len(columns[0]) == 4
+    assert columns[0][1] is added
+
+
+def test_terminal_get_characters_outside_row_to_middle_interleaves() -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcde", config=config)
+    outside_to_middle = terminal.get_characters(sort=CharacterSort.OUTSIDE_ROW_TO_MIDDLE)
+    assert [character.input_symbol for character in outside_to_middle] == ["a", "e", "b", "d", "c"]
+    middle_to_outside = terminal.get_characters(sort=CharacterSort.MIDDLE_ROW_TO_OUTSIDE)
+    assert [character.input_symbol for character in middle_to_outside] == ["c", "d", "b", "e", "a"]
+
+
 def test_terminal_get_character_by_input_coord_valid() -> None:
     config = TerminalConfig._build_config()
     terminal = Terminal(input_data="abcd", config=config)
@@ -548,6 +733,79 @@ def test_terminal_get_character_by_input_coord_invalid() -> None:
     assert char is None
 
 
+@pytest.mark.parametrize("diameter", [0, 1, 3, 6, 11])
+@pytest.mark.parametrize("center", [Coord(1, 1), Coord(6, 3), Coord(12, 0), Coord(-4, 9)])
+def test_terminal_get_characters_in_circle_matches_coords_in_circle(center: Coord, diameter: int) -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcdefghij\nklmnopqrst\nuvwxyz\n0123456789", config=config)
+    expected = {
+        terminal.character_by_input_coord[coord]
+        for coord in geometry.find_coords_in_circle(center, diameter)
+        if coord in terminal.character_by_input_coord
+    }
+    characters = terminal.get_characters_in_circle(center, diameter)
+    assert len(characters) == len(expected)
+    assert set(characters) == expected
+
+
+@pytest.mark.parametrize("distance", [0, 1, 2, 5])
+def test_terminal_get_characters_in_rect_matches_coords_in_rect(distance: int) -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcdefghij\nklmnopqrst\nuvwxyz", config=config)
+    origin = Coord(3, 2)
+    expected = {
+        terminal.character_by_input_coord[coord]
+        for coord in geometry.find_coords_in_rect(origin, distance)
+        if coord in terminal.character_by_input_coord
+    }
+    assert set(terminal.get_characters_in_rect(origin, distance)) == expected
+
+
+def test_terminal_get_characters_in_circle_current_coords_follows_motion() -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcd", config=config)
+    char_a = terminal.get_character_by_input_coord(Coord(1, 1))
+    assert char_a is not None
+    assert char_a in terminal.get_characters_in_circle(Coord(1, 1), 1, current_coords=True)
+    char_a.motion.set_coordinate(Coord(40, 20))
+    assert char_a not in terminal.get_characters_in_circle(Coord(1, 1), 1, current_coords=True)
+    assert terminal.get_characters_in_circle(Coord(40, 20), 1, current_coords=True) == [char_a]
+    path = char_a.motion.new_path(speed=100)
+    path.new_waypoint(Coord(2, 1))
+    char_a.motion.activate_path(path)
+    char_a.tick()
+    assert char_a.motion.current_coord == Coord(2, 1)
+    assert char_a in terminal.get_characters_in_rect(Coord(2, 1), 1, current_coords=True)
+    # input coordinate queries are unaffected by movement
+    assert char_a in terminal.get_characters_in_circle(Coord(1, 1), 1)
+    added = terminal.add_character("x", Coord(30, 30))
+    assert terminal.get_characters_in_rect(Coord(30, 30), 1, current_coords=True) == [added]
+    assert added not in terminal.get_characters_in_rect(Coord(30, 30), 1)
+
+
+def test_terminal_get_characters_in_circle_current_coords_follows_event_and_direct_moves() -> None:
+    config = TerminalConfig._build_config()
+    terminal = Terminal(input_data="abcd", config=config)
+    char_a = terminal.get_character_by_input_coord(Coord(1, 1))
+    assert char_a is not None
+    assert char_a in terminal.get_characters_in_circle(Coord(1, 1), 1, current_coords=True)
+    scene = char_a.animation.new_scene(scene_id="scn")
+    scene.add_frame("a", 1)
+    char_a.event_handler.register_event(
+        EventHandler.Event.SCENE_COMPLETE,
+        scene,
+        EventHandler.Action.SET_COORDINATE,
+        Coord(15, 3),
+    )
+    char_a.animation.activate_scene(scene)
+    char_a.tick()
+    assert char_a.motion.current_coord == Coord(15, 3)
+    assert terminal.get_characters_in_circle(Coord(15, 3), 1, current_coords=True) == [char_a]
+    char_a.motion.current_coord = Coord(25, 5)
+    assert char_a not in terminal.get_characters_in_circle(Coord(15, 3), 1, current_coords=True)
+    assert terminal.get_characters_in_circle(Coord(25, 5), 1, current_coords=True) == [char_a]
+
+
 @pytest.mark.parametrize("visiblity", [True, False])
 def test_terminal_set_character_visibility(visiblity) -> None:
     config = TerminalConfig._build_config()
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import importlib
+import io
+import json
 import os
+import pkgutil
 import subprocess
 import sys
 from typing import TYPE_CHECKING
 
 import pytest
 
+import terminaltexteffects.effects
 from terminaltexteffects import __main__
 
 if TYPE_CHECKING:
@@ -94,6 +99,67 @@ def test_build_parser_registers_effects() -> None:
     assert "highlight" in help_output
 
 
+def test_builtin_effect_modules_match_effect_resources() -> None:
+    """Every built-in effect module should be listed under the command it registers."""
+    effect_modules = {}
+    for module_info in pkgutil.iter_modules(
+        terminaltexteffects.effects.__path__,
+        terminaltexteffects.effects.__name__ + ".",
+    ):
+        effect_cmd, _, _ = importlib.import_module(module_info.name).get_effect_resources()
+        effect_modules[effect_cmd] = module_info.name
+
+    assert __main__.BUILTIN_EFFECT_MODULES == effect_modules
+
+
+def test_build_parser_populates_only_named_effects() -> None:
+    """Only the named effects should have subparsers, while all effect names remain available."""
+    parser, effect_resource_map = __main__.build_parser(["wipe"])
+
+    assert "matrix" in effect_resource_map
+    assert parser.parse_args(["wipe", "--wipe-delay", "3"]).wipe_delay == 3
+    with pytest.raises(SystemExit):
+        parser.parse_args(["matrix"])
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["wipe", "--wipe-delay", "3"], ["wipe"]),
+        (["wipe", "-h"], ["wipe"]),
+        (["--frame-rate", "0", "--playlist", "print", "wipe"], []),
+        (["--random-effect"], []),
+        (["-h"], None),
+        (["--print-completion", "bash"], None),
+        (["wipx"], None),
+        (["--seed", "x", "wipe"], None),
+    ],
+)
+def test_select_effect_names(argv: list[str], expected: list[str] | None) -> None:
+    """The effect command should be found without populating the effect subparsers."""
+    assert __main__._select_effect_names(argv, __main__.BUILTIN_EFFECT_MODULES) == expected
+
+
+def test_main_imports_only_selected_effect() -> None:
+    """Running an effect should not import the other effect modules."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.argv = ['tte', '--frame-rate', '0', 'print']; "
+            "from terminaltexteffects.__main__ import main; main(); "
+            "print(sorted(m for m in sys.modules if m.startswith('terminaltexteffects.effects.')), file=sys.stderr)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        input="abc",
+        cwd=str(__main__.Path(__file__).resolve().parents[1]),
+    )
+
+    assert result.stderr.strip() == "['terminaltexteffects.effects.effect_print']"
+
+
 def test_main_print_completion_bash_outputs_script(
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
@@ -156,6 +222,85 @@ def test_main_unsupported_ansi_sequence_exits_with_error(
     assert "\\x1b[2J" in captured.err
 
 
+def test_main_stream_without_input_exits(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Streaming mode should report missing input when every line is blank."""
+    monkeypatch.setattr(__main__.sys, "argv", ["tte", "--stream", "print"])
+    monkeypatch.setattr(__main__.sys, "stdin", io.StringIO("\n \n"))
+
+    with pytest.raises(SystemExit) as exc_info:
+        __main__.main()
+
+    assert exc_info.value.code == 1
+    assert capsys.readouterr().out == "NO INPUT.\n"
+
+
+def test_main_stream_animates_piped_lines(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Streaming mode should animate the piped lines on one canvas."""
+    monkeypatch.setattr(
+        __main__.sys,
+        "argv",
+        ["tte", "--stream", "--frame-rate", "0", "--canvas-height", "2", "--no-color", "print"],
+    )
+    monkeypatch.setattr(__main__.sys, "stdin", io.StringIO("first\nsecond\n"))
+
+    __main__.main()
+
+    output = capsys.readouterr().out
+    assert "first" in output
+    assert "second" in output
+
+
+def test_main_stream_rejects_input_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Streaming reads from stdin, so it cannot be combined with an input file."""
+    monkeypatch.setattr(__main__.sys, "argv", ["tte", "--stream", "--input-file", "input.txt", "print"])
+
+    with pytest.raises(SystemExit, match="2"):
+        __main__.main()
+
+
+def test_main_playlist_unknown_effect_exits(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Unknown effects in a playlist should be reported before rendering."""
+    monkeypatch.setattr(__main__.sys, "argv", ["tte", "--playlist", "print", "nope"])
+    monkeypatch.setattr(__main__.Terminal, "get_piped_input", lambda: "abc")
+
+    with pytest.raises(SystemExit) as exc_info:
+        __main__.main()
+
+    assert exc_info.value.code == 1
+    assert "Unknown effects in playlist: nope" in capsys.readouterr().out
+
+
+def test_main_playlist_uses_effect_command_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only the playlist effect given as the effect command should use the command line options."""
+    monkeypatch.setattr(
+        __main__.sys,
+        "argv",
+        ["tte", "--playlist", "print", "wipe", "--frame-rate", "0", "wipe", "--wipe-delay", "3"],
+    )
+    monkeypatch.setattr(__main__.Terminal, "get_piped_input", lambda: "abc")
+    played_effects = []
+
+    class RecordingPlaylist(__main__.EffectPlaylist):
+        def __iter__(self):  # noqa: ANN204
+            played_effects.extend(self.effects)
+            return iter(())
+
+    monkeypatch.setattr(__main__, "EffectPlaylist", RecordingPlaylist)
+    __main__.main()
+
+    assert [type(effect).__name__ for effect in played_effects] == ["Print", "Wipe"]
+    assert played_effects[1].effect_config.wipe_delay == 3
+
+
 def test_build_parser_includes_plugin_effect_in_completion(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -165,6 +310,7 @@ def test_build_parser_includes_plugin_effect_in_completion(
     _write_demo_plugin(tmp_path)
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
     monkeypatch.setattr(__main__.sys, "argv", ["tte", "--print-completion", "bash"])
 
     __main__.main()
@@ -174,6 +320,60 @@ def test_build_parser_includes_plugin_effect_in_completion(
     assert "--plugin-speed" in output
 
 
+def test_plugin_index_skips_unchanged_plugins(tmp_path: Path) -> None:
+    """Indexed plugins should only be executed when their effect is selected."""
+    _write_demo_plugin(tmp_path)
+    plugins_dir = tmp_path / "terminaltexteffects" / "effects"
+    index_path = tmp_path / "cache" / "plugin_index.json"
+    plugin_file = plugins_dir / "plugin_demo.py"
+
+    effect_resource_map = __main__.LazyEffectResourceMap(plugins_dir, index_path)
+    assert "plugindemo" in effect_resource_map
+    plugin_index = json.loads(index_path.read_text(encoding="utf-8"))["plugins"]
+    assert plugin_index[str(plugin_file)]["effect"] == "plugindemo"
+
+    del sys.modules["plugin_demo"]
+    effect_resource_map = __main__.LazyEffectResourceMap(plugins_dir, index_path)
+    assert "plugindemo" in effect_resource_map
+    assert "plugin_demo" not in sys.modules
+
+    effect_class, _ = effect_resource_map["plugindemo"]
+    assert effect_class.__name__ == "PluginDemoEffect"
+    assert "plugin_demo" in sys.modules
+
+
+def test_plugin_index_rediscovers_changed_plugins(tmp_path: Path) -> None:
+    """A plugin should be executed again when its file has changed since it was indexed."""
+    _write_demo_plugin(tmp_path)
+    plugins_dir = tmp_path / "terminaltexteffects" / "effects"
+    index_path = tmp_path / "cache" / "plugin_index.json"
+    plugin_file = plugins_dir / "plugin_demo.py"
+    __main__.LazyEffectResourceMap(plugins_dir, index_path)
+
+    plugin_file.write_text(
+        plugin_file.read_text(encoding="utf-8").replace('"plugindemo", Plugin', '"plugindemo2", Plugin'),
+        encoding="utf-8",
+    )
+    effect_resource_map = __main__.LazyEffectResourceMap(plugins_dir, index_path)
+
+    assert "plugindemo2" in effect_resource_map
+    assert "plugindemo" not in effect_resource_map
+    plugin_index = json.loads(index_path.read_text(encoding="utf-8"))["plugins"]
+    assert plugin_index[str(plugin_file)]["effect"] == "plugindemo2"
+
+
+def test_plugin_index_ignores_unreadable_index(tmp_path: Path) -> None:
+    """A corrupt plugin index should be rebuilt from the plugin files."""
+    _write_demo_plugin(tmp_path)
+    plugins_dir = tmp_path / "terminaltexteffects" / "effects"
+    index_path = tmp_path / "cache" / "plugin_index.json"
+    index_path.parent.mkdir()
+    index_path.write_text("{not json", encoding="utf-8")
+
+    assert "plugindemo" in __main__.LazyEffectResourceMap(plugins_dir, index_path)
+    assert json.loads(index_path.read_text(encoding="utf-8"))["version"] == __main__._PLUGIN_INDEX_VERSION
+
+
 def test_bash_completion_registers_in_clean_shell() -> None:
     """The bash completion script should register both CLI entry points."""
     result = _run_bash(
@@ -259,7 +459,7 @@ COMP_CWORD=2
 _tte_completion
 printf 'options:%s\\n' "${COMPREPLY[*]}"
 """,
-        env={"XDG_CONFIG_HOME": str(tmp_path)},
+        env={"XDG_CONFIG_HOME": str(tmp_path), "XDG_CACHE_HOME": str(tmp_path / "cache")},
     )
 
     assert "effects:plugindemo" in result.stdout
@@ -0,0 +1,82 @@
+"""Unit tests for the caches module in terminaltexteffects.utils.
+
+Tests are marked with 'utils' and 'smoke' pytest markers to classify them appropriately.
+"""
+
+from collections.abc import Generator
+
+import pytest
+
+from terminaltexteffects.utils import caches, geometry
+from terminaltexteffects.utils.exceptions import CacheNotFoundError, CacheSizeError
+from terminaltexteffects.utils.geometry import Coord
+
+pytestmark = [pytest.mark.utils, pytest.mark.smoke]
+
+LINE_CACHE = "geometry.find_coord_on_line"
+
+
+@pytest.fixture
+def restore_line_cache_size() -> Generator[None, None, None]:
+    """Restore the size of the line cache after a test resizes it."""
+    maxsize = caches.stats(LINE_CACHE)[LINE_CACHE].maxsize
+    yield
+    caches.set_maxsize(maxsize, LINE_CACHE)
+
+
+def test_registered_cache_names() -> None:
+    """Test that the engine and utility caches are registered."""
+    names = caches.names()
+    assert LINE_CACHE in names
+    assert "graphics.shift_color_towards" in names
+    assert "animation._get_character_visual" in names
+
+
+def test_stats_count_hits_and_misses_across_clears() -> None:
+    """Test that hits and misses are counted and kept when a cache is cleared."""
+    caches.clear(LINE_CACHE)
+    start = caches.stats(LINE_CACHE)[LINE_CACHE]
+    geometry.find_coord_on_line(Coord(0, 0), Coord(10, 0), 0.5)
+    geometry.find_coord_on_line(Coord(0, 0), Coord(10, 0), 0.5)
+    caches.clear(LINE_CACHE)
+    geometry.find_coord_on_line(Coord(0, 0), Coord(10, 0), 0.5)
+    stats = caches.stats(LINE_CACHE)[LINE_CACHE]
+    assert (stats.hits - start.hits, stats.misses - start.misses) == (1, 2)
+    assert stats.currsize == 1
+
+
+def test_set_maxsize_counts_evictions(restore_line_cache_size: None) -> None:
+    """Test that resizing rebinds the module function and that evictions are counted."""
+    previous_function = geometry.find_coord_on_line
+    caches.set_maxsize(2, LINE_CACHE)
+    assert geometry.find_coord_on_line is not previous_function
+    start = caches.stats(LINE_CACHE)[LINE_CACHE]
+    for column in range(5):
+        geometry.find_coord_on_line(Coord(0, 0), Coord(column, 0), 0.5)
+    stats = caches.stats(LINE_CACHE)[LINE_CACHE]
+    assert stats.maxsize == 2
+    assert stats.currsize == 2
+    assert stats.evictions - start.evictions == 3
+
+
+def test_scope_clears_caches_on_exit() -> None:
+    """Test that a scope clears the named caches when it exits."""
+    with caches.scope(LINE_CACHE):
+        geometry.find_coord_on_line(Coord(0, 0), Coord(3, 0), 0.5)
+        assert caches.stats(LINE_CACHE)[LINE_CACHE].currsize
+    assert not caches.stats(LINE_CACHE)[LINE_CACHE].currsize
+
+
+def test_unknown_cache_name() -> None:
+    """Test that unknown cache names raise CacheNotFoundError."""
+    with pytest.raises(CacheNotFoundError):
+        caches.clear("geometry.unknown")
+    with pytest.raises(CacheNotFoundError), caches.scope("geometry.unknown"):
+        pass
+
+
+@pytest.mark.parametrize("maxsize", [-1, 1.5, True])
+def test_invalid_cache_size(maxsize: object) -> None:
+    """Test that invalid cache sizes raise CacheSizeError."""
+    with pytest.raises(CacheSizeError):
+        caches.set_maxsize(maxsize, LINE_CACHE)  # type: ignore[arg-type]
@@ -89,3 +89,11 @@ def test_bg_invalid_type() -> None:
         match=r"Color must be either hex string #000000 -> #FFFFFF or int xterm color code 0 <= n <= 255",
     ):
         colorterm.bg(3.14)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("color_code", [0, 127, 255, "#12ab34", "12AB34"])
+def test_color_sequences_are_reused(color_code: str | int) -> None:
+    """Returns the same sequence object for repeated color codes."""
+    assert colorterm.fg(color_code) is colorterm.fg(color_code)
+    assert colorterm.bg(color_code) is colorterm.bg(color_code)
+    assert colorterm.fg(color_code) != colorterm.bg(color_code)
@@ -1,5 +1,7 @@
 import pytest
 
+from terminaltexteffects.utils import easing
+
 pytestmark = [pytest.mark.utils, pytest.mark.smoke]
 
 
@@ -11,3 +13,14 @@ def test_ease_valid_progress(easing_function_1) -> None:
 @pytest.mark.parametrize("progress", [n / 10 for n in range(1, 11)])
 def test_ease_progress_ratios(progress, easing_function_1) -> None:
     easing_function_1(progress)  # should not raise an exception
+
+
+def test_sample_easing_matches_easing_function(easing_function_1) -> None:
+    samples = easing.sample_easing(easing_function_1, 7)
+    assert samples == tuple(easing_function_1(step / 7) for step in range(8))
+    assert easing.sample_easing(easing_function_1, 7) is samples
+
+
+def test_easing_tracker_uses_exact_values(easing_function_1) -> None:
+    tracker = easing.EasingTracker(easing_function_1, total_steps=9)
+    assert list(tracker) == [easing_function_1(step / 9) for step in range(1, 10)]
@@ -211,3 +211,51 @@ def test_find_normalized_distance_from_center_out_of_bounds() -> None:
     coord = geometry.Coord(14, 14)
     with pytest.raises(ValueError, match="Coordinate is not within the rectangle"):
         geometry.find_normalized_distance_from_center(4, 13, 4, 13, coord)
+
+
+@pytest.fixture(params=["python", "numpy"])
+def batch_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run the batch functions with the pure Python fallback and, if it is installed, with NumPy."""
+    if request.param == "python":
+        monkeypatch.setattr(geometry, "np", None)
+    else:
+        monkeypatch.setattr(geometry, "np", pytest.importorskip("numpy"))
+    return request.param
+
+
+@pytest.mark.parametrize("coords_limit", [0, 5, 40])
+@pytest.mark.parametrize("unique", [True, False])
+def test_find_coords_on_circles_matches_scalar(batch_backend: str, coords_limit: int, *, unique: bool) -> None:
+    """Test that find_coords_on_circles returns the coordinates found by find_coords_on_circle."""
+    circles = [(geometry.Coord(1, 2), 3), (geometry.Coord(7, 3), 3), (geometry.Coord(0, 0), 0), (geometry.Coord(5, 9), 8)]
+    result = geometry.find_coords_on_circles(circles, coords_limit, unique=unique)
+    assert result == [geometry.find_coords_on_circle(*circle, coords_limit, unique=unique) for circle in circles]
+
+
+def test_find_coords_on_circles_returns_new_lists(batch_backend: str) -> None:
+    """Test that the lists returned by find_coords_on_circles can be modified without affecting the scalar cache."""
+    circle = (geometry.Coord(4, 4), 2)
+    expected = list(geometry.find_coords_on_circle(*circle))
+    geometry.find_coords_on_circles([circle])[0].clear()
+    assert geometry.find_coords_on_circle(*circle) == expected
+
+
+def test_find_coords_on_bezier_curves_matches_scalar(batch_backend: str) -> None:
+    """Test that find_coords_on_bezier_curves returns the coordinates found by find_coord_on_bezier_curve."""
+    curves = [
+        (geometry.Coord(1, 1), (geometry.Coord(10, 20),), geometry.Coord(30, 2)),
+        (geometry.Coord(5, 15), (geometry.Coord(-3, 8), geometry.Coord(40, 1)), geometry.Coord(12, 12)),
+        (geometry.Coord(2, 2), (), geometry.Coord(9, 5)),
+        (geometry.Coord(50, 3), (geometry.Coord(20, 20),), geometry.Coord(0, 0)),
+    ]
+    t_values = [step / 37 for step in range(38)]
+    result = geometry.find_coords_on_bezier_curves(curves, t_values)
+    assert result == [[geometry.find_coord_on_bezier_curve(*curve, t) for t in t_values] for curve in curves]
+
+
+def test_find_coords_on_lines_matches_scalar(batch_backend: str) -> None:
+    """Test that find_coords_on_lines returns the coordinates found by find_coord_on_line."""
+    lines = [(geometry.Coord(1, 1), geometry.Coord(30, 2)), (geometry.Coord(40, 12), geometry.Coord(-5, 7))]
+    t_values = [step / 11 for step in range(12)]
+    result = geometry.find_coords_on_lines(lines, t_values)
+    assert result == [[geometry.find_coord_on_line(*line, t) for t in t_values] for line in lines]
@@ -1,6 +1,10 @@
+import copy
+import pickle
+
 import pytest
 
 from terminaltexteffects.engine.motion import Coord
+from terminaltexteffects.utils import geometry
 from terminaltexteffects.utils.graphics import Color, ColorPair, Gradient, random_color
 
 pytestmark = [pytest.mark.utils, pytest.mark.smoke]
@@ -221,6 +225,53 @@ def test_gradient_build_coordinate_color_mapping_max_less_than_min() -> None:
         g.build_coordinate_color_mapping(10, 1, 10, 1, Gradient.Direction.HORIZONTAL)
 
 
+@pytest.mark.parametrize("direction", list(Gradient.Direction))
+def test_gradient_coordinate_color_mapping_matches_fraction_lookup(direction) -> None:
+    g = Gradient(Color("#ff0000"), Color("#00ff00"), Color("#0000ff"), steps=(7, 4))
+    coordinate_map = g.build_coordinate_color_mapping(2, 9, 3, 20, direction)
+    assert len(coordinate_map) == len(list(coordinate_map)) == 8 * 18
+    for coord, color in coordinate_map.items():
+        if direction == Gradient.Direction.VERTICAL:
+            fraction = (coord.row - 1) / 8
+        elif direction == Gradient.Direction.HORIZONTAL:
+            fraction = (coord.column - 2) / 18
+        elif direction == Gradient.Direction.RADIAL:
+            fraction = geometry.find_normalized_distance_from_center(2, 9, 3, 20, coord)
+        else:
+            fraction = ((coord.row - 1) * 2 + (coord.column - 2)) / (8 * 2 + 18)
+        assert color == g.get_color_at_fraction(fraction)
+
+
+def test_gradient_coordinate_color_mapping_bounds() -> None:
+    g = Gradient(Color("#ffffff"), Color("#000000"), steps=4)
+    coordinate_map = g.build_coordinate_color_mapping(2, 5, 2, 5, Gradient.Direction.RADIAL)
+    assert Coord(1, 2) not in coordinate_map
+    assert (2, 2) not in coordinate_map
+    assert coordinate_map.get(Coord(6, 5)) is None
+    with pytest.raises(KeyError):
+        coordinate_map[Coord(2, 6)]
+
+
+def test_gradient_spectrum_is_shared_but_not_aliased() -> None:
+    first = Gradient(Color("#ffffff"), Color("#000000"), steps=5, loop=True)
+    second = Gradient(Color("#ffffff"), Color("#000000"), steps=5, loop=True)
+    assert first.spectrum == second.spectrum
+    assert first.spectrum is not second.spectrum
+    first.spectrum.pop()
+    assert len(second.spectrum) == 11
+
+
+def test_gradient_get_color_at_fraction_matches_linear_search() -> None:
+    g = Gradient(Color("#ffffff"), Color("#000000"), steps=(3, 7, 11))
+    for step in range(1001):
+        fraction = step / 1000
+        expected = next(
+            (g.spectrum[i - 1] for i in range(1, len(g.spectrum) + 1) if fraction <= i / len(g.spectrum)),
+            g.spectrum[-1],
+        )
+        assert g.get_color_at_fraction(fraction) is expected
+
+
 def test_color_invalid_xterm_color() -> None:
     with pytest.raises(ValueError):
         Color(256)
@@ -261,6 +312,43 @@ def test_color_is_iterable():
     assert list(Color("#ffffff")) == [Color("#ffffff")]
 
 
+def test_color_is_interned():
+    assert Color("#ff8000") is Color("ff8000")
+    assert Color(15) is Color(15)
+
+
+def test_color_packed_rgb():
+    assert Color("ff8001").packed_rgb == 0xFF8001
+    assert Color(15).packed_rgb == 0xFFFFFF
+
+
+def test_color_from_rgb_ints_matches_hex_color():
+    color = Color._from_rgb_ints(255, 128, 1)
+    assert color == Color("ff8001")
+    assert color.rgb_ints == (255, 128, 1)
+    assert color.packed_rgb == Color("ff8001").packed_rgb
+    assert color is Color._from_rgb_ints(255, 128, 1)
+
+
+def test_color_copy_and_pickle_return_interned_color():
+    color = Color("#123456")
+    assert copy.copy(color) is color
+    assert copy.deepcopy(color) is color
+    assert pickle.loads(pickle.dumps(color)) is color
+
+
+def test_color_unhashable_value():
+    with pytest.raises(ValueError):
+        Color(["ffffff"])  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("color_value", [1.0, 2.0, True])
+def test_color_non_int_xterm_value(color_value: object) -> None:
+    Color(1)
+    with pytest.raises(ValueError):
+        Color(color_value)  # type: ignore[arg-type]
+
+
 def test_color_repr():
     assert repr(Color("#ffffff")) == "Color('ffffff')"
 
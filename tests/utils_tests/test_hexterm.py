@@ -29,6 +29,33 @@ def test_hex_to_xterm() -> None:
     assert hexterm.hex_to_xterm("#ffffff") == 15
 
 
+def closest_xterm_color(hex_color: str) -> int:
+    """Return the closest xterm color by comparing every color, the lowest code winning ties."""
+    rgb = [int(hex_color[i : i + 2], 16) for i in range(0, 6, 2)]
+    distances = {
+        xterm_color: sum(abs(a - b) for a, b in zip(rgb, xterm_rgb))
+        for xterm_color, xterm_rgb in hexterm.xterm_to_rgb_map.items()
+    }
+    return min(distances, key=lambda xterm_color: (distances[xterm_color], xterm_color))
+
+
+def test_hex_to_xterm_matches_full_scan() -> None:
+    """Test that hex_to_xterm returns the closest of all 256 colors, including ties."""
+    values = range(0, 256, 51)
+    for red in values:
+        for green in values:
+            for blue in (*values, 0x5F, 0x73, 0x87, 0xAF, 0xD7, 0xEE):
+                hex_color = f"{red:02x}{green:02x}{blue:02x}"
+                assert hexterm.hex_to_xterm(hex_color) == closest_xterm_color(hex_color), hex_color
+
+
+def test_hex_to_xterm_exact_colors() -> None:
+    """Test that each xterm color maps to itself or to the lowest code with the same RGB value."""
+    for xterm_color, hex_color in hexterm.xterm_to_hex_map.items():
+        first_with_value = min(code for code, value in hexterm.xterm_to_hex_map.items() if value == hex_color)
+        assert hexterm.hex_to_xterm(hex_color) == first_with_value == closest_xterm_color(hex_color[1:]), xterm_color
+
+
 def test_hex_to_xterm_invalid_hex_chars() -> None:
     """Test hex_to_xterm with invalid hexadecimal characters."""
     with pytest.raises(ValueError):  # noqa: PT011